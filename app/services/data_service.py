@@ -30,6 +30,7 @@ from database.db_operations import (
     get_execution_logs,
     get_comments_by_post_id,
     get_post_by_post_id,
+    get_posting_time_heatmap,
     DatabaseOperationError
 )
 from database.db_connection import get_db_connection
@@ -228,7 +229,7 @@ def get_sentiment_data(start_date: Optional[str] = None,
             end_dt = datetime.now()
 
         # Get sentiment distribution
-        distribution_raw = get_sentiment_distribution(start_dt, end_dt)
+        distribution_raw = get_sentiment_distribution(start_dt, end_dt, from_summary=True)
         
         # Calculate total and percentages
         total = sum(distribution_raw.values())
@@ -375,11 +376,12 @@ def get_engagement_data(start_date: Optional[str] = None,
             if engagement > best_post_engagement:
                 best_post_engagement = engagement
             content = post.get('content', '') or ''
+            preview = content[:100] + '...' if len(content) > 100 else content
             top_posts.append({
                 'post_id': post.get('post_id'),
                 'author': post.get('author'),
-                'content': content[:100] + '...' if len(content) > 100 else content,
-                'caption': content[:100] + '...' if len(content) > 100 else content,
+                'content': preview,
+                'caption': preview,
                 'likes': post.get('likes', 0),
                 'comments': post.get('comments_count', 0),
                 'shares': post.get('shares', 0),
@@ -501,7 +503,7 @@ def get_content_data(start_date: Optional[str] = None,
         db = get_db_connection()
 
         # Get posts for hashtag extraction
-        posts = get_posts_by_date_range(start_dt, end_dt)
+        posts = get_posts_by_date_range(start_dt, end_dt, fetch_all=False)
         
         # Extract and count hashtags, and collect words for keywords
         all_hashtags = []
@@ -545,26 +547,14 @@ def get_content_data(start_date: Optional[str] = None,
         avg_caption_length = round(total_content_length / content_count) if content_count > 0 else 0
         
         # Get posting time heatmap (day of week and hour)
-        with db.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT 
-                    EXTRACT(DOW FROM timestamp) as day_of_week,
-                    EXTRACT(HOUR FROM timestamp) as hour,
-                    COUNT(*) as count
-                FROM posts
-                WHERE timestamp >= %s AND timestamp <= %s
-                GROUP BY day_of_week, hour
-                ORDER BY day_of_week, hour
-            """, (start_dt, end_dt))
-            results = cursor.fetchall()
-            posting_heatmap = [
-                {
-                    'day': int(row[0]),  # 0=Sunday, 6=Saturday
-                    'hour': int(row[1]),
-                    'count': row[2]
-                }
-                for row in results
-            ]
+        posting_heatmap = [
+            {
+                'day': cell['day_of_week'],  # 0=Sunday, 6=Saturday
+                'hour': cell['hour'],
+                'count': cell['count']
+            }
+            for cell in get_posting_time_heatmap(start_dt, end_dt, from_summary=True)
+        ]
         
         # Get content length distribution
         with db.get_cursor() as cursor:
@@ -771,12 +761,9 @@ def get_posts_paginated(page: int = 1,
         
         params.extend([per_page, offset])
         
-        with db.get_cursor() as cursor:
+        with db.get_cursor(dict_rows=True) as cursor:
             cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            columns = [desc[0] for desc in cursor.description]
-            posts = [dict(zip(columns, row)) for row in results]
+            posts = cursor.fetchall()
             
             # Convert datetime objects to ISO strings
             for post in posts:
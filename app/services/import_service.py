@@ -15,8 +15,12 @@ from typing import Dict, List, Optional, Tuple, Any, Union
 from database.db_operations import (
     insert_post, 
     insert_sentiment, 
-    insert_comment, 
+    insert_comments, 
+    insert_comments_bulk,
+    insert_posts_bulk,
+    insert_sentiments_bulk,
     clear_all_data,
+    refresh_daily_sentiment_summary,
     DatabaseOperationError
 )
 
@@ -72,9 +76,9 @@ def validate_post_data(post: Dict) -> Tuple[bool, Optional[str]]:
     return True, None
 
 
-def import_post_from_data(post_data: Dict, platform: str = 'instagram', is_json: bool = True) -> Optional[int]:
+def parse_post_data(post_data: Dict, platform: str = 'instagram', is_json: bool = True) -> Optional[Dict]:
     """
-    Import a single post from data dictionary.
+    Validate a post and convert it to the arguments of the insert functions.
     
     Args:
         post_data: Post dictionary
@@ -82,7 +86,9 @@ def import_post_from_data(post_data: Dict, platform: str = 'instagram', is_json:
         is_json: Whether the source was JSON (contains full structure)
         
     Returns:
-        Database ID of inserted/updated post, or None if validation failed
+        Dict with 'post' (insert_post arguments), 'sentiment' (insert_sentiment
+        arguments without post_id, or None) and 'comments' (insert_comments
+        rows), or None if validation failed
     """
     # Validate post data
     is_valid, error_msg = validate_post_data(post_data)
@@ -129,95 +135,201 @@ def import_post_from_data(post_data: Dict, platform: str = 'instagram', is_json:
             # Handle comma-separated string
             hashtags = [h.strip() for h in hashtags.split(',') if h.strip()]
         
-        # Insert post with upsert logic
-        db_id = insert_post(
-            post_id=post_id,
-            platform=platform,
-            author=author,
-            content=content,
-            timestamp=timestamp,
-            likes=likes,
-            comments_count=comments_count,
-            shares=shares,
-            url=url,
-            media_type=media_type,
-            hashtags=hashtags,
-            raw_data=post_data if is_json else None
-        )
-        
-        # Insert sentiment if available (JSON only usually)
+    except (KeyError, ValueError, TypeError) as e:
+        logger.warning(f"Error processing post {post_data.get('post_id', 'unknown')}: {e}")
+        return None
+    
+    post = {
+        'post_id': post_id,
+        'platform': platform,
+        'author': author,
+        'content': content,
+        'timestamp': timestamp,
+        'likes': likes,
+        'comments_count': comments_count,
+        'shares': shares,
+        'url': url,
+        'media_type': media_type,
+        'hashtags': hashtags,
+        'raw_data': post_data if is_json else None
+    }
+    
+    return {
+        'post': post,
+        'sentiment': _parse_sentiment(post_data, post_id),
+        'comments': _parse_comments(post_data, post_id, timestamp)
+    }
+
+
+def _parse_sentiment(post_data: Dict, post_id: str) -> Optional[Dict]:
+    """Extract insert_sentiment arguments (without post_id) from a post."""
+    try:
+        # Sentiment if available (JSON only usually)
         if 'sentiment' in post_data and post_data['sentiment'] and isinstance(post_data['sentiment'], dict):
             sentiment = post_data['sentiment']
-            try:
-                insert_sentiment(
-                    post_id=db_id,
-                    score=float(sentiment.get('score', 0.0)),
-                    label=sentiment.get('label', 'neutral'),
-                    confidence=float(sentiment.get('confidence', 0.0)),
-                    compound=float(sentiment.get('compound', 0.0)),
-                    positive=float(sentiment.get('positive', 0.0)),
-                    neutral=float(sentiment.get('neutral', 0.0)),
-                    negative=float(sentiment.get('negative', 0.0)),
-                    model=sentiment.get('model', 'vader')
-                )
-            except DatabaseOperationError as e:
-                logger.warning(f"Failed to insert sentiment for post {post_id}: {e}")
+            return {
+                'score': float(sentiment.get('score', 0.0)),
+                'label': sentiment.get('label', 'neutral'),
+                'confidence': float(sentiment.get('confidence', 0.0)),
+                'compound': float(sentiment.get('compound', 0.0)),
+                'positive': float(sentiment.get('positive', 0.0)),
+                'neutral': float(sentiment.get('neutral', 0.0)),
+                'negative': float(sentiment.get('negative', 0.0)),
+                'model': sentiment.get('model', 'vader')
+            }
         # Handle flattened sentiment from CSV if present
         elif 'sentiment_score' in post_data and 'sentiment_label' in post_data:
+            return {
+                'score': float(post_data.get('sentiment_score', 0.0)),
+                'label': post_data.get('sentiment_label', 'neutral'),
+                'confidence': 0.0, # Usually not in CSV export
+                'compound': float(post_data.get('sentiment_score', 0.0)), # Approx
+                'positive': 0.0,
+                'neutral': 0.0,
+                'negative': 0.0,
+                'model': 'unknown'
+            }
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Invalid sentiment for post {post_id}: {e}")
+    return None
+
+
+def _parse_comments(post_data: Dict, post_id: str, timestamp: datetime) -> List[Dict]:
+    """Extract insert_comments rows from a post, skipping malformed comments."""
+    comment_rows = []
+    if 'comments' in post_data and isinstance(post_data['comments'], list):
+        for comment in post_data['comments']:
+            if not isinstance(comment, dict):
+                continue
+                
             try:
-                insert_sentiment(
-                    post_id=db_id,
-                    score=float(post_data.get('sentiment_score', 0.0)),
-                    label=post_data.get('sentiment_label', 'neutral'),
-                    confidence=0.0, # Usually not in CSV export
-                    compound=float(post_data.get('sentiment_score', 0.0)), # Approx
-                    positive=0.0,
-                    neutral=0.0,
-                    negative=0.0,
-                    model='unknown'
-                )
-            except (ValueError, DatabaseOperationError) as e:
-                logger.warning(f"Failed to insert sentiment from CSV for post {post_id}: {e}")
-        
-        # Insert comments if available
-        if 'comments' in post_data and isinstance(post_data['comments'], list):
-            comments = post_data['comments']
-            for comment in comments:
-                if not isinstance(comment, dict):
+                c_author = str(comment.get('author') or comment.get('username') or comment.get('owner_username') or 'unknown')
+                c_content = str(comment.get('text') or comment.get('content') or '')
+                c_timestamp_str = comment.get('timestamp') or comment.get('created_at')
+                
+                if not c_content:
                     continue
                     
-                try:
-                    c_author = str(comment.get('author') or comment.get('username') or comment.get('owner_username') or 'unknown')
-                    c_content = str(comment.get('text') or comment.get('content') or '')
-                    c_timestamp_str = comment.get('timestamp') or comment.get('created_at')
+                if c_timestamp_str:
+                    c_timestamp = parse_timestamp(c_timestamp_str)
+                else:
+                    c_timestamp = timestamp # Fallback to post timestamp
                     
-                    if not c_content:
-                        continue
-                        
-                    if c_timestamp_str:
-                        c_timestamp = parse_timestamp(c_timestamp_str)
-                    else:
-                        c_timestamp = timestamp # Fallback to post timestamp
-                        
-                    insert_comment(
-                        post_id=db_id,
-                        author=c_author,
-                        content=c_content,
-                        timestamp=c_timestamp,
-                        sentiment=None,
-                        raw_data=comment
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to insert comment for post {post_id}: {e}")
+                comment_rows.append({
+                    'author': c_author,
+                    'content': c_content,
+                    'timestamp': c_timestamp,
+                    'sentiment': None,
+                    'raw_data': comment
+                })
+            except Exception as e:
+                logger.warning(f"Failed to parse comment for post {post_id}: {e}")
+    return comment_rows
+
+
+def _insert_post_children(db_id: int, parsed: Dict) -> None:
+    """Insert the sentiment and comments of a post one post at a time."""
+    post_id = parsed['post']['post_id']
+    
+    if parsed['sentiment']:
+        try:
+            insert_sentiment(post_id=db_id, **parsed['sentiment'])
+        except DatabaseOperationError as e:
+            logger.warning(f"Failed to insert sentiment for post {post_id}: {e}")
+    
+    try:
+        insert_comments(db_id, parsed['comments'])
+    except DatabaseOperationError as e:
+        logger.warning(f"Failed to insert comments for post {post_id}: {e}")
+
+
+def _import_parsed_post(parsed: Dict) -> Optional[int]:
+    """Insert one parsed post with its sentiment and comments."""
+    try:
+        # Insert post with upsert logic
+        db_id = insert_post(**parsed['post'])
+    except DatabaseOperationError as e:
+        logger.error(f"Database error importing post {parsed['post']['post_id']}: {e}")
+        return None
+    
+    _insert_post_children(db_id, parsed)
+    return db_id
 
-        return db_id
+
+def import_post_from_data(post_data: Dict, platform: str = 'instagram', is_json: bool = True) -> Optional[int]:
+    """
+    Import a single post from data dictionary.
+    
+    Args:
+        post_data: Post dictionary
+        platform: Social media platform
+        is_json: Whether the source was JSON (contains full structure)
         
-    except (KeyError, ValueError, TypeError) as e:
-        logger.warning(f"Error processing post {post_data.get('post_id', 'unknown')}: {e}")
+    Returns:
+        Database ID of inserted/updated post, or None if validation failed
+    """
+    parsed = parse_post_data(post_data, platform, is_json)
+    if parsed is None:
         return None
+    
+    return _import_parsed_post(parsed)
+
+
+def import_parsed_posts(parsed_posts: List[Dict]) -> int:
+    """
+    Insert a batch of posts returned by parse_post_data.
+    
+    Posts are upserted with insert_posts_bulk, which loads large batches
+    through a COPY staging table, and their sentiments and comments with
+    multi-row INSERTs. If the posts are rejected, posts are retried one at
+    a time so a single bad row only skips itself; likewise, rejected
+    sentiments and comments are retried per post.
+    
+    Args:
+        parsed_posts: Results of parse_post_data
+        
+    Returns:
+        Number of posts imported
+    """
+    try:
+        db_ids = insert_posts_bulk([parsed['post'] for parsed in parsed_posts])
     except DatabaseOperationError as e:
-        logger.error(f"Database error importing post {post_data.get('post_id', 'unknown')}: {e}")
-        return None
+        logger.warning(f"Batch import failed, importing posts one by one: {e}")
+        return sum(1 for parsed in parsed_posts if _import_parsed_post(parsed))
+    
+    sentiments = [
+        dict(parsed['sentiment'], post_id=db_id)
+        for db_id, parsed in zip(db_ids, parsed_posts)
+        if parsed['sentiment']
+    ]
+    try:
+        insert_sentiments_bulk(sentiments)
+    except DatabaseOperationError as e:
+        logger.warning(f"Batch sentiment insert failed, inserting sentiments one by one: {e}")
+        for sentiment in sentiments:
+            try:
+                insert_sentiment(**sentiment)
+            except DatabaseOperationError as e:
+                logger.warning(f"Failed to insert sentiment for post {sentiment['post_id']}: {e}")
+    
+    comments = [
+        dict(comment, post_id=db_id)
+        for db_id, parsed in zip(db_ids, parsed_posts)
+        for comment in parsed['comments']
+    ]
+    try:
+        insert_comments_bulk(comments)
+    except DatabaseOperationError as e:
+        logger.warning(f"Batch comment insert failed, inserting comments post by post: {e}")
+        for db_id, parsed in zip(db_ids, parsed_posts):
+            if not parsed['comments']:
+                continue
+            try:
+                insert_comments(db_id, parsed['comments'])
+            except DatabaseOperationError as e:
+                logger.warning(f"Failed to insert comments for post {parsed['post']['post_id']}: {e}")
+    
+    return len(db_ids)
 
 
 def process_import_file(file_storage, file_type: str, platform: str = 'instagram', clear_existing: bool = True) -> Dict[str, int]:
@@ -289,12 +401,21 @@ def process_import_file(file_storage, file_type: str, platform: str = 'instagram
             
         logger.info(f"Processing {len(posts)} posts from uploaded {file_type.upper()} file")
         
-        for post in posts:
-            db_id = import_post_from_data(post, platform, is_json)
-            if db_id:
-                inserted += 1
-            else:
-                skipped += 1
+        parsed_posts = [
+            parsed for parsed in (parse_post_data(post, platform, is_json) for post in posts)
+            if parsed is not None
+        ]
+        inserted = import_parsed_posts(parsed_posts)
+        skipped = len(posts) - inserted
+        
+        # Bring the dashboard summary up to date with this import. Without
+        # inserted posts there is nothing new to summarize; a clear_existing
+        # import has already had clear_all_data() refresh the views
+        if inserted:
+            try:
+                refresh_daily_sentiment_summary()
+            except DatabaseOperationError as e:
+                logger.warning(f"Daily sentiment summary not refreshed: {e}")
                 
         result = {
             'total': len(posts),
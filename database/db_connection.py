@@ -5,21 +5,26 @@ This module provides database connectivity with connection pooling,
 retry logic, and configuration management for PostgreSQL.
 
 Features:
-- Connection pooling using psycopg2
+- Connection pooling using psycopg2, with idle connections kept warm
 - Automatic retry logic for connection failures
 - Environment variable configuration
 - Connection health checks
 - Graceful connection cleanup
+- Batched statement pipelining for write-heavy workloads
 """
 
 import os
 import time
 import logging
+import threading
 from typing import Optional
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import psycopg2
 from psycopg2 import pool, OperationalError, DatabaseError
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+from psycopg2.extras import RealDictCursor
 from dotenv import load_dotenv
 
 
@@ -35,6 +40,83 @@ class DatabaseConnectionError(Exception):
     pass
 
 
+class StatementPipeline:
+    """
+    Queue of statements that are sent to the server in batches.
+    
+    psycopg2 has no libpq pipeline mode, so the closest equivalent is to
+    render each statement client-side with ``cursor.mogrify`` and send a
+    batch of them as a single ``;``-separated command. N queued statements
+    cost ``ceil(N / page_size)`` round trips instead of N. Results are not
+    available, so this is only suitable for writes whose return values are
+    not needed.
+    """
+    
+    def __init__(self, cursor, page_size: int = 100):
+        self._cursor = cursor
+        self._page_size = page_size
+        self._statements = []
+    
+    def execute(self, query, params=None):
+        """Queue a statement, flushing once a full page is buffered."""
+        self._statements.append(self._cursor.mogrify(query, params))
+        if len(self._statements) >= self._page_size:
+            self.flush()
+    
+    def flush(self):
+        """Send all queued statements in a single round trip."""
+        if self._statements:
+            self._cursor.execute(b";".join(self._statements))
+            self._statements = []
+
+
+class CachingConnectionPool(pool.ThreadedConnectionPool):
+    """
+    Thread-safe connection pool that keeps connections open across bursts.
+    
+    psycopg2's pools close every returned connection once ``minconn`` are
+    idle, so under a burst every checkout beyond that opens a new connection
+    (TCP, TLS and authentication) and closes it again right after. This pool
+    keeps all returned connections instead and only closes the ones above
+    ``min_idle`` after they have been idle for ``max_idle`` seconds.
+    """
+    
+    def __init__(self, minconn, maxconn, *args, max_idle: float = 300, **kwargs):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self.min_idle = minconn
+        self.max_idle = max_idle
+        self._idle_since = {}
+        
+        # The base class keeps a returned connection only while fewer than
+        # minconn are idle; raising it to maxconn makes it keep all of them
+        # and _close_expired trims the surplus instead
+        self.minconn = maxconn
+    
+    def _putconn(self, conn, key=None, close=False):
+        # Called with the pool lock held
+        super()._putconn(conn, key, close)
+        
+        if self._pool and self._pool[-1] is conn:
+            self._idle_since[id(conn)] = time.monotonic()
+        else:
+            self._idle_since.pop(id(conn), None)
+        self._close_expired()
+    
+    def _close_expired(self):
+        """Close connections above min_idle that have been idle too long."""
+        now = time.monotonic()
+        
+        # getconn pops from the end, so the longest idle connections are first
+        while len(self._pool) > self.min_idle:
+            conn = self._pool[0]
+            if now - self._idle_since.get(id(conn), now) < self.max_idle:
+                break
+            
+            self._pool.pop(0)
+            self._idle_since.pop(id(conn), None)
+            conn.close()
+
+
 class DatabaseConnection:
     """
     Database connection manager with connection pooling and retry logic.
@@ -64,7 +146,8 @@ class DatabaseConnection:
         """
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._pool: Optional[pool.SimpleConnectionPool] = None
+        self._pool: Optional[CachingConnectionPool] = None
+        self._close_lock = threading.Lock()
         
         # Load configuration from environment variables
         self._load_config(min_conn, max_conn)
@@ -117,9 +200,16 @@ class DatabaseConnection:
             )
         
         # Load pool configuration
-        self.min_conn = min_conn or int(os.getenv('DB_POOL_MIN_CONN', '2'))
-        self.max_conn = max_conn or int(os.getenv('DB_POOL_MAX_CONN', '10'))
+        # Explicit overrides win even when falsy (min_conn=0 must fail
+        # validation rather than silently fall back to the environment)
+        if min_conn is None:
+            min_conn = int(os.getenv('DB_POOL_MIN_CONN', '2'))
+        if max_conn is None:
+            max_conn = int(os.getenv('DB_POOL_MAX_CONN', '10'))
+        self.min_conn = min_conn
+        self.max_conn = max_conn
         self.connect_timeout = int(os.getenv('DB_CONNECT_TIMEOUT', '10'))
+        self.max_idle = float(os.getenv('DB_POOL_MAX_IDLE', '300'))
         
         # Validate pool configuration
         if self.min_conn < 1:
@@ -131,9 +221,8 @@ class DatabaseConnection:
             )
         
         logger.info(
-            f"Database configuration loaded: "
-            f"pool_size={self.min_conn}-{self.max_conn}, "
-            f"timeout={self.connect_timeout}s"
+            "Database configuration loaded: pool_size=%s-%s, timeout=%ss",
+            self.min_conn, self.max_conn, self.connect_timeout
         )
     
     def _initialize_pool(self):
@@ -148,14 +237,17 @@ class DatabaseConnection:
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.info(
-                    f"Initializing database connection pool "
-                    f"(attempt {attempt}/{self.max_retries})..."
+                    "Initializing database connection pool (attempt %s/%s)...",
+                    attempt, self.max_retries
                 )
                 
-                self._pool = pool.SimpleConnectionPool(
-                    self.min_conn,
+                # Only one connection is opened here; the rest of min_conn
+                # is opened concurrently by _prewarm_pool once it succeeds
+                self._pool = CachingConnectionPool(
+                    1,
                     self.max_conn,
                     self.database_url,
+                    max_idle=self.max_idle,
                     connect_timeout=self.connect_timeout
                 )
                 
@@ -165,24 +257,27 @@ class DatabaseConnection:
                     with conn.cursor() as cursor:
                         cursor.execute("SELECT 1")
                         cursor.fetchone()
-                    logger.info("Database connection pool initialized successfully")
-                    return
                 finally:
                     self._pool.putconn(conn)
+                
+                self._prewarm_pool()
+                logger.info("Database connection pool initialized successfully")
+                return
                     
             except (OperationalError, DatabaseError) as e:
                 last_error = e
                 logger.warning(
-                    f"Connection attempt {attempt}/{self.max_retries} failed: {e}"
+                    "Connection attempt %s/%s failed: %s",
+                    attempt, self.max_retries, e
                 )
                 
                 if attempt < self.max_retries:
-                    logger.info(f"Retrying in {self.retry_delay} seconds...")
+                    logger.info("Retrying in %s seconds...", self.retry_delay)
                     time.sleep(self.retry_delay)
                 else:
                     logger.error(
-                        f"Failed to initialize database connection pool after "
-                        f"{self.max_retries} attempts"
+                        "Failed to initialize database connection pool after "
+                        "%s attempts", self.max_retries
                     )
         
         # If we get here, all attempts failed
@@ -191,6 +286,30 @@ class DatabaseConnection:
             f"Last error: {last_error}"
         )
     
+    def _prewarm_pool(self):
+        """
+        Open the remaining min_conn - 1 connections concurrently.
+        
+        The pool constructor connects serially, so every handshake (TCP,
+        TLS, auth) would otherwise add up before the first workers get a
+        connection. psycopg2 releases the GIL while connecting, so opening
+        them from worker threads overlaps the handshakes. Failures are
+        logged and left for the pool to retry lazily on demand.
+        """
+        missing = self.min_conn - 1
+        if missing > 0:
+            with ThreadPoolExecutor(max_workers=missing) as executor:
+                futures = [executor.submit(self._pool._connect) for _ in range(missing)]
+            
+            for future in futures:
+                try:
+                    future.result()
+                except (OperationalError, DatabaseError) as e:
+                    logger.warning("Pool warm-up connection failed: %s", e)
+        
+        # Keep at least min_conn idle connections from now on
+        self._pool.min_idle = self.min_conn
+    
     def get_connection(self):
         """
         Get a connection from the pool.
@@ -206,12 +325,15 @@ class DatabaseConnection:
         
         try:
             conn = self._pool.getconn()
-            if conn is None:
-                raise DatabaseConnectionError("No connections available in pool")
-            return conn
-        except (OperationalError, DatabaseError) as e:
-            logger.error(f"Error getting connection from pool: {e}")
+        except (pool.PoolError, OperationalError) as e:
+            # PoolError: pool exhausted or closed; OperationalError: the pool
+            # had to open a fresh connection and the connect itself failed
+            logger.error("Error getting connection from pool: %s", e)
             raise DatabaseConnectionError(f"Failed to get connection: {e}")
+        
+        if conn is None:
+            raise DatabaseConnectionError("No connections available in pool")
+        return conn
     
     def return_connection(self, conn):
         """
@@ -226,11 +348,17 @@ class DatabaseConnection:
         
         try:
             self._pool.putconn(conn)
-        except Exception as e:
-            logger.error(f"Error returning connection to pool: {e}")
+        except pool.PoolError as e:
+            logger.error("Error returning connection to pool: %s", e)
     
     @contextmanager
-    def get_cursor(self, commit: bool = False):
+    def get_cursor(
+        self,
+        commit: bool = False,
+        dict_rows: bool = False,
+        name: Optional[str] = None,
+        async_commit: bool = False
+    ):
         """
         Context manager for getting a database cursor.
         
@@ -239,6 +367,15 @@ class DatabaseConnection:
         
         Args:
             commit: Whether to commit the transaction on success
+            dict_rows: Return rows as dictionaries keyed by column name
+                (RealDictCursor) instead of tuples
+            name: Open a named server-side cursor that fetches rows in
+                batches of cursor.itersize while it is iterated
+            async_commit: Run the transaction with synchronous_commit off,
+                so the commit returns without waiting for the WAL flush.
+                A server crash can lose the last moments of such commits
+                (never more than three times wal_writer_delay); use it
+                only for data that can be written again
             
         Yields:
             psycopg2.cursor: Database cursor
@@ -252,19 +389,25 @@ class DatabaseConnection:
         
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
+            cursor = conn.cursor(
+                name=name, cursor_factory=RealDictCursor if dict_rows else None
+            )
+            if async_commit:
+                cursor.execute("SET LOCAL synchronous_commit = off")
             yield cursor
             
             if commit:
                 conn.commit()
                 
         except Exception as e:
-            if conn:
+            # Nothing to undo if the failure happened before any statement
+            # opened a transaction; skip the extra server round trip
+            if conn and conn.info.transaction_status != TRANSACTION_STATUS_IDLE:
                 try:
                     conn.rollback()
                 except Exception as rollback_error:
-                    logger.error(f"Rollback failed: {rollback_error}")
-            logger.error(f"Database operation failed: {e}")
+                    logger.error("Rollback failed: %s", rollback_error)
+            logger.error("Database operation failed: %s", e)
             raise
             
         finally:
@@ -272,10 +415,34 @@ class DatabaseConnection:
                 try:
                     cursor.close()
                 except Exception as close_error:
-                    logger.error(f"Cursor close failed: {close_error}")
+                    logger.error("Cursor close failed: %s", close_error)
             if conn:
                 self.return_connection(conn)
     
+    @contextmanager
+    def pipeline(self, page_size: int = 100):
+        """
+        Context manager for sending many write statements in few round trips.
+        
+        All statements run on one connection in a single transaction that is
+        committed on successful exit and rolled back on error.
+        
+        Args:
+            page_size: Maximum number of statements sent per round trip
+            
+        Yields:
+            StatementPipeline: Object with an ``execute(query, params)`` method
+            
+        Example:
+            with db.pipeline() as pipe:
+                for row in rows:
+                    pipe.execute("INSERT INTO posts ...", row)
+        """
+        with self.get_cursor(commit=True) as cursor:
+            statements = StatementPipeline(cursor, page_size=page_size)
+            yield statements
+            statements.flush()
+    
     def test_connection(self) -> bool:
         """
         Test if database connection is working.
@@ -289,7 +456,7 @@ class DatabaseConnection:
                 result = cursor.fetchone()
                 return result is not None and result[0] == 1
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
     
     def close_all_connections(self):
@@ -298,14 +465,17 @@ class DatabaseConnection:
         
         This should be called when shutting down the application.
         """
-        if self._pool is not None:
+        # Swap the pool out under a lock so concurrent callers (e.g. a signal
+        # handler and atexit) cannot both reach closeall()
+        with self._close_lock:
+            pool_ref, self._pool = self._pool, None
+        
+        if pool_ref is not None:
             try:
-                self._pool.closeall()
+                pool_ref.closeall()
                 logger.info("All database connections closed")
             except Exception as e:
-                logger.error(f"Error closing connections: {e}")
-            finally:
-                self._pool = None
+                logger.error("Error closing connections: %s", e)
     
     def __enter__(self):
         """Context manager entry"""
@@ -319,6 +489,7 @@ class DatabaseConnection:
 
 # Global database connection instance
 _db_instance: Optional[DatabaseConnection] = None
+_db_instance_lock = threading.Lock()
 
 
 def get_db_connection() -> DatabaseConnection:
@@ -347,6 +518,23 @@ def close_db_connection():
     """
     global _db_instance
     
-    if _db_instance is not None:
-        _db_instance.close_all_connections()
+    with _db_instance_lock:
+        instance, _db_instance = _db_instance, None
+    
+    if instance is not None:
+        instance.close_all_connections()
+
+
+def forget_db_connection():
+    """
+    Drop the global database connection instance without closing it.
+    
+    For use in a forked child process, such as a Gunicorn worker: the
+    inherited connections share their sockets with the parent, so closing
+    them would end the parent's sessions. The next get_db_connection()
+    call in the child creates a pool of its own.
+    """
+    global _db_instance
+    
+    with _db_instance_lock:
         _db_instance = None
@@ -6,22 +6,48 @@ All operations use parameterized queries to prevent SQL injection.
 
 Features:
 - Insert operations with upsert logic for posts
+- Bulk insert operations for batches of posts and sentiments
 - Foreign key handling for sentiments
 - Query methods for reports and analytics
 - Parameterized queries for security
-- Transaction management
+- Transaction management, including sessions that group many writes
 - Error handling and logging
 
 Validates Requirements: 6.2, 6.3, 6.4, 6.5, 10.4
 """
 
+import base64
+import codecs
+import functools
+import inspect
+import io
+import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+import re
+import struct
+import threading
+import weakref
+from contextlib import contextmanager
+from time import monotonic
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 import psycopg2
 from psycopg2 import sql, DatabaseError, IntegrityError
-from psycopg2.extras import RealDictCursor
+from psycopg2.errors import UniqueViolation
+from psycopg2.extensions import encodings as pg_encodings
+from psycopg2.extras import RealDictCursor, execute_values
+
+try:
+    import orjson
+except ImportError:  # optional speedup for JSONB encoding
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # optional DFA regex engine for hashtag backfills
+    re2 = None
 
 from database.db_connection import get_db_connection, DatabaseConnectionError
 
@@ -30,11 +56,363 @@ from database.db_connection import get_db_connection, DatabaseConnectionError
 logger = logging.getLogger(__name__)
 
 
+# Batches at least this large are loaded with COPY instead of INSERT ... VALUES
+COPY_THRESHOLD = 1024
+
+# Rows fetched per round trip when streaming results with a server-side cursor
+STREAM_ITERSIZE = 2000
+
+# Materialized views summarizing posts for the dashboard, in refresh order
+SUMMARY_VIEWS = ('mv_daily_sentiment', 'mv_hourly_posts', 'mv_daily_hashtags')
+
+# Largest page search_posts returns; larger per_page values are clamped
+MAX_PER_PAGE = 200
+
+# search_posts sort columns that can be paged with a keyset cursor: they
+# are NOT NULL, so (column, id) row comparisons never skip rows, and
+# migration 012 indexes each of them together with id
+KEYSET_SORT_COLUMNS = ('timestamp', 'author')
+
+# search_posts sort keys and the ORDER BY expression of each; looking a
+# key up here also validates it, since only these are spliced into SQL
+_SORT_COLUMNS = {
+    'timestamp': 'p.timestamp',
+    'likes': 'p.likes',
+    'comments_count': 'p.comments_count',
+    'shares': 'p.shares',
+    'author': 'p.author',
+    'platform': 'p.platform',
+    'media_type': 'p.media_type',
+    'score': 's.score',
+    'label': 's.label',
+    'relevance': "ts_rank(p.search_tsv, plainto_tsquery('simple', %s))",
+}
+_SORT_ORDERS = frozenset({'ASC', 'DESC'})
+
+# Post columns returned by read functions; raw_data is left out because it
+# can be several KB per row and only get_post_raw() needs it
+POST_DISPLAY_COLS = (
+    "id, post_id, platform, author, content, timestamp, likes, "
+    "comments_count, shares, url, media_type, hashtags"
+)
+_POST_DISPLAY_COLS_P = ", ".join(f"p.{col}" for col in POST_DISPLAY_COLS.split(", "))
+
+# Post columns for dashboard listings, which never show the caption text
+POST_LIGHT_COLS = (
+    "id, post_id, platform, author, timestamp, likes, "
+    "comments_count, shares, url, media_type, hashtags"
+)
+
+# Sentiment columns returned next to the post by the posts/sentiments joins
+_SENTIMENT_JOIN_COLS = (
+    "s.score, s.label, s.confidence, s.compound, "
+    "s.positive, s.neutral, s.negative, s.model, s.processed_at"
+)
+
+# Joins the newest sentiment of each post as s, so posts re-analyzed more
+# than once still come back as one row each (migration 018 indexes it)
+_LATEST_SENTIMENT_JOIN = """
+    LEFT JOIN LATERAL (
+        SELECT score, label, confidence, compound, positive, neutral,
+               negative, model, processed_at
+        FROM sentiments
+        WHERE post_id = p.id
+        ORDER BY id DESC
+        LIMIT 1
+    ) s ON true
+"""
+
+# Columns returned for comments; raw_data is left out like it is for posts
+COMMENT_DISPLAY_COLS = "id, post_id, author, content, timestamp, sentiment, created_at"
+
+EXECUTION_LOG_COLS = (
+    "id, workflow_id, workflow_name, status, duration_ms, "
+    "error_message, error_stack, metadata, executed_at"
+)
+
+# Hashtags as migration 008 extracts them: '#' followed by word characters.
+# RE2's \w is ASCII-only, so its pattern spells out Unicode letters and
+# digits to match what Postgres and the re module treat as word characters
+if re2 is not None:
+    _HASHTAG_RE = re2.compile(r"#([\p{L}\p{N}_]+)")
+else:
+    _HASHTAG_RE = re.compile(r"#(\w+)")
+
+# Monthly range partitions are named <table>_YYYY_MM
+_MONTHLY_PARTITION_RE = re.compile(r"_(\d{4})_(\d{2})$")
+
+# Names of the statements already PREPAREd on each pooled connection
+_prepared_statements: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+
+# Result column names per SQL text, so tuple rows can be zipped into dicts
+# without rebuilding the name list from cursor.description on every call
+_column_names_cache: Dict[str, Tuple[str, ...]] = {}
+_COLUMN_NAMES_CACHE_SIZE = 256
+
+# Results of dashboard aggregates keyed by function and arguments, with
+# their expiry time (see _cached_aggregate). The dashboard serves requests
+# from several threads, so the cache is only touched under the lock.
+_aggregate_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+_aggregate_cache_lock = threading.Lock()
+_AGGREGATE_CACHE_SIZE = 256
+AGGREGATE_CACHE_TTL = 300
+
+
 class DatabaseOperationError(Exception):
     """Custom exception for database operation errors"""
     pass
 
 
+def _json_bytes(value: Any) -> bytes:
+    """
+    Serialize a value for a JSONB column as UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed, which encodes large scraper payloads
+    several times faster than the standard library; values orjson cannot
+    encode (such as integers beyond 64 bits) fall back to json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(value).encode("utf-8")
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value for a JSONB column."""
+    return _json_bytes(value).decode("utf-8")
+
+
+class _EncodedJson(psycopg2.extras.Json):
+    """
+    Json adapter that serializes its value once, when it is created.
+    
+    psycopg2's Json calls dumps every time the parameter is quoted, so a
+    parameter tuple that is executed more than once (a retried statement,
+    the UPDATE after a failed insert-first INSERT) encoded the payload
+    again each time.
+    """
+    
+    def __init__(self, adapted: Any):
+        super().__init__(adapted)
+        self._encoded = _json_dumps(adapted)
+    
+    def dumps(self, obj: Any) -> str:
+        return self._encoded
+
+
+def _jsonb(value: Optional[Dict]) -> Optional[psycopg2.extras.Json]:
+    """Adapt a dictionary for a JSONB parameter; empty values become NULL."""
+    return _EncodedJson(value) if value else None
+
+
+@contextmanager
+def db_session():
+    """
+    Context manager that checks out one pooled connection for a group of writes.
+    
+    Pass the yielded connection as ``conn`` to the insert functions so every
+    statement reuses the same connection and transaction. The transaction is
+    committed once when the block exits and rolled back if it raises. A failed
+    statement aborts the transaction, so the whole block should be treated
+    as one unit.
+    
+    Yields:
+        psycopg2 connection to pass as ``conn``
+        
+    Example:
+        with db_session() as conn:
+            for post in posts:
+                insert_post(**post, conn=conn)
+    """
+    db = get_db_connection()
+    conn = db.get_connection()
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        db.return_connection(conn)
+
+
+@contextmanager
+def _cursor_for(conn=None, async_commit: bool = False):
+    """
+    Yield a cursor on ``conn`` if given, otherwise on a pooled connection.
+    
+    Without ``conn`` the statement runs in its own transaction and is
+    committed on exit, asynchronously if async_commit is set; with ``conn``
+    committing, and how durably, is left to the caller (see db_session).
+    """
+    if conn is not None:
+        with conn.cursor() as cursor:
+            yield cursor
+    else:
+        with get_db_connection().get_cursor(
+            commit=True, async_commit=async_commit
+        ) as cursor:
+            yield cursor
+
+
+def _stream_rows(
+    query: str,
+    params: Tuple,
+    name: str,
+    itersize: int = STREAM_ITERSIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield result rows as dictionaries through a named server-side cursor.
+    
+    Postgres sends itersize rows per round trip, so only one batch is held
+    in memory at a time. The pooled connection stays checked out until the
+    generator is exhausted or closed.
+    
+    Raises:
+        DatabaseOperationError: If the query fails
+    """
+    db = get_db_connection()
+    
+    try:
+        with db.get_cursor(dict_rows=True, name=name) as cursor:
+            cursor.itersize = itersize
+            cursor.execute(query, params)
+            yield from cursor
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to stream rows for {name}: {e}")
+        raise DatabaseOperationError(f"Failed to stream rows: {e}")
+
+
+def _column_names(query: str, description) -> Tuple[str, ...]:
+    """
+    Return the result column names of a query, cached by its SQL text.
+    
+    A cached entry is rebuilt when the number of columns no longer matches,
+    which covers a query text that is reused after its result columns
+    changed.
+    
+    Args:
+        query: SQL text the cursor executed
+        description: The cursor's ``description`` after executing it
+        
+    Returns:
+        Tuple of column names in result order
+    """
+    columns = _column_names_cache.get(query)
+    if columns is None or len(columns) != len(description):
+        columns = tuple(desc[0] for desc in description)
+        if len(_column_names_cache) < _COLUMN_NAMES_CACHE_SIZE:
+            _column_names_cache[query] = columns
+    return columns
+
+
+def _summary_day(value: Any) -> Any:
+    """
+    Return a date bound as the day-grained summary views compare it.
+    
+    The views cast bounds with ::date; a naive datetime becomes its own
+    date, so every time of the same day gives the same result. Aware
+    datetimes are cast in the session time zone and are kept as they are.
+    """
+    if isinstance(value, datetime) and value.tzinfo is None:
+        return value.date()
+    return value
+
+
+def _ends_recently(end_date: Any) -> bool:
+    """Whether a date range is open or ends within AGGREGATE_CACHE_TTL of now."""
+    if end_date is None:
+        return True
+    if isinstance(end_date, datetime):
+        now = datetime.now(end_date.tzinfo)
+    elif isinstance(end_date, date):
+        end_date, now = datetime.combine(end_date, time.max), datetime.now()
+    else:
+        return True
+    return end_date > now - timedelta(seconds=AGGREGATE_CACHE_TTL)
+
+
+def _cached_aggregate(func):
+    """
+    Cache the list-of-dicts result of an aggregate query per arguments.
+    
+    Results are reused for AGGREGATE_CACHE_TTL seconds, the lifetime of the
+    dashboard's route cache, and dropped as soon as the summary views are
+    refreshed, which importers do after every batch. Callers get copies of
+    the rows, so modifying a result never changes the cached one. When the
+    cache is full and nothing in it has expired, new results are not
+    cached.
+    
+    With from_summary the bounds are keyed by day, since the views only
+    change on refresh. Otherwise results of ranges that are open or end
+    within the TTL of now are not cached: new posts still fall into them,
+    and a key ending at datetime.now() would never be looked up again.
+    """
+    signature = inspect.signature(func)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if arguments['from_summary']:
+            arguments = dict(
+                arguments,
+                start_date=_summary_day(arguments['start_date']),
+                end_date=_summary_day(arguments['end_date'])
+            )
+        elif _ends_recently(arguments['end_date']):
+            return func(*args, **kwargs)
+        
+        key = (func.__name__, tuple(arguments.items()))
+        now = monotonic()
+        
+        with _aggregate_cache_lock:
+            entry = _aggregate_cache.get(key)
+        if entry is None or entry[0] <= now:
+            rows = func(*args, **kwargs)
+            with _aggregate_cache_lock:
+                if len(_aggregate_cache) >= _AGGREGATE_CACHE_SIZE:
+                    for stale in [k for k, (expires, _) in _aggregate_cache.items() if expires <= now]:
+                        del _aggregate_cache[stale]
+                if len(_aggregate_cache) < _AGGREGATE_CACHE_SIZE:
+                    _aggregate_cache[key] = (now + AGGREGATE_CACHE_TTL, rows)
+        else:
+            rows = entry[1]
+        
+        return [dict(row) for row in rows]
+    
+    return wrapper
+
+
+def _execute_prepared(cursor, name: str, query: str, params: Tuple) -> None:
+    """
+    Execute a statement through a server-side prepared statement.
+    
+    The statement is PREPAREd the first time it is used on a connection and
+    EXECUTEd by name afterwards, so Postgres skips parsing and planning on
+    every later call. Prepared statements live as long as the server session
+    and survive rollbacks; connections are tracked weakly so the bookkeeping
+    disappears together with connections the pool discards.
+    
+    Args:
+        cursor: Cursor of the connection to run the statement on
+        name: Statement name, versioned so a changed query gets a new name
+        query: Statement text using $1..$n placeholders
+        params: Parameter values in placeholder order
+    """
+    prepared = _prepared_statements.setdefault(cursor.connection, set())
+    if name not in prepared:
+        cursor.execute(f"PREPARE {name} AS {query}")
+        prepared.add(name)
+    
+    placeholders = ", ".join(["%s"] * len(params))
+    cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+
+
 def insert_post(
     post_id: str,
     platform: str,
@@ -48,7 +426,9 @@ def insert_post(
     author_id: Optional[str] = None,
     media_type: Optional[str] = None,
     hashtags: Optional[List[str]] = None,
-    raw_data: Optional[Dict] = None
+    raw_data: Optional[Dict] = None,
+    conn=None,
+    insert_first: bool = False
 ) -> int:
     """
     Insert a post into the database with upsert logic.
@@ -56,6 +436,14 @@ def insert_post(
     If a post with the same post_id already exists, it will be updated
     with the new data (ON CONFLICT UPDATE).
     
+    With insert_first, a plain INSERT is tried instead and the existing row
+    is UPDATEd only if it raises a unique violation. That skips conflict
+    arbitration when post_ids are known to be new, such as a first load
+    into an empty database, but every conflict costs a failed INSERT (a dead
+    tuple and a burned id), so the default upsert is cheaper whenever
+    re-scraped posts are common. Inside a db_session() transaction the
+    INSERT is wrapped in a savepoint.
+    
     Args:
         post_id: Unique identifier for the post
         platform: Social media platform (instagram, twitter, facebook)
@@ -70,6 +458,8 @@ def insert_post(
         media_type: Type of media (image, video, text)
         hashtags: List of hashtags
         raw_data: Raw JSON data from scraper
+        conn: Connection from db_session() to run in; commits per call if omitted
+        insert_first: Try a plain INSERT and fall back to UPDATE on conflict
         
     Returns:
         int: Database ID of the inserted/updated post
@@ -79,15 +469,13 @@ def insert_post(
         
     Validates: Requirements 6.2, 6.5, 10.4
     """
-    db = get_db_connection()
-    
-    # Prepare the upsert query with parameterized values
+    # Upsert query, prepared once per connection
     query = """
         INSERT INTO posts (
             post_id, platform, author, author_id, content, timestamp,
             likes, comments_count, shares, url, media_type, hashtags, raw_data
         ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
         )
         ON CONFLICT (post_id) DO UPDATE SET
             platform = EXCLUDED.platform,
@@ -106,16 +494,51 @@ def insert_post(
         RETURNING id;
     """
     
+    # Statements of the insert_first strategy, using the same parameters
+    plain_insert_query = """
+        INSERT INTO posts (
+            post_id, platform, author, author_id, content, timestamp,
+            likes, comments_count, shares, url, media_type, hashtags, raw_data
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
+        )
+        RETURNING id;
+    """
+    update_query = """
+        UPDATE posts SET
+            platform = $2, author = $3, author_id = $4, content = $5,
+            timestamp = $6, likes = $7, comments_count = $8, shares = $9,
+            url = $10, media_type = $11, hashtags = $12, raw_data = $13,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE post_id = $1
+        RETURNING id;
+    """
+    
     try:
-        with db.get_cursor(commit=True) as cursor:
-            cursor.execute(
-                query,
-                (
-                    post_id, platform, author, author_id, content, timestamp,
-                    likes, comments_count, shares, url, media_type,
-                    hashtags, psycopg2.extras.Json(raw_data) if raw_data else None
-                )
-            )
+        params = (
+            post_id, platform, author, author_id, content, timestamp,
+            likes, comments_count, shares, url, media_type,
+            hashtags, _jsonb(raw_data)
+        )
+        
+        with _cursor_for(conn) as cursor:
+            if not insert_first:
+                _execute_prepared(cursor, "insert_post_v1", query, params)
+            else:
+                if conn is not None:
+                    cursor.execute("SAVEPOINT insert_post;")
+                try:
+                    _execute_prepared(
+                        cursor, "insert_post_plain_v1", plain_insert_query, params
+                    )
+                except UniqueViolation:
+                    # Only the failed INSERT is undone; PREPAREd statements
+                    # are not transactional and stay available
+                    if conn is not None:
+                        cursor.execute("ROLLBACK TO SAVEPOINT insert_post;")
+                    else:
+                        cursor.connection.rollback()
+                    _execute_prepared(cursor, "update_post_v1", update_query, params)
             result = cursor.fetchone()
             db_id = result[0]
             
@@ -139,7 +562,8 @@ def insert_sentiment(
     positive: float,
     neutral: float,
     negative: float,
-    model: str = "vader"
+    model: str = "vader",
+    conn=None
 ) -> int:
     """
     Insert sentiment analysis results for a post.
@@ -157,6 +581,7 @@ def insert_sentiment(
         neutral: Neutral sentiment component
         negative: Negative sentiment component
         model: Sentiment analysis model used (vader, textblob)
+        conn: Connection from db_session() to run in; commits per call if omitted
         
     Returns:
         int: Database ID of the inserted sentiment record
@@ -166,22 +591,22 @@ def insert_sentiment(
         
     Validates: Requirements 6.3, 10.4
     """
-    db = get_db_connection()
-    
-    # Parameterized query for sentiment insertion
+    # Parameterized query for sentiment insertion, prepared once per connection
     query = """
         INSERT INTO sentiments (
             post_id, score, label, confidence, compound,
             positive, neutral, negative, model
         ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s
+            $1, $2, $3, $4, $5, $6, $7, $8, $9
         )
         RETURNING id;
     """
     
     try:
-        with db.get_cursor(commit=True) as cursor:
-            cursor.execute(
+        with _cursor_for(conn) as cursor:
+            _execute_prepared(
+                cursor,
+                "insert_sentiment_v1",
                 query,
                 (
                     post_id, score, label, confidence, compound,
@@ -217,144 +642,801 @@ def insert_sentiment(
         raise DatabaseOperationError(f"Unexpected error: {e}")
 
 
-def insert_execution_log(
-    workflow_id: str,
-    workflow_name: str,
-    status: str,
-    duration_ms: int,
-    error_message: Optional[str] = None,
-    error_stack: Optional[str] = None,
-    metadata: Optional[Dict] = None
-) -> int:
+def insert_post_with_sentiment(
+    post_id: str,
+    platform: str,
+    author: str,
+    content: str,
+    timestamp: datetime,
+    sentiment: Dict[str, Any],
+    likes: int = 0,
+    comments_count: int = 0,
+    shares: int = 0,
+    url: Optional[str] = None,
+    author_id: Optional[str] = None,
+    media_type: Optional[str] = None,
+    hashtags: Optional[List[str]] = None,
+    raw_data: Optional[Dict] = None,
+    conn=None
+) -> Tuple[int, int]:
     """
-    Insert an execution log entry for workflow tracking.
+    Upsert a post and insert its sentiment in a single statement.
+    
+    The post upsert runs in a CTE whose RETURNING id feeds the sentiment
+    insert, so the pair costs one round trip instead of two and the caller
+    does not have to wait for the post id before sending the sentiment.
     
     Args:
-        workflow_id: Unique identifier for the workflow execution
-        workflow_name: Name of the workflow (e.g., "daily_scraping")
-        status: Execution status (success, failed, partial)
-        duration_ms: Execution duration in milliseconds
-        error_message: Error message if execution failed
-        error_stack: Stack trace if execution failed
-        metadata: Additional metadata as JSON
+        post_id: Unique identifier for the post
+        platform: Social media platform (instagram, twitter, facebook)
+        author: Author username
+        content: Post content/caption
+        timestamp: Post creation timestamp
+        sentiment: Sentiment values with the insert_sentiment keys (score,
+            label, confidence, compound, positive, neutral, negative and
+            optionally model)
+        likes: Number of likes
+        comments_count: Number of comments
+        shares: Number of shares
+        url: URL to the post
+        author_id: Author's unique ID
+        media_type: Type of media (image, video, text)
+        hashtags: List of hashtags
+        raw_data: Raw JSON data from scraper
+        conn: Connection from db_session() to run in; commits per call if omitted
         
     Returns:
-        int: Database ID of the inserted log entry
+        Tuple of (post database ID, sentiment database ID)
         
     Raises:
         DatabaseOperationError: If the operation fails
         
-    Validates: Requirements 6.4, 10.4
+    Validates: Requirements 6.2, 6.3, 6.5, 10.4
     """
-    db = get_db_connection()
-    
-    # Parameterized query for execution log insertion
     query = """
-        INSERT INTO execution_logs (
-            workflow_id, workflow_name, status, duration_ms,
-            error_message, error_stack, metadata
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s
+        WITH inserted AS (
+            INSERT INTO posts (
+                post_id, platform, author, author_id, content, timestamp,
+                likes, comments_count, shares, url, media_type, hashtags, raw_data
+            ) VALUES (
+                $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
+            )
+            ON CONFLICT (post_id) DO UPDATE SET
+                platform = EXCLUDED.platform,
+                author = EXCLUDED.author,
+                author_id = EXCLUDED.author_id,
+                content = EXCLUDED.content,
+                timestamp = EXCLUDED.timestamp,
+                likes = EXCLUDED.likes,
+                comments_count = EXCLUDED.comments_count,
+                shares = EXCLUDED.shares,
+                url = EXCLUDED.url,
+                media_type = EXCLUDED.media_type,
+                hashtags = EXCLUDED.hashtags,
+                raw_data = EXCLUDED.raw_data,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id
         )
-        RETURNING id;
+        INSERT INTO sentiments (
+            post_id, score, label, confidence, compound,
+            positive, neutral, negative, model
+        )
+        SELECT id, $14, $15, $16, $17, $18, $19, $20, $21
+        FROM inserted
+        RETURNING post_id, id;
     """
     
     try:
-        with db.get_cursor(commit=True) as cursor:
-            cursor.execute(
+        with _cursor_for(conn) as cursor:
+            _execute_prepared(
+                cursor,
+                "insert_post_with_sentiment_v1",
                 query,
                 (
-                    workflow_id, workflow_name, status, duration_ms,
-                    error_message, error_stack,
-                    psycopg2.extras.Json(metadata) if metadata else None
+                    post_id, platform, author, author_id, content, timestamp,
+                    likes, comments_count, shares, url, media_type,
+                    hashtags, _jsonb(raw_data),
+                    sentiment['score'], sentiment['label'],
+                    sentiment['confidence'], sentiment['compound'],
+                    sentiment['positive'], sentiment['neutral'],
+                    sentiment['negative'], sentiment.get('model', 'vader')
                 )
             )
-            result = cursor.fetchone()
-            log_id = result[0]
+            db_id, sentiment_id = cursor.fetchone()
             
             logger.info(
-                f"Execution log inserted: workflow={workflow_name}, "
-                f"status={status}, log_id={log_id}"
+                f"Post and sentiment stored: post_id={post_id}, db_id={db_id}, "
+                f"sentiment_id={sentiment_id}"
             )
-            return log_id
+            return db_id, sentiment_id
             
-    except DatabaseError as e:
-        logger.error(
-            f"Failed to insert execution log for workflow {workflow_name}: {e}"
-        )
-        raise DatabaseOperationError(f"Failed to insert execution log: {e}")
-        
+    except (DatabaseError, IntegrityError) as e:
+        logger.error(f"Failed to insert post {post_id} with sentiment: {e}")
+        raise DatabaseOperationError(f"Failed to insert post with sentiment: {e}")
     except Exception as e:
-        logger.error(
-            f"Unexpected error inserting execution log for workflow {workflow_name}: {e}"
-        )
+        logger.error(f"Unexpected error inserting post {post_id} with sentiment: {e}")
         raise DatabaseOperationError(f"Unexpected error: {e}")
 
 
-def get_post_by_post_id(post_id: str) -> Optional[Dict[str, Any]]:
+def insert_posts_with_sentiments_bulk(
+    posts: List[Dict[str, Any]],
+    page_size: int = 1000
+) -> List[Tuple[int, Optional[int]]]:
     """
-    Retrieve a post by its post_id.
+    Upsert many posts and insert their sentiments in one statement per page.
+    
+    Post and sentiment columns travel together in a single VALUES list that
+    is staged in a CTE; the post upsert reads from it and its RETURNING
+    rows are joined back to the staged sentiment columns by post_id. Posts
+    without a sentiment are upserted on their own. Duplicate post_ids are
+    collapsed to their last occurrence as in insert_posts_bulk.
     
     Args:
-        post_id: Unique post identifier
+        posts: List of post dictionaries using the insert_post keys, each
+            optionally carrying a 'sentiment' dictionary with the
+            insert_sentiment keys
+        page_size: Maximum number of rows per statement
         
     Returns:
-        Dict containing post data, or None if not found
+        List of (post database ID, sentiment database ID or None) tuples,
+        in the same order as posts
         
     Raises:
-        DatabaseOperationError: If the query fails
+        DatabaseOperationError: If the operation fails
+        
+    Validates: Requirements 6.2, 6.3, 6.5, 10.4
     """
+    if not posts:
+        return []
+    
     db = get_db_connection()
     
     query = """
-        SELECT * FROM posts WHERE post_id = %s;
+        WITH input (
+            post_id, platform, author, author_id, content, timestamp,
+            likes, comments_count, shares, url, media_type, hashtags, raw_data,
+            score, label, confidence, compound, positive, neutral, negative, model
+        ) AS (VALUES %s),
+        new_posts AS (
+            INSERT INTO posts (
+                post_id, platform, author, author_id, content, timestamp,
+                likes, comments_count, shares, url, media_type, hashtags, raw_data
+            )
+            SELECT
+                post_id, platform, author, author_id, content, timestamp,
+                likes, comments_count, shares, url, media_type, hashtags, raw_data
+            FROM input
+            ON CONFLICT (post_id) DO UPDATE SET
+                platform = EXCLUDED.platform,
+                author = EXCLUDED.author,
+                author_id = EXCLUDED.author_id,
+                content = EXCLUDED.content,
+                timestamp = EXCLUDED.timestamp,
+                likes = EXCLUDED.likes,
+                comments_count = EXCLUDED.comments_count,
+                shares = EXCLUDED.shares,
+                url = EXCLUDED.url,
+                media_type = EXCLUDED.media_type,
+                hashtags = EXCLUDED.hashtags,
+                raw_data = EXCLUDED.raw_data,
+                updated_at = CURRENT_TIMESTAMP
+            RETURNING id, post_id
+        ),
+        new_sentiments AS (
+            INSERT INTO sentiments (
+                post_id, score, label, confidence, compound,
+                positive, neutral, negative, model
+            )
+            SELECT
+                np.id, i.score, i.label, i.confidence, i.compound,
+                i.positive, i.neutral, i.negative, i.model
+            FROM new_posts np
+            JOIN input i USING (post_id)
+            WHERE i.label IS NOT NULL
+            RETURNING post_id, id
+        )
+        SELECT np.post_id, np.id, ns.id
+        FROM new_posts np
+        LEFT JOIN new_sentiments ns ON ns.post_id = np.id;
     """
+    # VALUES in a CTE does not take its column types from the target table
+    template = (
+        "(%s, %s, %s, %s, %s, %s::timestamp, %s::integer, %s::integer, "
+        "%s::integer, %s, %s, %s::text[], %s::jsonb, %s::numeric, %s, "
+        "%s::numeric, %s::numeric, %s::numeric, %s::numeric, %s::numeric, %s)"
+    )
     
     try:
-        with db.get_cursor() as cursor:
-            cursor.execute(query, (post_id,))
-            result = cursor.fetchone()
-            
-            if result is None:
-                return None
-            
-            # Convert tuple to dictionary
-            columns = [desc[0] for desc in cursor.description]
-            return dict(zip(columns, result))
-            
-    except DatabaseError as e:
-        logger.error(f"Failed to retrieve post {post_id}: {e}")
-        raise DatabaseOperationError(f"Failed to retrieve post: {e}")
+        sentiments = {post['post_id']: post.get('sentiment') for post in posts}
+        rows = []
+        for row in _dedupe_post_rows(posts):
+            sentiment = sentiments[row[0]] or {}
+            rows.append(
+                row[:-1]
+                + (_jsonb(row[-1]),)
+                + (
+                    sentiment.get('score'), sentiment.get('label'),
+                    sentiment.get('confidence'), sentiment.get('compound'),
+                    sentiment.get('positive'), sentiment.get('neutral'),
+                    sentiment.get('negative'),
+                    sentiment.get('model', 'vader') if sentiment else None
+                )
+            )
+        
+        with db.get_cursor(commit=True) as cursor:
+            results = execute_values(
+                cursor, query, rows, template=template,
+                page_size=page_size, fetch=True
+            )
+        
+        db_ids = {post_id: (db_id, sentiment_id) for post_id, db_id, sentiment_id in results}
+        logger.info(f"Bulk upserted {len(db_ids)} posts with sentiments")
+        return [db_ids[post['post_id']] for post in posts]
+        
+    except (DatabaseError, IntegrityError) as e:
+        logger.error(f"Failed to bulk insert {len(posts)} posts with sentiments: {e}")
+        raise DatabaseOperationError(f"Failed to insert posts with sentiments: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error bulk inserting posts with sentiments: {e}")
+        raise DatabaseOperationError(f"Unexpected error: {e}")
 
 
-def get_post_by_id(db_id: int) -> Optional[Dict[str, Any]]:
+def insert_posts_bulk(
+    posts: List[Dict[str, Any]],
+    page_size: int = 1000
+) -> List[int]:
     """
-    Retrieve a post by its database ID.
+    Insert many posts at once with upsert logic.
+    
+    Rows are sent as multi-row INSERT ... VALUES statements of up to
+    page_size rows each, so a batch costs one round trip and one
+    parse/plan per page instead of one per post. Batches of COPY_THRESHOLD
+    posts or more are handed to copy_posts instead. Duplicate post_ids
+    within the batch are collapsed to their last occurrence, because
+    ON CONFLICT DO UPDATE cannot update the same row twice in a statement.
+    The commit does not wait for the WAL flush (see get_cursor's
+    async_commit): scraped posts can be scraped again if a server crash
+    loses the last moments of them.
     
     Args:
-        db_id: Database ID of the post
+        posts: List of post dictionaries using the same keys as the
+            insert_post arguments (post_id, platform, author, content and
+            timestamp are required)
+        page_size: Maximum number of rows per INSERT statement
         
     Returns:
-        Dict containing post data, or None if not found
+        List of database IDs, in the same order as posts
         
     Raises:
-        DatabaseOperationError: If the query fails
+        DatabaseOperationError: If the operation fails
+        
+    Validates: Requirements 6.2, 6.5, 10.4
     """
+    if not posts:
+        return []
+    
     db = get_db_connection()
     
     query = """
-        SELECT * FROM posts WHERE id = %s;
-    """
-    
-    try:
-        with db.get_cursor() as cursor:
-            cursor.execute(query, (db_id,))
+        INSERT INTO posts (
+            post_id, platform, author, author_id, content, timestamp,
+            likes, comments_count, shares, url, media_type, hashtags, raw_data
+        ) VALUES %s
+        ON CONFLICT (post_id) DO UPDATE SET
+            platform = EXCLUDED.platform,
+            author = EXCLUDED.author,
+            author_id = EXCLUDED.author_id,
+            content = EXCLUDED.content,
+            timestamp = EXCLUDED.timestamp,
+            likes = EXCLUDED.likes,
+            comments_count = EXCLUDED.comments_count,
+            shares = EXCLUDED.shares,
+            url = EXCLUDED.url,
+            media_type = EXCLUDED.media_type,
+            hashtags = EXCLUDED.hashtags,
+            raw_data = EXCLUDED.raw_data,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING post_id, id;
+    """
+    
+    if len(posts) >= COPY_THRESHOLD:
+        return copy_posts(posts)
+    
+    try:
+        rows = [
+            row[:-1] + (_jsonb(row[-1]),)
+            for row in _dedupe_post_rows(posts)
+        ]
+        
+        with db.get_cursor(commit=True, async_commit=True) as cursor:
+            results = execute_values(
+                cursor, query, rows, page_size=page_size, fetch=True
+            )
+        
+        db_ids = dict(results)
+        logger.info(f"Bulk upserted {len(db_ids)} posts")
+        return [db_ids[post['post_id']] for post in posts]
+        
+    except (DatabaseError, IntegrityError) as e:
+        logger.error(f"Failed to bulk insert {len(posts)} posts: {e}")
+        raise DatabaseOperationError(f"Failed to insert posts: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error bulk inserting posts: {e}")
+        raise DatabaseOperationError(f"Unexpected error: {e}")
+
+
+def _dedupe_post_rows(posts: List[Dict[str, Any]]) -> List[Tuple]:
+    """
+    Convert post dictionaries to column tuples, keeping the last row per post_id.
+    
+    Tuples follow the posts column order used by the bulk paths; raw_data
+    is left as a plain dict so each path can encode it as it needs.
+    """
+    rows = {}
+    for post in posts:
+        rows[post['post_id']] = (
+            post['post_id'], post['platform'], post['author'],
+            post.get('author_id'), post['content'], post['timestamp'],
+            post.get('likes', 0), post.get('comments_count', 0),
+            post.get('shares', 0), post.get('url'), post.get('media_type'),
+            post.get('hashtags'), post.get('raw_data')
+        )
+    return list(rows.values())
+
+
+# Binary COPY framing and the wire formats of the posts column types
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+_PGCOPY_NULL = struct.pack("!i", -1)
+_PG_EPOCH = datetime(2000, 1, 1)
+_TEXT_OID = 25
+_JSONB_VERSION = b"\x01"
+_INT2 = struct.Struct("!h")
+_INT4 = struct.Struct("!i")
+_INT8 = struct.Struct("!q")
+_ARRAY_HEADER = struct.Struct("!iiiii")
+_COUNTERS = struct.Struct("!iiiiii")
+
+
+def _binary_field(data: Optional[bytes]) -> bytes:
+    """Frame one binary COPY field as a length prefix and its bytes."""
+    if data is None:
+        return _PGCOPY_NULL
+    return _INT4.pack(len(data)) + data
+
+
+def _binary_text(value: Any, encoding: str) -> Optional[bytes]:
+    """Encode a TEXT/VARCHAR value."""
+    return None if value is None else str(value).encode(encoding)
+
+
+def _binary_int4(value: Any) -> Optional[bytes]:
+    """Encode an INTEGER value."""
+    return None if value is None else _INT4.pack(int(value))
+
+
+def _session_timezone(conn) -> tzinfo:
+    """
+    Return the TimeZone setting of a connection as a tzinfo.
+    
+    The server reports the setting on every change, so no query is needed
+    unless it is not an IANA zone name (e.g. a POSIX offset string); then
+    the current UTC offset of the session is used.
+    """
+    name = conn.info.parameter_status("TimeZone")
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError, TypeError):
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT EXTRACT(timezone FROM now())::int;")
+            return timezone(timedelta(seconds=cursor.fetchone()[0]))
+
+
+def _binary_timestamp(value: Any, tz: Optional[tzinfo] = None) -> Optional[bytes]:
+    """
+    Encode a TIMESTAMP value as microseconds since 2000-01-01.
+    
+    Values with a UTC offset are converted to tz, the session time zone,
+    which is what the server does with the timestamptz literals psycopg2
+    sends for them in INSERTs; naive values are stored as they are.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    elif not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    
+    if value.tzinfo is not None and tz is not None:
+        value = value.astimezone(tz)
+    delta = value.replace(tzinfo=None) - _PG_EPOCH
+    micros = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    return _INT8.pack(micros)
+
+
+def _binary_text_array(values: Optional[List[str]], encoding: str) -> Optional[bytes]:
+    """Encode a one-dimensional TEXT[] value."""
+    if values is None:
+        return None
+    
+    items = [_binary_text(value, encoding) for value in values]
+    if not items:
+        return struct.pack("!iii", 0, 0, _TEXT_OID)
+    
+    has_null = any(item is None for item in items)
+    header = _ARRAY_HEADER.pack(1, int(has_null), _TEXT_OID, len(items), 1)
+    return header + b"".join(_binary_field(item) for item in items)
+
+
+def _binary_jsonb(value: Optional[Dict], encoding: str) -> Optional[bytes]:
+    """Encode a JSONB value; empty payloads become NULL like _jsonb()."""
+    if not value:
+        return None
+    if codecs.lookup(encoding).name == "utf-8":
+        return _JSONB_VERSION + _json_bytes(value)
+    return _JSONB_VERSION + _json_dumps(value).encode(encoding)
+
+
+def _posts_to_binary_copy_buffer(
+    rows: List[Tuple],
+    encoding: str = "utf-8",
+    tz: Optional[tzinfo] = None
+) -> io.BytesIO:
+    """
+    Serialize post rows to an in-memory buffer in COPY binary format.
+    
+    Numbers and timestamps travel in their fixed-size wire formats, so the
+    server stores them without parsing text, and nothing needs escaping.
+    """
+    buffer = io.BytesIO()
+    buffer.write(_PGCOPY_HEADER)
+    field_count = _INT2.pack(13)
+    write = buffer.write
+    
+    def text(value):
+        if value is None:
+            return _PGCOPY_NULL
+        data = str(value).encode(encoding)
+        return _INT4.pack(len(data)) + data
+    
+    for row in rows:
+        post_id, platform, author, author_id, content, timestamp, \
+            likes, comments_count, shares, url, media_type, hashtags, raw_data = row
+        
+        if None in (timestamp, likes, comments_count, shares):
+            numbers = b"".join(
+                _binary_field(field) for field in (
+                    _binary_timestamp(timestamp, tz), _binary_int4(likes),
+                    _binary_int4(comments_count), _binary_int4(shares)
+                )
+            )
+        else:
+            # Timestamp and the three counters share one fixed-size layout
+            numbers = _binary_field(_binary_timestamp(timestamp, tz)) + _COUNTERS.pack(
+                4, int(likes), 4, int(comments_count), 4, int(shares)
+            )
+        
+        write(field_count)
+        write(text(post_id) + text(platform) + text(author) + text(author_id)
+              + text(content) + numbers + text(url) + text(media_type)
+              + _binary_field(_binary_text_array(hashtags, encoding))
+              + _binary_field(_binary_jsonb(raw_data, encoding)))
+    
+    write(_PGCOPY_TRAILER)
+    buffer.seek(0)
+    return buffer
+
+
+def copy_posts(posts: List[Dict[str, Any]]) -> List[int]:
+    """
+    Insert or update a large batch of posts using COPY.
+    
+    Rows are streamed in COPY's binary format into a temporary staging
+    table and merged into posts with a single INSERT ... SELECT ... ON
+    CONFLICT statement, all in one transaction. The staging table is
+    created once per connection and emptied on commit, so repeated calls
+    do not create and drop catalog entries each time. This avoids per-row
+    statement parsing on both sides and is considerably faster than
+    multi-row INSERTs for backfills; insert_posts_bulk switches to it for
+    batches of COPY_THRESHOLD posts or more. Like insert_posts_bulk, it
+    commits without waiting for the WAL flush.
+    
+    Args:
+        posts: List of post dictionaries using the same keys as the
+            insert_post arguments
+        
+    Returns:
+        List of database IDs, in the same order as posts
+        
+    Raises:
+        DatabaseOperationError: If the operation fails
+        
+    Validates: Requirements 6.2, 6.5, 10.4
+    """
+    if not posts:
+        return []
+    
+    db = get_db_connection()
+    
+    columns = (
+        "post_id, platform, author, author_id, content, timestamp, "
+        "likes, comments_count, shares, url, media_type, hashtags, raw_data"
+    )
+    
+    # CREATE TABLE AS copies column types only: no serial default that
+    # would burn ids from posts_id_seq and no constraints on the stage
+    create_query = f"""
+        CREATE TEMP TABLE IF NOT EXISTS posts_staging ON COMMIT DELETE ROWS AS
+        SELECT {columns} FROM posts WITH NO DATA;
+    """
+    
+    merge_query = f"""
+        INSERT INTO posts ({columns})
+        SELECT {columns} FROM posts_staging
+        ON CONFLICT (post_id) DO UPDATE SET
+            platform = EXCLUDED.platform,
+            author = EXCLUDED.author,
+            author_id = EXCLUDED.author_id,
+            content = EXCLUDED.content,
+            timestamp = EXCLUDED.timestamp,
+            likes = EXCLUDED.likes,
+            comments_count = EXCLUDED.comments_count,
+            shares = EXCLUDED.shares,
+            url = EXCLUDED.url,
+            media_type = EXCLUDED.media_type,
+            hashtags = EXCLUDED.hashtags,
+            raw_data = EXCLUDED.raw_data,
+            updated_at = CURRENT_TIMESTAMP
+        RETURNING post_id, id;
+    """
+    
+    try:
+        rows = _dedupe_post_rows(posts)
+        
+        with db.get_cursor(commit=True, async_commit=True) as cursor:
+            # Text values are sent in the client encoding of the connection
+            # and timestamps converted to its time zone, as INSERTs would be
+            encoding = pg_encodings.get(cursor.connection.encoding, "utf-8")
+            buffer = _posts_to_binary_copy_buffer(
+                rows, encoding, _session_timezone(cursor.connection)
+            )
+            
+            cursor.execute(create_query)
+            cursor.copy_expert(
+                f"COPY posts_staging ({columns}) FROM STDIN WITH (FORMAT BINARY)",
+                buffer
+            )
+            cursor.execute(merge_query)
+            db_ids = dict(cursor.fetchall())
+        
+        logger.info(f"Copied {len(db_ids)} posts via staging table")
+        return [db_ids[post['post_id']] for post in posts]
+        
+    except (DatabaseError, IntegrityError) as e:
+        logger.error(f"Failed to copy {len(posts)} posts: {e}")
+        raise DatabaseOperationError(f"Failed to insert posts: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error copying posts: {e}")
+        raise DatabaseOperationError(f"Unexpected error: {e}")
+
+
+def insert_sentiments_bulk(
+    sentiments: List[Dict[str, Any]],
+    page_size: int = 1000
+) -> List[int]:
+    """
+    Insert many sentiment analysis results at once.
+    
+    Rows are sent as multi-row INSERT ... VALUES statements of up to
+    page_size rows each. All referenced posts must already exist.
+    
+    Args:
+        sentiments: List of sentiment dictionaries using the same keys as
+            the insert_sentiment arguments (model defaults to "vader")
+        page_size: Maximum number of rows per INSERT statement
+        
+    Returns:
+        List of database IDs of the inserted sentiment records, in order
+        
+    Raises:
+        DatabaseOperationError: If the operation fails or a post doesn't exist
+        
+    Validates: Requirements 6.3, 10.4
+    """
+    if not sentiments:
+        return []
+    
+    db = get_db_connection()
+    
+    query = """
+        INSERT INTO sentiments (
+            post_id, score, label, confidence, compound,
+            positive, neutral, negative, model
+        ) VALUES %s
+        RETURNING id;
+    """
+    
+    try:
+        rows = [
+            (
+                sentiment['post_id'], sentiment['score'], sentiment['label'],
+                sentiment['confidence'], sentiment['compound'],
+                sentiment['positive'], sentiment['neutral'],
+                sentiment['negative'], sentiment.get('model', 'vader')
+            )
+            for sentiment in sentiments
+        ]
+        
+        with db.get_cursor(commit=True) as cursor:
+            results = execute_values(
+                cursor, query, rows, page_size=page_size, fetch=True
+            )
+        
+        logger.info(f"Bulk inserted {len(results)} sentiments")
+        return [row[0] for row in results]
+        
+    except IntegrityError as e:
+        if "foreign key constraint" in str(e).lower():
+            logger.error("Bulk sentiment insert references a missing post")
+            raise DatabaseOperationError(
+                f"Cannot insert sentiments: referenced post does not exist: {e}"
+            )
+        logger.error(f"Integrity error bulk inserting sentiments: {e}")
+        raise DatabaseOperationError(f"Integrity error: {e}")
+        
+    except DatabaseError as e:
+        logger.error(f"Failed to bulk insert {len(sentiments)} sentiments: {e}")
+        raise DatabaseOperationError(f"Failed to insert sentiments: {e}")
+        
+    except Exception as e:
+        logger.error(f"Unexpected error bulk inserting sentiments: {e}")
+        raise DatabaseOperationError(f"Unexpected error: {e}")
+
+
+def insert_execution_log(
+    workflow_id: str,
+    workflow_name: str,
+    status: str,
+    duration_ms: int,
+    error_message: Optional[str] = None,
+    error_stack: Optional[str] = None,
+    metadata: Optional[Dict] = None
+) -> int:
+    """
+    Insert an execution log entry for workflow tracking.
+    
+    The insert commits asynchronously (get_cursor's async_commit) so it does
+    not wait for the WAL flush. Execution logs are diagnostic data: a server crash can
+    lose the last few hundred milliseconds of log rows, but never corrupts
+    them or any other table. Posts and sentiments keep the default.
+    
+    Args:
+        workflow_id: Unique identifier for the workflow execution
+        workflow_name: Name of the workflow (e.g., "daily_scraping")
+        status: Execution status (success, failed, partial)
+        duration_ms: Execution duration in milliseconds
+        error_message: Error message if execution failed
+        error_stack: Stack trace if execution failed
+        metadata: Additional metadata as JSON
+        
+    Returns:
+        int: Database ID of the inserted log entry
+        
+    Raises:
+        DatabaseOperationError: If the operation fails
+        
+    Validates: Requirements 6.4, 10.4
+    """
+    db = get_db_connection()
+    
+    # Parameterized query for execution log insertion, prepared once per connection
+    query = """
+        INSERT INTO execution_logs (
+            workflow_id, workflow_name, status, duration_ms,
+            error_message, error_stack, metadata
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7
+        )
+        RETURNING id;
+    """
+    
+    try:
+        with db.get_cursor(commit=True, async_commit=True) as cursor:
+            _execute_prepared(
+                cursor,
+                "insert_execution_log_v1",
+                query,
+                (
+                    workflow_id, workflow_name, status, duration_ms,
+                    error_message, error_stack,
+                    _jsonb(metadata)
+                )
+            )
+            result = cursor.fetchone()
+            log_id = result[0]
+            
+            logger.info(
+                f"Execution log inserted: workflow={workflow_name}, "
+                f"status={status}, log_id={log_id}"
+            )
+            return log_id
+            
+    except DatabaseError as e:
+        logger.error(
+            f"Failed to insert execution log for workflow {workflow_name}: {e}"
+        )
+        raise DatabaseOperationError(f"Failed to insert execution log: {e}")
+        
+    except Exception as e:
+        logger.error(
+            f"Unexpected error inserting execution log for workflow {workflow_name}: {e}"
+        )
+        raise DatabaseOperationError(f"Unexpected error: {e}")
+
+
+def get_post_by_post_id(post_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve a post by its post_id.
+    
+    Args:
+        post_id: Unique post identifier
+        
+    Returns:
+        Dict containing post data, or None if not found
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+    """
+    db = get_db_connection()
+    
+    query = f"""
+        SELECT {POST_DISPLAY_COLS} FROM posts WHERE post_id = $1
+    """
+    
+    try:
+        with db.get_cursor() as cursor:
+            _execute_prepared(cursor, "get_post_by_post_id_v1", query, (post_id,))
             result = cursor.fetchone()
             
             if result is None:
                 return None
             
-            columns = [desc[0] for desc in cursor.description]
+            columns = _column_names(query, cursor.description)
+            return dict(zip(columns, result))
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to retrieve post {post_id}: {e}")
+        raise DatabaseOperationError(f"Failed to retrieve post: {e}")
+
+
+def get_post_by_id(db_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve a post by its database ID.
+    
+    Args:
+        db_id: Database ID of the post
+        
+    Returns:
+        Dict containing post data, or None if not found
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+    """
+    db = get_db_connection()
+    
+    query = f"""
+        SELECT {POST_DISPLAY_COLS} FROM posts WHERE id = $1
+    """
+    
+    try:
+        with db.get_cursor() as cursor:
+            _execute_prepared(cursor, "get_post_by_id_v1", query, (db_id,))
+            result = cursor.fetchone()
+            
+            if result is None:
+                return None
+            
+            columns = _column_names(query, cursor.description)
             return dict(zip(columns, result))
             
     except DatabaseError as e:
@@ -362,11 +1444,47 @@ def get_post_by_id(db_id: int) -> Optional[Dict[str, Any]]:
         raise DatabaseOperationError(f"Failed to retrieve post: {e}")
 
 
+def get_post_raw(post_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve the raw scraper data stored for a post.
+    
+    Read functions leave raw_data out of their results; use this when the
+    full scraper payload of a single post is needed.
+    
+    Args:
+        post_id: Unique post identifier
+        
+    Returns:
+        The raw_data dictionary, or None if the post does not exist or
+        has no raw data
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+    """
+    db = get_db_connection()
+    
+    query = """
+        SELECT raw_data FROM posts WHERE post_id = $1
+    """
+    
+    try:
+        with db.get_cursor() as cursor:
+            _execute_prepared(cursor, "get_post_raw_v1", query, (post_id,))
+            result = cursor.fetchone()
+            
+            return result[0] if result else None
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to retrieve raw data for post {post_id}: {e}")
+        raise DatabaseOperationError(f"Failed to retrieve raw data: {e}")
+
+
 def get_posts_by_date_range(
     start_date: datetime,
     end_date: datetime,
-    platform: Optional[str] = None
-) -> List[Dict[str, Any]]:
+    platform: Optional[str] = None,
+    fetch_all: bool = True
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
     """
     Retrieve posts within a date range, optionally filtered by platform.
     
@@ -374,9 +1492,11 @@ def get_posts_by_date_range(
         start_date: Start of date range (inclusive)
         end_date: End of date range (inclusive)
         platform: Optional platform filter
+        fetch_all: Return a list; if False, return an iterator that streams
+            rows from a server-side cursor in batches of STREAM_ITERSIZE
         
     Returns:
-        List of post dictionaries
+        List of post dictionaries, or an iterator over them when fetch_all is False
         
     Raises:
         DatabaseOperationError: If the query fails
@@ -386,27 +1506,27 @@ def get_posts_by_date_range(
     db = get_db_connection()
     
     if platform:
-        query = """
-            SELECT * FROM posts
+        query = f"""
+            SELECT {POST_DISPLAY_COLS} FROM posts
             WHERE timestamp >= %s AND timestamp <= %s AND platform = %s
             ORDER BY timestamp DESC;
         """
         params = (start_date, end_date, platform)
     else:
-        query = """
-            SELECT * FROM posts
+        query = f"""
+            SELECT {POST_DISPLAY_COLS} FROM posts
             WHERE timestamp >= %s AND timestamp <= %s
             ORDER BY timestamp DESC;
         """
         params = (start_date, end_date)
     
+    if not fetch_all:
+        return _stream_rows(query, params, "posts_by_date_range_stream")
+    
     try:
-        with db.get_cursor() as cursor:
+        with db.get_cursor(dict_rows=True) as cursor:
             cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
+            return cursor.fetchall()
             
     except DatabaseError as e:
         logger.error(f"Failed to retrieve posts by date range: {e}")
@@ -429,18 +1549,22 @@ def get_sentiment_by_post_id(post_id: int) -> Optional[Dict[str, Any]]:
     db = get_db_connection()
     
     query = """
-        SELECT * FROM sentiments WHERE post_id = %s;
+        SELECT id, post_id, score, label, confidence, compound, positive,
+               neutral, negative, model, processed_at, created_at
+        FROM sentiments WHERE post_id = $1
     """
     
     try:
         with db.get_cursor() as cursor:
-            cursor.execute(query, (post_id,))
+            _execute_prepared(
+                cursor, "get_sentiment_by_post_id_v1", query, (post_id,)
+            )
             result = cursor.fetchone()
             
             if result is None:
                 return None
             
-            columns = [desc[0] for desc in cursor.description]
+            columns = _column_names(query, cursor.description)
             return dict(zip(columns, result))
             
     except DatabaseError as e:
@@ -448,13 +1572,56 @@ def get_sentiment_by_post_id(post_id: int) -> Optional[Dict[str, Any]]:
         raise DatabaseOperationError(f"Failed to retrieve sentiment: {e}")
 
 
+def get_sentiments_by_post_ids(post_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Retrieve sentiment data for several posts with one query.
+    
+    Use this instead of calling get_sentiment_by_post_id in a loop: the
+    ids are sent as one array and matched with a single index scan. A post
+    analysed more than once is returned with its latest sentiment.
+    
+    Args:
+        post_ids: Database IDs of the posts
+        
+    Returns:
+        Dict mapping post ID to its sentiment data; posts without a
+        sentiment are left out
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+    """
+    if not post_ids:
+        return {}
+    
+    db = get_db_connection()
+    
+    query = """
+        SELECT DISTINCT ON (post_id)
+               id, post_id, score, label, confidence, compound, positive,
+               neutral, negative, model, processed_at, created_at
+        FROM sentiments
+        WHERE post_id = ANY(%s::integer[])
+        ORDER BY post_id, id DESC;
+    """
+    
+    try:
+        with db.get_cursor(dict_rows=True) as cursor:
+            cursor.execute(query, (list(post_ids),))
+            return {row['post_id']: row for row in cursor.fetchall()}
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to retrieve sentiments for {len(post_ids)} posts: {e}")
+        raise DatabaseOperationError(f"Failed to retrieve sentiments: {e}")
+
+
 def insert_comment(
     post_id: int,
     author: str,
     content: str,
     timestamp: datetime,
     sentiment: Optional[str] = None,
-    raw_data: Optional[Dict] = None
+    raw_data: Optional[Dict] = None,
+    conn=None
 ) -> int:
     """
     Insert a comment into the database.
@@ -466,41 +1633,208 @@ def insert_comment(
         timestamp: Comment creation timestamp
         sentiment: Optional sentiment label
         raw_data: Raw JSON data
+        conn: Connection from db_session() to run in; commits per call if omitted
+        
+    Returns:
+        int: Database ID of the inserted comment
+        
+    Raises:
+        DatabaseOperationError: If the operation fails
+    """
+    query = """
+        INSERT INTO comments (
+            post_id, author, content, timestamp, sentiment, raw_data
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6
+        )
+        RETURNING id
+    """
+    
+    try:
+        with _cursor_for(conn) as cursor:
+            _execute_prepared(
+                cursor,
+                "insert_comment_v1",
+                query,
+                (
+                    post_id, author, content, timestamp, sentiment,
+                    _jsonb(raw_data)
+                )
+            )
+            result = cursor.fetchone()
+            return result[0]
+            
+    except (DatabaseError, IntegrityError) as e:
+        logger.error(f"Failed to insert comment for post {post_id}: {e}")
+        raise DatabaseOperationError(f"Failed to insert comment: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error inserting comment for post {post_id}: {e}")
+        raise DatabaseOperationError(f"Unexpected error: {e}")
+
+
+def insert_comments(post_id: int, comments: List[Dict[str, Any]], conn=None) -> int:
+    """
+    Insert all comments of a post in one transaction.
+    
+    Args:
+        post_id: Database ID of the parent post
+        comments: Comment dictionaries with author, content and timestamp,
+            plus optional sentiment and raw_data
+        conn: Connection from db_session() to run in; commits per call if omitted
+        
+    Returns:
+        int: Number of comments inserted
+        
+    Raises:
+        DatabaseOperationError: If the operation fails
+    """
+    return len(insert_comments_bulk(
+        [dict(comment, post_id=post_id) for comment in comments], conn=conn
+    ))
+
+
+def insert_comments_bulk(
+    comments: List[Dict[str, Any]],
+    page_size: int = 1000,
+    conn=None
+) -> List[int]:
+    """
+    Insert many comments at once, possibly for different posts.
+    
+    Rows are sent as multi-row INSERT ... VALUES statements of up to
+    page_size rows each, in a single transaction: either every comment is
+    stored or none are. All referenced posts must already exist. Without
+    conn, the commit does not wait for the WAL flush, as in insert_posts_bulk.
+    
+    Args:
+        comments: Comment dictionaries using the same keys as the
+            insert_comment arguments (post_id, author, content and
+            timestamp are required)
+        page_size: Maximum number of rows per INSERT statement
+        conn: Connection from db_session() to run in; commits per call if omitted
+        
+    Returns:
+        List of database IDs of the inserted comments, in order
+        
+    Raises:
+        DatabaseOperationError: If the operation fails or a post doesn't exist
+    """
+    if not comments:
+        return []
+    
+    query = """
+        INSERT INTO comments (
+            post_id, author, content, timestamp, sentiment, raw_data
+        ) VALUES %s
+        RETURNING id;
+    """
+    
+    try:
+        rows = [
+            (
+                comment['post_id'], comment['author'], comment['content'],
+                comment['timestamp'], comment.get('sentiment'),
+                _jsonb(comment.get('raw_data'))
+            )
+            for comment in comments
+        ]
+        
+        with _cursor_for(conn, async_commit=True) as cursor:
+            results = execute_values(
+                cursor, query, rows, page_size=page_size, fetch=True
+            )
+        
+        logger.debug(f"Bulk inserted {len(results)} comments")
+        return [row[0] for row in results]
+        
+    except (DatabaseError, IntegrityError) as e:
+        logger.error(f"Failed to bulk insert {len(comments)} comments: {e}")
+        raise DatabaseOperationError(f"Failed to insert comments: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error bulk inserting comments: {e}")
+        raise DatabaseOperationError(f"Unexpected error: {e}")
+
+
+def _isoformat(value: Any) -> Any:
+    """Render datetimes as ISO 8601 text for JSON payloads."""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def ingest_post_bundle(
+    post: Dict[str, Any],
+    sentiment: Optional[Dict[str, Any]] = None,
+    comments: Optional[List[Dict[str, Any]]] = None,
+    conn=None
+) -> Tuple[int, Optional[int], List[int]]:
+    """
+    Store a post together with its sentiment and comments as one unit.
+    
+    The rows are sent as JSON to the ingest_post_bundle() database function
+    (migration 007), which upserts the post and inserts its sentiment and
+    comments on the server. A scraped post therefore costs one round trip
+    no matter how many comments it has, and the post id never travels back
+    to the client between the inserts. Everything runs in one statement:
+    if any part fails, none of it is stored.
+    
+    Args:
+        post: Post values with the insert_post keyword arguments
+        sentiment: Optional sentiment values with the insert_sentiment keys
+            other than post_id
+        comments: Optional comment dictionaries with author, content and
+            timestamp, plus optional sentiment and raw_data
+        conn: Connection from db_session() to run in; commits per call if omitted
         
     Returns:
-        int: Database ID of the inserted comment
+        Tuple of (post database ID, sentiment database ID or None,
+        comment database IDs)
         
     Raises:
         DatabaseOperationError: If the operation fails
+        
+    Validates: Requirements 6.2, 6.3, 6.5
     """
-    db = get_db_connection()
-    
     query = """
-        INSERT INTO comments (
-            post_id, author, content, timestamp, sentiment, raw_data
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s
-        )
-        RETURNING id;
+        SELECT post_db_id, sentiment_id, comment_ids
+        FROM ingest_post_bundle($1, $2, $3)
     """
     
+    post_row = {
+        'likes': 0, 'comments_count': 0, 'shares': 0,
+        **post,
+        'timestamp': _isoformat(post['timestamp']),
+        'raw_data': post.get('raw_data') or None
+    }
+    sentiment_row = {'model': 'vader', **sentiment} if sentiment else None
+    comment_rows = [
+        dict(
+            comment,
+            timestamp=_isoformat(comment['timestamp']),
+            raw_data=comment.get('raw_data') or None
+        )
+        for comment in comments or []
+    ]
+    
     try:
-        with db.get_cursor(commit=True) as cursor:
-            cursor.execute(
+        with _cursor_for(conn) as cursor:
+            _execute_prepared(
+                cursor,
+                "ingest_post_bundle_v1",
                 query,
-                (
-                    post_id, author, content, timestamp, sentiment,
-                    psycopg2.extras.Json(raw_data) if raw_data else None
-                )
+                (_jsonb(post_row), _jsonb(sentiment_row), _jsonb(comment_rows))
             )
-            result = cursor.fetchone()
-            return result[0]
-            
+            db_id, sentiment_id, comment_ids = cursor.fetchone()
+        
+        logger.info(
+            f"Post bundle stored: post_id={post['post_id']}, db_id={db_id}, "
+            f"comments={len(comment_ids)}"
+        )
+        return db_id, sentiment_id, comment_ids
+        
     except (DatabaseError, IntegrityError) as e:
-        logger.error(f"Failed to insert comment for post {post_id}: {e}")
-        raise DatabaseOperationError(f"Failed to insert comment: {e}")
+        logger.error(f"Failed to ingest post {post.get('post_id')}: {e}")
+        raise DatabaseOperationError(f"Failed to ingest post: {e}")
     except Exception as e:
-        logger.error(f"Unexpected error inserting comment for post {post_id}: {e}")
+        logger.error(f"Unexpected error ingesting post {post.get('post_id')}: {e}")
         raise DatabaseOperationError(f"Unexpected error: {e}")
 
 
@@ -516,19 +1850,16 @@ def get_comments_by_post_id(post_id: int) -> List[Dict[str, Any]]:
     """
     db = get_db_connection()
     
-    query = """
-        SELECT * FROM comments 
+    query = f"""
+        SELECT {COMMENT_DISPLAY_COLS} FROM comments 
         WHERE post_id = %s 
         ORDER BY timestamp ASC;
     """
     
     try:
-        with db.get_cursor() as cursor:
+        with db.get_cursor(dict_rows=True) as cursor:
             cursor.execute(query, (post_id,))
-            results = cursor.fetchall()
-            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
+            return cursor.fetchall()
             
     except DatabaseError as e:
         logger.error(f"Failed to retrieve comments for post {post_id}: {e}")
@@ -536,11 +1867,49 @@ def get_comments_by_post_id(post_id: int) -> List[Dict[str, Any]]:
 
 
 
+def _get_posts_with_sentiment(
+    post_cols: str,
+    start_date: datetime,
+    end_date: datetime,
+    platform: Optional[str],
+    fetch_all: bool,
+    stream_name: str
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """Run the posts/sentiments join for the get_posts_with_sentiment variants."""
+    db = get_db_connection()
+    
+    post_cols_p = ", ".join(f"p.{col}" for col in post_cols.split(", "))
+    platform_filter = "AND p.platform = %s" if platform else ""
+    query = f"""
+        SELECT 
+            {post_cols_p},
+            {_SENTIMENT_JOIN_COLS}
+        FROM posts p
+        LEFT JOIN sentiments s ON p.id = s.post_id
+        WHERE p.timestamp >= %s AND p.timestamp <= %s {platform_filter}
+        ORDER BY p.timestamp DESC;
+    """
+    params = (start_date, end_date, platform) if platform else (start_date, end_date)
+    
+    if not fetch_all:
+        return _stream_rows(query, params, stream_name)
+    
+    try:
+        with db.get_cursor(dict_rows=True) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to retrieve posts with sentiment: {e}")
+        raise DatabaseOperationError(f"Failed to retrieve posts with sentiment: {e}")
+
+
 def get_posts_with_sentiment(
     start_date: datetime,
     end_date: datetime,
-    platform: Optional[str] = None
-) -> List[Dict[str, Any]]:
+    platform: Optional[str] = None,
+    fetch_all: bool = True
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
     """
     Retrieve posts with their sentiment data for a date range.
     
@@ -550,61 +1919,96 @@ def get_posts_with_sentiment(
         start_date: Start of date range (inclusive)
         end_date: End of date range (inclusive)
         platform: Optional platform filter
+        fetch_all: Return a list; if False, return an iterator that streams
+            rows from a server-side cursor in batches of STREAM_ITERSIZE
         
     Returns:
-        List of dictionaries containing post and sentiment data
+        List of dictionaries containing post and sentiment data, or an iterator over them when fetch_all is False
         
     Raises:
         DatabaseOperationError: If the query fails
         
     Validates: Requirements 6.2, 6.3
     """
-    db = get_db_connection()
+    return _get_posts_with_sentiment(
+        POST_DISPLAY_COLS, start_date, end_date, platform, fetch_all,
+        "posts_with_sentiment_stream"
+    )
+
+
+def get_posts_with_sentiment_light(
+    start_date: datetime,
+    end_date: datetime,
+    platform: Optional[str] = None,
+    fetch_all: bool = True
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Retrieve posts with their sentiment data for dashboards.
     
-    if platform:
-        query = """
-            SELECT 
-                p.*,
-                s.score, s.label, s.confidence, s.compound,
-                s.positive, s.neutral, s.negative, s.model,
-                s.processed_at
-            FROM posts p
-            LEFT JOIN sentiments s ON p.id = s.post_id
-            WHERE p.timestamp >= %s AND p.timestamp <= %s AND p.platform = %s
-            ORDER BY p.timestamp DESC;
-        """
-        params = (start_date, end_date, platform)
-    else:
-        query = """
-            SELECT 
-                p.*,
-                s.score, s.label, s.confidence, s.compound,
-                s.positive, s.neutral, s.negative, s.model,
-                s.processed_at
-            FROM posts p
-            LEFT JOIN sentiments s ON p.id = s.post_id
-            WHERE p.timestamp >= %s AND p.timestamp <= %s
-            ORDER BY p.timestamp DESC;
-        """
-        params = (start_date, end_date)
+    Same as get_posts_with_sentiment but without the content column, which
+    is usually the bulk of each row, for listings and charts that only need
+    the metadata, engagement and sentiment of each post.
     
-    try:
-        with db.get_cursor() as cursor:
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
-            
-    except DatabaseError as e:
-        logger.error(f"Failed to retrieve posts with sentiment: {e}")
-        raise DatabaseOperationError(f"Failed to retrieve posts with sentiment: {e}")
+    Args:
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        platform: Optional platform filter
+        fetch_all: Return a list; if False, return an iterator that streams
+            rows from a server-side cursor in batches of STREAM_ITERSIZE
+        
+    Returns:
+        List of dictionaries containing post and sentiment data, or an iterator over them when fetch_all is False
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+        
+    Validates: Requirements 6.2, 6.3
+    """
+    return _get_posts_with_sentiment(
+        POST_LIGHT_COLS, start_date, end_date, platform, fetch_all,
+        "posts_with_sentiment_light_stream"
+    )
+
+
+def get_posts_with_sentiment_full(
+    start_date: datetime,
+    end_date: datetime,
+    platform: Optional[str] = None,
+    fetch_all: bool = True
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
+    """
+    Retrieve posts with their sentiment data and raw scraper payload.
+    
+    Same as get_posts_with_sentiment plus the raw_data column, for exports
+    that need the complete record. Prefer fetch_all=False for large ranges,
+    since raw_data makes rows several times larger.
+    
+    Args:
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (inclusive)
+        platform: Optional platform filter
+        fetch_all: Return a list; if False, return an iterator that streams
+            rows from a server-side cursor in batches of STREAM_ITERSIZE
+        
+    Returns:
+        List of dictionaries containing post and sentiment data, or an iterator over them when fetch_all is False
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+        
+    Validates: Requirements 6.2, 6.3
+    """
+    return _get_posts_with_sentiment(
+        f"{POST_DISPLAY_COLS}, raw_data", start_date, end_date, platform,
+        fetch_all, "posts_with_sentiment_full_stream"
+    )
 
 
 def get_sentiment_distribution(
     start_date: datetime,
     end_date: datetime,
-    platform: Optional[str] = None
+    platform: Optional[str] = None,
+    from_summary: bool = False
 ) -> Dict[str, int]:
     """
     Get sentiment distribution (count by label) for a date range.
@@ -613,6 +2017,10 @@ def get_sentiment_distribution(
         start_date: Start of date range (inclusive)
         end_date: End of date range (inclusive)
         platform: Optional platform filter
+        from_summary: Read the mv_daily_sentiment view (migration 006)
+            instead of scanning posts. Both bounds are widened to whole
+            days, and the counts are as of the last
+            refresh_daily_sentiment_summary()
         
     Returns:
         Dict with sentiment labels as keys and counts as values
@@ -625,39 +2033,55 @@ def get_sentiment_distribution(
     """
     db = get_db_connection()
     
-    if platform:
+    # Every label comes back from the VALUES list, with a count of 0 when
+    # nothing in the range matched it
+    if from_summary and platform:
+        query = """
+            SELECT l.label, COALESCE(SUM(m.post_count), 0)::int as count
+            FROM (VALUES ('positive'), ('neutral'), ('negative')) AS l(label)
+            LEFT JOIN mv_daily_sentiment m ON m.label = l.label
+                AND m.day >= %s::date AND m.day <= %s::date AND m.platform = %s
+            GROUP BY l.label;
+        """
+        params = (start_date, end_date, platform)
+    elif from_summary:
         query = """
-            SELECT s.label, COUNT(*) as count
-            FROM sentiments s
-            JOIN posts p ON s.post_id = p.id
-            WHERE p.timestamp >= %s AND p.timestamp <= %s AND p.platform = %s
-            GROUP BY s.label;
+            SELECT l.label, COALESCE(SUM(m.post_count), 0)::int as count
+            FROM (VALUES ('positive'), ('neutral'), ('negative')) AS l(label)
+            LEFT JOIN mv_daily_sentiment m ON m.label = l.label
+                AND m.day >= %s::date AND m.day <= %s::date
+            GROUP BY l.label;
+        """
+        params = (start_date, end_date)
+    elif platform:
+        query = """
+            SELECT l.label, COUNT(s.id) as count
+            FROM (VALUES ('positive'), ('neutral'), ('negative')) AS l(label)
+            LEFT JOIN (
+                sentiments s
+                JOIN posts p ON s.post_id = p.id
+                    AND p.timestamp >= %s AND p.timestamp <= %s AND p.platform = %s
+            ) ON s.label = l.label
+            GROUP BY l.label;
         """
         params = (start_date, end_date, platform)
     else:
         query = """
-            SELECT s.label, COUNT(*) as count
-            FROM sentiments s
-            JOIN posts p ON s.post_id = p.id
-            WHERE p.timestamp >= %s AND p.timestamp <= %s
-            GROUP BY s.label;
+            SELECT l.label, COUNT(s.id) as count
+            FROM (VALUES ('positive'), ('neutral'), ('negative')) AS l(label)
+            LEFT JOIN (
+                sentiments s
+                JOIN posts p ON s.post_id = p.id
+                    AND p.timestamp >= %s AND p.timestamp <= %s
+            ) ON s.label = l.label
+            GROUP BY l.label;
         """
         params = (start_date, end_date)
     
     try:
         with db.get_cursor() as cursor:
             cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            # Convert to dictionary
-            distribution = {row[0]: row[1] for row in results}
-            
-            # Ensure all labels are present
-            for label in ['positive', 'neutral', 'negative']:
-                if label not in distribution:
-                    distribution[label] = 0
-            
-            return distribution
+            return dict(cursor.fetchall())
             
     except DatabaseError as e:
         logger.error(f"Failed to get sentiment distribution: {e}")
@@ -673,6 +2097,9 @@ def get_top_posts_by_engagement(
     """
     Get top posts by engagement (likes + comments + shares).
     
+    Reads the stored total_engagement column (migration 003), whose index
+    returns posts in engagement order so the scan stops after limit rows.
+    
     Args:
         start_date: Start of date range (inclusive)
         end_date: End of date range (inclusive)
@@ -690,9 +2117,8 @@ def get_top_posts_by_engagement(
     db = get_db_connection()
     
     if platform:
-        query = """
-            SELECT *,
-                (likes + comments_count + shares) as total_engagement
+        query = f"""
+            SELECT {POST_DISPLAY_COLS}, total_engagement
             FROM posts
             WHERE timestamp >= %s AND timestamp <= %s AND platform = %s
             ORDER BY total_engagement DESC
@@ -700,9 +2126,8 @@ def get_top_posts_by_engagement(
         """
         params = (start_date, end_date, platform, limit)
     else:
-        query = """
-            SELECT *,
-                (likes + comments_count + shares) as total_engagement
+        query = f"""
+            SELECT {POST_DISPLAY_COLS}, total_engagement
             FROM posts
             WHERE timestamp >= %s AND timestamp <= %s
             ORDER BY total_engagement DESC
@@ -711,23 +2136,51 @@ def get_top_posts_by_engagement(
         params = (start_date, end_date, limit)
     
     try:
-        with db.get_cursor() as cursor:
+        with db.get_cursor(dict_rows=True) as cursor:
             cursor.execute(query, params)
-            results = cursor.fetchall()
-            
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
+            return cursor.fetchall()
             
     except DatabaseError as e:
         logger.error(f"Failed to get top posts by engagement: {e}")
         raise DatabaseOperationError(f"Failed to get top posts: {e}")
 
 
+# get_execution_logs queries keyed by (workflow_name given, status given);
+# fixed statement text per filter combination keeps each one plannable
+# against its own index instead of a generic WHERE 1=1
+_LOG_QUERIES = {
+    (False, False): f"""
+        SELECT {EXECUTION_LOG_COLS} FROM execution_logs
+        ORDER BY executed_at DESC
+        LIMIT %s;
+    """,
+    (True, False): f"""
+        SELECT {EXECUTION_LOG_COLS} FROM execution_logs
+        WHERE workflow_name = %s
+        ORDER BY executed_at DESC
+        LIMIT %s;
+    """,
+    (False, True): f"""
+        SELECT {EXECUTION_LOG_COLS} FROM execution_logs
+        WHERE status = %s
+        ORDER BY executed_at DESC
+        LIMIT %s;
+    """,
+    (True, True): f"""
+        SELECT {EXECUTION_LOG_COLS} FROM execution_logs
+        WHERE workflow_name = %s AND status = %s
+        ORDER BY executed_at DESC
+        LIMIT %s;
+    """,
+}
+
+
 def get_execution_logs(
     workflow_name: Optional[str] = None,
     status: Optional[str] = None,
-    limit: int = 100
-) -> List[Dict[str, Any]]:
+    limit: int = 100,
+    fetch_all: bool = True
+) -> Union[List[Dict[str, Any]], Iterator[Dict[str, Any]]]:
     """
     Retrieve execution logs with optional filters.
     
@@ -735,9 +2188,11 @@ def get_execution_logs(
         workflow_name: Optional workflow name filter
         status: Optional status filter (success, failed, partial)
         limit: Maximum number of logs to return
+        fetch_all: Return a list; if False, return an iterator that streams
+            rows from a server-side cursor in batches of STREAM_ITERSIZE
         
     Returns:
-        List of execution log dictionaries
+        List of execution log dictionaries, or an iterator over them when fetch_all is False
         
     Raises:
         DatabaseOperationError: If the query fails
@@ -746,95 +2201,358 @@ def get_execution_logs(
     """
     db = get_db_connection()
     
-    # Build query dynamically based on filters
-    conditions = []
-    params = []
+    query = _LOG_QUERIES[(bool(workflow_name), bool(status))]
+    params = tuple(
+        value for value in (workflow_name, status) if value
+    ) + (limit,)
+    
+    if not fetch_all:
+        return _stream_rows(query, params, "execution_logs_stream")
+    
+    try:
+        with db.get_cursor(dict_rows=True) as cursor:
+            cursor.execute(query, params)
+            return cursor.fetchall()
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to retrieve execution logs: {e}")
+        raise DatabaseOperationError(f"Failed to retrieve execution logs: {e}")
+
+
+def get_daily_post_counts(
+    start_date: datetime,
+    end_date: datetime,
+    platform: Optional[str] = None,
+    from_summary: bool = False
+) -> List[Tuple[datetime, int]]:
+    """
+    Get daily post counts for a date range.
+    
+    The range is half-open so that consecutive ranges never count a post
+    twice and the timestamp BRIN index (migration 004) can prune block
+    ranges on both bounds.
+    Days are grouped by timestamp::date, the expression migration 011
+    keeps statistics on, so the planner aggregates by hashing instead of
+    sorting every row in the range.
+    
+    Args:
+        start_date: Start of date range (inclusive)
+        end_date: End of date range (exclusive)
+        platform: Optional platform filter
+        from_summary: Sum the hourly counts of the mv_hourly_posts view
+            (migration 015) instead of scanning posts. Every day the range
+            touches is counted in full, as of the last
+            refresh_daily_sentiment_summary(). mv_daily_sentiment is not
+            used, since it counts a post once per sentiment row
+        
+    Returns:
+        List of tuples (date, count) ordered by date
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+        
+    Validates: Requirements 6.2
+    """
+    db = get_db_connection()
+    
+    if from_summary and platform:
+        query = """
+            SELECT day as date, SUM(post_count)::int as count
+            FROM mv_hourly_posts
+            WHERE day >= %s::date AND day < %s AND platform = %s
+            GROUP BY day
+            ORDER BY date;
+        """
+        params = (start_date, end_date, platform)
+    elif from_summary:
+        query = """
+            SELECT day as date, SUM(post_count)::int as count
+            FROM mv_hourly_posts
+            WHERE day >= %s::date AND day < %s
+            GROUP BY day
+            ORDER BY date;
+        """
+        params = (start_date, end_date)
+    elif platform:
+        query = """
+            SELECT timestamp::date as date, COUNT(*) as count
+            FROM posts
+            WHERE timestamp >= %s AND timestamp < %s AND platform = %s
+            GROUP BY 1
+            ORDER BY date;
+        """
+        params = (start_date, end_date, platform)
+    else:
+        query = """
+            SELECT timestamp::date as date, COUNT(*) as count
+            FROM posts
+            WHERE timestamp >= %s AND timestamp < %s
+            GROUP BY 1
+            ORDER BY date;
+        """
+        params = (start_date, end_date)
+    
+    try:
+        with db.get_cursor() as cursor:
+            cursor.execute(query, params)
+            results = cursor.fetchall()
+            return results
+            
+    except DatabaseError as e:
+        logger.error(f"Failed to get daily post counts: {e}")
+        raise DatabaseOperationError(f"Failed to get daily post counts: {e}")
+
+
+def get_dashboard_bundle(
+    start_date: datetime,
+    end_date: datetime,
+    platform: Optional[str] = None,
+    top_limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Get daily post counts, sentiment distribution and top posts at once.
+    
+    Runs the three dashboard aggregates as one statement over a single scan
+    of the posts in the range, instead of three round trips that each scan
+    the same window. Every top post row carries the two small aggregates as
+    arrays, so all three results come back typed in one result set.
+    
+    Args:
+        start_date: Start of date range (inclusive)
+        end_date: End of date range; inclusive for the sentiment
+            distribution and top posts, exclusive for the daily counts,
+            matching the individual functions
+        platform: Optional platform filter
+        top_limit: Maximum number of top posts to return
+        
+    Returns:
+        Dict with 'daily_counts' (as get_daily_post_counts),
+        'sentiment_distribution' (as get_sentiment_distribution) and
+        'top_posts' (as get_top_posts_by_engagement)
+        
+    Raises:
+        DatabaseOperationError: If the query fails
+        
+    Validates: Requirements 6.2, 6.3
+    """
+    db = get_db_connection()
+    
+    platform_filter = "AND platform = %s" if platform else ""
+    query = f"""
+        WITH filtered AS MATERIALIZED (
+            SELECT {POST_DISPLAY_COLS}, total_engagement
+            FROM posts
+            WHERE timestamp >= %s AND timestamp <= %s {platform_filter}
+        ),
+        daily AS (
+            SELECT array_agg(day ORDER BY day) AS days,
+                   array_agg(n ORDER BY day) AS day_counts
+            FROM (
+                SELECT date_trunc('day', timestamp)::date AS day, COUNT(*) AS n
+                FROM filtered
+                WHERE timestamp < %s
+                GROUP BY 1
+            ) d
+        ),
+        distribution AS (
+            SELECT array_agg(label) AS labels, array_agg(n) AS label_counts
+            FROM (
+                SELECT l.label, COUNT(s.id) AS n
+                FROM (VALUES ('positive'), ('neutral'), ('negative')) AS l(label)
+                LEFT JOIN (
+                    sentiments s
+                    JOIN filtered f ON s.post_id = f.id
+                ) ON s.label = l.label
+                GROUP BY l.label
+            ) c
+        ),
+        top AS (
+            SELECT * FROM filtered
+            ORDER BY total_engagement DESC
+            LIMIT %s
+        )
+        SELECT daily.*, distribution.*, top.*
+        FROM daily
+        CROSS JOIN distribution
+        LEFT JOIN top ON true
+        ORDER BY top.total_engagement DESC NULLS LAST;
+    """
+    params = (
+        (start_date, end_date)
+        + ((platform,) if platform else ())
+        + (end_date, top_limit)
+    )
+    
+    try:
+        with db.get_cursor(dict_rows=True) as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        
+        summary = rows[0]
+        top_columns = [*POST_DISPLAY_COLS.split(", "), "total_engagement"]
+        return {
+            'daily_counts': list(zip(summary['days'] or [], summary['day_counts'] or [])),
+            'sentiment_distribution': dict(zip(summary['labels'], summary['label_counts'])),
+            'top_posts': [
+                {col: row[col] for col in top_columns}
+                for row in rows if row['id'] is not None
+            ]
+        }
+        
+    except DatabaseError as e:
+        logger.error(f"Failed to get dashboard bundle: {e}")
+        raise DatabaseOperationError(f"Failed to get dashboard bundle: {e}")
+
+
+def _refresh_summary_views(cursor) -> bool:
+    """Refresh the SUMMARY_VIEWS that exist on cursor's connection."""
+    cursor.execute(
+        "SELECT view FROM unnest(%s::text[]) AS view WHERE to_regclass(view) IS NOT NULL;",
+        (list(SUMMARY_VIEWS),)
+    )
+    views = [row[0] for row in cursor.fetchall()]
+    
+    for view in views:
+        cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view};")
+    return bool(views)
+
+
+def refresh_daily_sentiment_summary() -> bool:
+    """
+    Recompute the summary views used by the dashboard reports.
+    
+    Refreshes mv_daily_sentiment (migration 006), mv_hourly_posts
+    (migration 015) and mv_daily_hashtags (migration 017). Importers call
+    this once after each batch. The
+    refresh runs concurrently, so readers keep seeing the previous counts
+    until it commits. Views whose migration has not been applied are left
+    alone.
+    
+    Returns:
+        True if any view was refreshed, False if none exists
+        
+    Raises:
+        DatabaseOperationError: If the refresh fails
+    """
+    db = get_db_connection()
+    
+    try:
+        with db.get_cursor(commit=True) as cursor:
+            refreshed = _refresh_summary_views(cursor)
+        
+        # Only once the refresh is committed, so that no reader caches the
+        # previous contents again
+        with _aggregate_cache_lock:
+            _aggregate_cache.clear()
+        if refreshed:
+            logger.info("Refreshed dashboard summary views")
+        return refreshed
+        
+    except DatabaseError as e:
+        logger.error(f"Failed to refresh daily sentiment summary: {e}")
+        raise DatabaseOperationError(f"Failed to refresh daily sentiment summary: {e}")
+
+
+def _execute_delete(query: str, params: Tuple, batch_size: Optional[int] = None) -> int:
+    """
+    Run a DELETE and return the number of rows it removed.
     
-    if workflow_name:
-        conditions.append("workflow_name = %s")
-        params.append(workflow_name)
+    With a batch_size the statement is expected to delete at most that many
+    rows; it is repeated, each time in its own transaction, until a batch
+    comes back short. This keeps the locks and WAL of one transaction
+    bounded during large purges.
+    """
+    db = get_db_connection()
+    deleted_count = 0
     
-    if status:
-        conditions.append("status = %s")
-        params.append(status)
+    while True:
+        with db.get_cursor(commit=True) as cursor:
+            cursor.execute(query, params)
+            deleted_count += cursor.rowcount
+        
+        if batch_size is None or cursor.rowcount < batch_size:
+            return deleted_count
+
+
+def _drop_expired_partitions(table: str, days: int) -> int:
+    """
+    Drop the monthly partitions of a table that lie entirely outside retention.
     
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    params.append(limit)
+    Dropping a partition is a catalog operation, so it costs the same
+    regardless of how many rows it holds and leaves no dead tuples behind.
+    Tables that are not partitioned have no children and are left alone.
+    The cutoff is computed by the server, like in the retention DELETEs.
+    Rows are not counted, which would scan the partitions; the planner's
+    row estimate from pg_class is reported instead.
     
-    query = f"""
-        SELECT * FROM execution_logs
-        WHERE {where_clause}
-        ORDER BY executed_at DESC
-        LIMIT %s;
+    Returns:
+        Estimated number of rows removed with the dropped partitions
     """
-    
-    try:
-        with db.get_cursor() as cursor:
-            cursor.execute(query, tuple(params))
-            results = cursor.fetchall()
+    db = get_db_connection()
+    dropped_rows = 0
+    
+    with db.get_cursor(commit=True) as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, GREATEST(c.reltuples, 0)::bigint,
+                   LOCALTIMESTAMP - make_interval(days => %s)
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = to_regclass(%s);
+            """,
+            (days, table)
+        )
+        
+        for partition, estimated_rows, cutoff in cursor.fetchall():
+            match = _MONTHLY_PARTITION_RE.search(partition)
+            if not match or partition != f"{table}{match.group(0)}":
+                continue
             
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in results]
+            year, month = int(match.group(1)), int(match.group(2))
+            month_end = datetime(year + month // 12, month % 12 + 1, 1)
+            if month_end > cutoff:
+                continue
             
-    except DatabaseError as e:
-        logger.error(f"Failed to retrieve execution logs: {e}")
-        raise DatabaseOperationError(f"Failed to retrieve execution logs: {e}")
+            dropped_rows += estimated_rows
+            cursor.execute(
+                sql.SQL("DROP TABLE {}").format(sql.Identifier(partition))
+            )
+            logger.info(f"Dropped expired partition {partition}")
+    
+    return dropped_rows
 
 
-def get_daily_post_counts(
-    start_date: datetime,
-    end_date: datetime,
-    platform: Optional[str] = None
-) -> List[Tuple[datetime, int]]:
+def _create_monthly_partitions(table: str, key_column: str, months_ahead: int = 3) -> int:
     """
-    Get daily post counts for a date range.
+    Create the monthly partitions of a table for the coming months.
+    
+    Uses the create_monthly_partitions() database function (migration 010),
+    which also moves rows that landed in the table's default partition into
+    their new monthly partition. Tables without a default partition are not
+    partitioned by that migration and are left alone.
     
-    Args:
-        start_date: Start of date range (inclusive)
-        end_date: End of date range (inclusive)
-        platform: Optional platform filter
-        
     Returns:
-        List of tuples (date, count) ordered by date
-        
-    Raises:
-        DatabaseOperationError: If the query fails
-        
-    Validates: Requirements 6.2
+        Number of partitions created
     """
     db = get_db_connection()
     
-    if platform:
-        query = """
-            SELECT DATE(timestamp) as date, COUNT(*) as count
-            FROM posts
-            WHERE timestamp >= %s AND timestamp <= %s AND platform = %s
-            GROUP BY DATE(timestamp)
-            ORDER BY date;
-        """
-        params = (start_date, end_date, platform)
-    else:
-        query = """
-            SELECT DATE(timestamp) as date, COUNT(*) as count
-            FROM posts
-            WHERE timestamp >= %s AND timestamp <= %s
-            GROUP BY DATE(timestamp)
-            ORDER BY date;
-        """
-        params = (start_date, end_date)
+    with db.get_cursor(commit=True) as cursor:
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL;", (f"{table}_default",))
+        if not cursor.fetchone()[0]:
+            return 0
+        
+        cursor.execute(
+            "SELECT create_monthly_partitions(%s, %s, %s);",
+            (table, key_column, months_ahead)
+        )
+        created = cursor.fetchone()[0]
     
-    try:
-        with db.get_cursor() as cursor:
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            return results
-            
-    except DatabaseError as e:
-        logger.error(f"Failed to get daily post counts: {e}")
-        raise DatabaseOperationError(f"Failed to get daily post counts: {e}")
+    if created:
+        logger.info(f"Created {created} monthly partitions of {table}")
+    return created
 
 
-def delete_old_posts(days: int = 90) -> int:
+def delete_old_posts(days: int = 90, batch_size: Optional[int] = None) -> int:
     """
     Delete posts older than specified number of days.
     
@@ -843,6 +2561,8 @@ def delete_old_posts(days: int = 90) -> int:
     
     Args:
         days: Number of days to retain (default 90)
+        batch_size: If set, delete at most this many posts per transaction
+            and repeat until all old posts are gone
         
     Returns:
         Number of posts deleted
@@ -852,38 +2572,51 @@ def delete_old_posts(days: int = 90) -> int:
         
     Validates: Requirements 6.7
     """
-    db = get_db_connection()
-    
-    cutoff_date = datetime.now() - timedelta(days=days)
-    
-    query = """
-        DELETE FROM posts
-        WHERE timestamp < %s
-        RETURNING id;
-    """
+    # The server computes the cutoff, so the statement text never changes
+    if batch_size is None:
+        query = """
+            DELETE FROM posts
+            WHERE timestamp < LOCALTIMESTAMP - make_interval(days => %s);
+        """
+        params = (days,)
+    else:
+        query = """
+            DELETE FROM posts
+            WHERE id IN (
+                SELECT id FROM posts
+                WHERE timestamp < LOCALTIMESTAMP - make_interval(days => %s)
+                LIMIT %s
+            );
+        """
+        params = (days, batch_size)
     
     try:
-        with db.get_cursor(commit=True) as cursor:
-            cursor.execute(query, (cutoff_date,))
-            deleted_count = cursor.rowcount
-            
-            logger.info(
-                f"Deleted {deleted_count} posts older than {days} days "
-                f"(before {cutoff_date.date()})"
-            )
-            return deleted_count
+        deleted_count = _execute_delete(query, params, batch_size)
+        
+        logger.info(
+            f"Deleted {deleted_count} posts older than {days} days"
+        )
+        return deleted_count
             
     except DatabaseError as e:
         logger.error(f"Failed to delete old posts: {e}")
         raise DatabaseOperationError(f"Failed to delete old posts: {e}")
 
 
-def delete_old_execution_logs(days: int = 30) -> int:
+def delete_old_execution_logs(days: int = 30, batch_size: Optional[int] = None) -> int:
     """
     Delete execution logs older than specified number of days.
     
+    If execution_logs is partitioned by month (migration 010), whole
+    partitions older than the cutoff are dropped, the partitions for the
+    coming months are created, and only the rows in the partition that
+    straddles the cutoff are deleted. Rows of dropped partitions are
+    counted from the planner's estimate.
+    
     Args:
         days: Number of days to retain (default 30)
+        batch_size: If set, delete at most this many logs per transaction
+            and repeat until all old logs are gone
         
     Returns:
         Number of logs deleted
@@ -893,48 +2626,103 @@ def delete_old_execution_logs(days: int = 30) -> int:
         
     Validates: Requirements 6.7
     """
-    db = get_db_connection()
-    
-    cutoff_date = datetime.now() - timedelta(days=days)
-    
-    query = """
-        DELETE FROM execution_logs
-        WHERE executed_at < %s
-        RETURNING id;
-    """
+    # The server computes the cutoff, so the statement text never changes
+    if batch_size is None:
+        query = """
+            DELETE FROM execution_logs
+            WHERE executed_at < LOCALTIMESTAMP - make_interval(days => %s);
+        """
+        params = (days,)
+    else:
+        query = """
+            DELETE FROM execution_logs
+            WHERE id IN (
+                SELECT id FROM execution_logs
+                WHERE executed_at < LOCALTIMESTAMP - make_interval(days => %s)
+                LIMIT %s
+            );
+        """
+        params = (days, batch_size)
     
     try:
-        with db.get_cursor(commit=True) as cursor:
-            cursor.execute(query, (cutoff_date,))
-            deleted_count = cursor.rowcount
-            
-            logger.info(
-                f"Deleted {deleted_count} execution logs older than {days} days "
-                f"(before {cutoff_date.date()})"
-            )
-            return deleted_count
+        deleted_count = _drop_expired_partitions("execution_logs", days)
+        _create_monthly_partitions("execution_logs", "executed_at")
+        deleted_count += _execute_delete(query, params, batch_size)
+        
+        logger.info(
+            f"Deleted {deleted_count} execution logs older than {days} days"
+        )
+        return deleted_count
             
     except DatabaseError as e:
         logger.error(f"Failed to delete old execution logs: {e}")
         raise DatabaseOperationError(f"Failed to delete old execution logs: {e}")
 
 
+# get_hashtag_frequency queries keyed by whether any filter is given. The
+# filtered text is the same for every filter combination: psycopg2 inlines
+# the parameters, so the planner folds the NULL bounds away before choosing
+# the timestamp and platform indexes
+_HASHTAG_QUERIES = {
+    False: """
+        SELECT ph.hashtag, SUM(ph.occurrences) AS count
+        FROM post_hashtags ph
+        GROUP BY ph.hashtag
+        ORDER BY count DESC
+        LIMIT %s;
+    """,
+    True: """
+        SELECT ph.hashtag, SUM(ph.occurrences) AS count
+        FROM post_hashtags ph
+        JOIN posts p ON p.id = ph.post_id
+        WHERE p.timestamp >= COALESCE(%s::timestamp, '-infinity')
+          AND p.timestamp <= COALESCE(%s::timestamp, 'infinity')
+          AND (%s::text IS NULL OR p.platform = %s)
+        GROUP BY ph.hashtag
+        ORDER BY count DESC
+        LIMIT %s;
+    """,
+}
+
+# get_hashtag_frequency(from_summary=True), with the same null-safe bounds
+# applied to the days of mv_daily_hashtags
+_HASHTAG_SUMMARY_QUERY = """
+    SELECT hashtag, SUM(occurrences)::int AS count
+    FROM mv_daily_hashtags
+    WHERE day >= COALESCE(%s::date, '-infinity')
+      AND day <= COALESCE(%s::date, 'infinity')
+      AND (%s::text IS NULL OR platform = %s)
+    GROUP BY hashtag
+    ORDER BY count DESC
+    LIMIT %s;
+"""
+
+
+@_cached_aggregate
 def get_hashtag_frequency(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     platform: Optional[str] = None,
-    limit: int = 20
+    limit: int = 20,
+    from_summary: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Get hashtag frequency counts from post captions.
     
-    Extracts hashtags from the content field and returns the most frequent ones.
+    Counts the hashtags extracted from post content into post_hashtags
+    (migration 008) and returns the most frequent ones. Posts are only
+    joined in when a date or platform filter needs them. Results are
+    cached per arguments (see _cached_aggregate).
     
     Args:
         start_date: Optional start of date range (inclusive)
         end_date: Optional end of date range (inclusive)
         platform: Optional platform filter
         limit: Maximum number of hashtags to return (default 20)
+        from_summary: Read the mv_daily_hashtags view (migration 017)
+            instead of post_hashtags. Both bounds are widened to whole
+            days, and the counts are as of the last
+            refresh_daily_sentiment_summary()
         
     Returns:
         List of dictionaries with 'hashtag' and 'count' keys, ordered by count descending
@@ -947,44 +2735,19 @@ def get_hashtag_frequency(
     """
     db = get_db_connection()
     
-    # Build WHERE clause based on filters
-    conditions = []
-    params = []
-    
-    if start_date:
-        conditions.append("timestamp >= %s")
-        params.append(start_date)
-    
-    if end_date:
-        conditions.append("timestamp <= %s")
-        params.append(end_date)
-    
-    if platform:
-        conditions.append("platform = %s")
-        params.append(platform)
-    
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    params.append(limit)
-    
-    # Query to extract hashtags from content using regex
-    # This uses PostgreSQL's regexp_matches to find all hashtags in the content
-    query = f"""
-        SELECT 
-            LOWER(REGEXP_REPLACE(hashtag, '^#', '')) as hashtag,
-            COUNT(*) as count
-        FROM (
-            SELECT UNNEST(REGEXP_MATCHES(content, '#(\\w+)', 'g')) as hashtag
-            FROM posts
-            WHERE {where_clause} AND content IS NOT NULL
-        ) hashtags
-        GROUP BY LOWER(REGEXP_REPLACE(hashtag, '^#', ''))
-        ORDER BY count DESC
-        LIMIT %s;
-    """
+    if from_summary:
+        query = _HASHTAG_SUMMARY_QUERY
+        params = (start_date, end_date, platform, platform, limit)
+    elif start_date or end_date or platform:
+        query = _HASHTAG_QUERIES[True]
+        params = (start_date, end_date, platform, platform, limit)
+    else:
+        query = _HASHTAG_QUERIES[False]
+        params = (limit,)
     
     try:
         with db.get_cursor() as cursor:
-            cursor.execute(query, tuple(params))
+            cursor.execute(query, params)
             results = cursor.fetchall()
             
             return [{"hashtag": row[0], "count": row[1]} for row in results]
@@ -994,20 +2757,150 @@ def get_hashtag_frequency(
         raise DatabaseOperationError(f"Failed to get hashtag frequency: {e}")
 
 
+def backfill_hashtags(batch_size: int = STREAM_ITERSIZE) -> int:
+    """
+    Extract hashtags into post_hashtags for posts that have none yet.
+    
+    The triggers from migration 008 keep post_hashtags current for new
+    writes, but running their regular expression over a large history
+    keeps a single Postgres backend busy. This streams the content of the
+    posts without hashtag rows and extracts the hashtags here instead, with
+    RE2 when google-re2 is installed, then COPYs each batch into a staging
+    table and merges it into post_hashtags. Posts deleted or re-tagged by
+    the triggers in the meantime are skipped, and posts without hashtags
+    are scanned again on the next run.
+    
+    Args:
+        batch_size: Number of posts extracted and written per transaction
+        
+    Returns:
+        Number of post_hashtags rows written
+        
+    Raises:
+        DatabaseOperationError: If the operation fails
+    """
+    db = get_db_connection()
+    
+    select_query = """
+        SELECT p.id, p.content
+        FROM posts p
+        WHERE NOT EXISTS (
+            SELECT 1 FROM post_hashtags ph WHERE ph.post_id = p.id
+        )
+        ORDER BY p.id;
+    """
+    
+    create_query = """
+        CREATE TEMP TABLE IF NOT EXISTS post_hashtags_staging
+        ON COMMIT DELETE ROWS AS
+        SELECT post_id, hashtag, occurrences FROM post_hashtags WITH NO DATA;
+    """
+    
+    merge_query = """
+        INSERT INTO post_hashtags (post_id, hashtag, occurrences)
+        SELECT s.post_id, s.hashtag, s.occurrences
+        FROM post_hashtags_staging s
+        JOIN posts p ON p.id = s.post_id
+        ON CONFLICT (post_id, hashtag) DO NOTHING;
+    """
+    
+    def write_batch(lines: List[str]) -> int:
+        with db.get_cursor(commit=True, async_commit=True) as cursor:
+            cursor.execute(create_query)
+            cursor.copy_expert(
+                "COPY post_hashtags_staging (post_id, hashtag, occurrences) FROM STDIN",
+                io.StringIO("".join(lines))
+            )
+            cursor.execute(merge_query)
+            return cursor.rowcount
+    
+    written = 0
+    lines = []
+    scanned = 0
+    
+    try:
+        for row in _stream_rows(select_query, (), "backfill_hashtags", batch_size):
+            counts: Dict[str, int] = {}
+            for hashtag in _HASHTAG_RE.findall(row["content"] or ""):
+                hashtag = hashtag.lower()
+                counts[hashtag] = counts.get(hashtag, 0) + 1
+            # Word characters never need escaping in COPY's text format
+            lines.extend(
+                f"{row['id']}\t{hashtag}\t{count}\n"
+                for hashtag, count in counts.items()
+            )
+            scanned += 1
+            
+            if scanned % batch_size == 0 and lines:
+                written += write_batch(lines)
+                lines = []
+        
+        if lines:
+            written += write_batch(lines)
+        
+        logger.info(f"Backfilled {written} hashtag rows from {scanned} posts")
+        return written
+        
+    except DatabaseError as e:
+        logger.error(f"Failed to backfill hashtags: {e}")
+        raise DatabaseOperationError(f"Failed to backfill hashtags: {e}")
+
+
+# get_posting_time_heatmap statements keyed by from_summary, each with its
+# prepared statement name. There is one text per source whatever filters
+# are given, so each is prepared once per connection and its plan reused:
+# absent bounds become infinite and an absent platform matches every row,
+# and the bounds still limit an index range scan in a generic plan.
+# EXTRACT(DOW ...) returns 0=Sunday, 1=Monday, etc.; EXTRACT(HOUR ...) 0-23
+_HEATMAP_QUERIES = {
+    False: ("posting_time_heatmap_v1", """
+        SELECT 
+            EXTRACT(DOW FROM timestamp)::INTEGER as day_of_week,
+            EXTRACT(HOUR FROM timestamp)::INTEGER as hour,
+            COUNT(*) as count
+        FROM posts
+        WHERE timestamp >= COALESCE($1::timestamp, '-infinity')
+          AND timestamp <= COALESCE($2::timestamp, 'infinity')
+          AND ($3::text IS NULL OR platform = $3)
+        GROUP BY day_of_week, hour
+        ORDER BY day_of_week, hour
+    """),
+    True: ("posting_time_heatmap_summary_v1", """
+        SELECT 
+            EXTRACT(DOW FROM day)::INTEGER as day_of_week,
+            hour,
+            SUM(post_count)::int as count
+        FROM mv_hourly_posts
+        WHERE day >= COALESCE($1::date, '-infinity')
+          AND day <= COALESCE($2::date, 'infinity')
+          AND ($3::text IS NULL OR platform = $3)
+        GROUP BY day_of_week, hour
+        ORDER BY day_of_week, hour
+    """),
+}
+
+
+@_cached_aggregate
 def get_posting_time_heatmap(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    platform: Optional[str] = None
+    platform: Optional[str] = None,
+    from_summary: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Get posting patterns by day of week and hour of day.
     
     Returns a heatmap data structure showing when posts are most frequently made.
+    Results are cached per arguments (see _cached_aggregate).
     
     Args:
         start_date: Optional start of date range (inclusive)
         end_date: Optional end of date range (inclusive)
         platform: Optional platform filter
+        from_summary: Read the mv_hourly_posts view (migration 015)
+            instead of scanning posts. Both bounds are widened to whole
+            days, and the counts are as of the last
+            refresh_daily_sentiment_summary()
         
     Returns:
         List of dictionaries with 'day_of_week', 'hour', and 'count' keys
@@ -1022,41 +2915,11 @@ def get_posting_time_heatmap(
     """
     db = get_db_connection()
     
-    # Build WHERE clause based on filters
-    conditions = []
-    params = []
-    
-    if start_date:
-        conditions.append("timestamp >= %s")
-        params.append(start_date)
-    
-    if end_date:
-        conditions.append("timestamp <= %s")
-        params.append(end_date)
-    
-    if platform:
-        conditions.append("platform = %s")
-        params.append(platform)
-    
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    
-    # Query to group posts by day of week and hour
-    # EXTRACT(DOW FROM timestamp) returns 0=Sunday, 1=Monday, etc.
-    # EXTRACT(HOUR FROM timestamp) returns 0-23
-    query = f"""
-        SELECT 
-            EXTRACT(DOW FROM timestamp)::INTEGER as day_of_week,
-            EXTRACT(HOUR FROM timestamp)::INTEGER as hour,
-            COUNT(*) as count
-        FROM posts
-        WHERE {where_clause}
-        GROUP BY day_of_week, hour
-        ORDER BY day_of_week, hour;
-    """
+    name, query = _HEATMAP_QUERIES[bool(from_summary)]
     
     try:
         with db.get_cursor() as cursor:
-            cursor.execute(query, tuple(params))
+            _execute_prepared(cursor, name, query, (start_date, end_date, platform))
             results = cursor.fetchall()
             
             return [
@@ -1073,19 +2936,51 @@ def get_posting_time_heatmap(
         raise DatabaseOperationError(f"Failed to get posting time heatmap: {e}")
 
 
+def _encode_page_cursor(sort_value: Any, db_id: int) -> str:
+    """Encode the sort value and id of the last row of a page as a cursor."""
+    payload = json.dumps({"v": sort_value, "id": db_id}, default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_page_cursor(page_cursor: str) -> Tuple[Any, int]:
+    """
+    Decode a cursor made by _encode_page_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(page_cursor.encode("ascii")))
+        return payload["v"], int(payload["id"])
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid page cursor: {page_cursor!r}") from e
+
+
 def search_posts(
     search_term: Optional[str] = None,
     filters: Optional[Dict[str, Any]] = None,
     page: int = 1,
-    per_page: int = 25
+    per_page: int = 25,
+    page_cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Search and filter posts with pagination.
     
     Supports full-text search on content and author fields, plus various filters.
     
+    Pages are addressed either by number, which makes Postgres read and
+    discard every row before the page, or by the next_cursor of the
+    previous page. A cursor continues after the last row it was made from
+    with a (sort column, id) comparison, so deep pages cost the same as the
+    first, and skips the COUNT query. Cursors are only available when
+    sorting by a column in KEYSET_SORT_COLUMNS; with a cursor, any other
+    sort_by falls back to timestamp.
+    
     Args:
-        search_term: Optional search term to match in content or author (case-insensitive)
+        search_term: Optional search term to match in content or author
+            (case-insensitive). Terms without % must contain all their
+            words, matched by full-text search; terms with % are LIKE
+            patterns matched anywhere in the text
         filters: Optional dictionary of filters:
             - start_date: datetime - Start of date range
             - end_date: datetime - End of date range
@@ -1094,20 +2989,26 @@ def search_posts(
             - sentiment_label: str - Sentiment label filter (positive, neutral, negative)
             - min_likes: int - Minimum likes
             - max_likes: int - Maximum likes
-            - sort_by: str - Column to sort by (default: timestamp)
+            - sort_by: str - Column to sort by (default: timestamp), or
+              'relevance' to rank full-text matches
             - sort_order: str - Sort order: 'asc' or 'desc' (default: desc)
-        page: Page number (1-indexed)
-        per_page: Number of results per page
+        page: Page number (1-indexed), ignored when page_cursor is given
+        per_page: Number of results per page, at most MAX_PER_PAGE
+        page_cursor: Opaque next_cursor returned for the previous page
         
     Returns:
         Dictionary with:
-            - posts: List of post dictionaries with sentiment data
-            - total: Total number of matching posts
-            - page: Current page number
+            - posts: List of post dictionaries with the data of their
+              newest sentiment
+            - total: Total number of matching posts (None with page_cursor)
+            - page: Current page number (None with page_cursor)
             - per_page: Results per page
-            - total_pages: Total number of pages
+            - total_pages: Total number of pages (None with page_cursor)
+            - next_cursor: Cursor for the following page, or None on the last
+              page or when the sort column does not support cursors
         
     Raises:
+        ValueError: If page_cursor is malformed
         DatabaseOperationError: If the query fails
         
     Validates: Requirements 7.1, 7.2, 7.3, 7.4, 7.6, 7.7, 15.1, 15.2, 15.3
@@ -1117,13 +3018,23 @@ def search_posts(
     if filters is None:
         filters = {}
     
+    # The whole page is held in memory, so its size is bounded here rather
+    # than trusted to every caller
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    
     # Build WHERE clause based on search and filters
     conditions = []
     params = []
     
-    # Search term (case-insensitive search in content and author)
-    if search_term:
-        conditions.append("(LOWER(p.content) LIKE LOWER(%s) OR LOWER(p.author) LIKE LOWER(%s))")
+    # Search term: plain words are looked up in the full-text index of
+    # migration 014; a term containing % is a LIKE pattern, matched
+    # case-insensitively as a substring with the trigram indexes of 013
+    full_text = bool(search_term) and '%' not in search_term
+    if full_text:
+        conditions.append("p.search_tsv @@ plainto_tsquery('simple', %s)")
+        params.append(search_term)
+    elif search_term:
+        conditions.append("(p.content ILIKE %s OR p.author ILIKE %s)")
         search_pattern = f"%{search_term}%"
         params.extend([search_pattern, search_pattern])
     
@@ -1146,7 +3057,7 @@ def search_posts(
         conditions.append("p.media_type = %s")
         params.append(filters['media_type'])
     
-    # Sentiment label filter
+    # Sentiment label filter, on the newest sentiment of each post
     if filters.get('sentiment_label'):
         conditions.append("s.label = %s")
         params.append(filters['sentiment_label'])
@@ -1167,60 +3078,111 @@ def search_posts(
     sort_order = filters.get('sort_order', 'desc').upper()
     
     # Validate sort_by to prevent SQL injection
-    valid_sort_columns = [
-        'timestamp', 'likes', 'comments_count', 'shares', 'author',
-        'platform', 'media_type', 'score', 'label'
-    ]
-    if sort_by not in valid_sort_columns:
+    if sort_by not in _SORT_COLUMNS:
+        sort_by = 'timestamp'
+    if sort_by == 'relevance' and not full_text:
+        sort_by = 'timestamp'
+    if page_cursor is not None and sort_by not in KEYSET_SORT_COLUMNS:
         sort_by = 'timestamp'
     
     # Validate sort_order
-    if sort_order not in ['ASC', 'DESC']:
+    if sort_order not in _SORT_ORDERS:
         sort_order = 'DESC'
     
-    # Add table prefix for sorting
-    if sort_by in ['score', 'label']:
-        sort_column = f"s.{sort_by}"
-    else:
-        sort_column = f"p.{sort_by}"
+    sort_column = _SORT_COLUMNS[sort_by]
+    order_params = [search_term] if sort_by == 'relevance' else []
+    
+    def next_cursor(posts: List[Dict[str, Any]]) -> Optional[str]:
+        if sort_by not in KEYSET_SORT_COLUMNS:
+            return None
+        return _encode_page_cursor(posts[-1][sort_by], posts[-1]['id'])
+    
+    if page_cursor is not None:
+        sort_value, last_id = _decode_page_cursor(page_cursor)
+        comparison = "<" if sort_order == 'DESC' else ">"
+        
+        # One extra row tells whether there is a next page without a COUNT
+        keyset_query = f"""
+            SELECT 
+                {_POST_DISPLAY_COLS_P},
+                {_SENTIMENT_JOIN_COLS}
+            FROM posts p
+            {_LATEST_SENTIMENT_JOIN}
+            WHERE {where_clause}
+              AND ({sort_column}, p.id) {comparison} (%s, %s)
+            ORDER BY {sort_column} {sort_order}, p.id {sort_order}
+            LIMIT %s;
+        """
+        
+        try:
+            with db.get_cursor(dict_rows=True) as cursor:
+                cursor.execute(
+                    keyset_query,
+                    tuple(params + [sort_value, last_id, per_page + 1])
+                )
+                posts = cursor.fetchall()
+                
+        except DatabaseError as e:
+            logger.error(f"Failed to search posts: {e}")
+            raise DatabaseOperationError(f"Failed to search posts: {e}")
+        
+        has_next = len(posts) > per_page
+        posts = posts[:per_page]
+        return {
+            'posts': posts,
+            'total': None,
+            'page': None,
+            'per_page': per_page,
+            'total_pages': None,
+            'next_cursor': next_cursor(posts) if has_next else None
+        }
     
     # Calculate offset for pagination
     offset = (page - 1) * per_page
     
-    # Count query
-    count_query = f"""
-        SELECT COUNT(DISTINCT p.id)
-        FROM posts p
-        LEFT JOIN sentiments s ON p.id = s.post_id
-        WHERE {where_clause};
-    """
-    
-    # Data query with pagination
+    # Data query with pagination. The window count is computed over all
+    # matching rows before LIMIT applies, so the total comes back with the
+    # page from a single pass over the filter. p.id breaks ties so that
+    # pages, and the cursor made from the last row, follow one order
     data_query = f"""
         SELECT 
-            p.*,
-            s.score, s.label, s.confidence, s.compound,
-            s.positive, s.neutral, s.negative, s.model,
-            s.processed_at
+            {_POST_DISPLAY_COLS_P},
+            {_SENTIMENT_JOIN_COLS},
+            COUNT(*) OVER () AS total_count
         FROM posts p
-        LEFT JOIN sentiments s ON p.id = s.post_id
+        {_LATEST_SENTIMENT_JOIN}
         WHERE {where_clause}
-        ORDER BY {sort_column} {sort_order}
+        ORDER BY {sort_column} {sort_order}, p.id {sort_order}
         LIMIT %s OFFSET %s;
     """
     
+    # Only needed for a page past the end, which returns no rows to read
+    # the window count from. The join yields one row per post, so it is
+    # only needed when a sentiment filter refers to it
+    sentiment_join = _LATEST_SENTIMENT_JOIN if filters.get('sentiment_label') else ""
+    count_query = f"""
+        SELECT COUNT(*)
+        FROM posts p
+        {sentiment_join}
+        WHERE {where_clause};
+    """
+    
     try:
-        with db.get_cursor() as cursor:
-            # Get total count
-            cursor.execute(count_query, tuple(params))
-            total = cursor.fetchone()[0]
-            
-            # Get paginated data
-            cursor.execute(data_query, tuple(params + [per_page, offset]))
-            results = cursor.fetchall()
+        with db.get_cursor(dict_rows=True) as cursor:
+            cursor.execute(
+                data_query, tuple(params + order_params + [per_page, offset])
+            )
+            posts = cursor.fetchall()
             
-            columns = [desc[0] for desc in cursor.description]
-            posts = [dict(zip(columns, row)) for row in results]
+            if posts:
+                total = posts[0]['total_count']
+                for post in posts:
+                    del post['total_count']
+            elif offset:
+                cursor.execute(count_query, tuple(params))
+                total = cursor.fetchone()['count']
+            else:
+                total = 0
             
             # Calculate total pages
             total_pages = (total + per_page - 1) // per_page if total > 0 else 0
@@ -1230,7 +3192,10 @@ def search_posts(
                 'total': total,
                 'page': page,
                 'per_page': per_page,
-                'total_pages': total_pages
+                'total_pages': total_pages,
+                'next_cursor': (
+                    next_cursor(posts) if posts and page < total_pages else None
+                )
             }
             
     except DatabaseError as e:
@@ -1254,35 +3219,33 @@ def clear_all_data() -> Dict[str, int]:
     db = get_db_connection()
     
     try:
-        counts = {}
-        
         with db.get_cursor(commit=True) as cursor:
-            # Get counts before deletion
-            cursor.execute("SELECT COUNT(*) FROM comments")
-            counts['comments'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM sentiments")
-            counts['sentiments'] = cursor.fetchone()[0]
+            # Get counts before deletion, in one round trip
+            cursor.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM comments),
+                    (SELECT COUNT(*) FROM sentiments),
+                    (SELECT COUNT(*) FROM posts),
+                    (SELECT COUNT(*) FROM execution_logs);
+            """)
+            counts = dict(zip(
+                ('comments', 'sentiments', 'posts', 'execution_logs'),
+                cursor.fetchone()
+            ))
             
-            cursor.execute("SELECT COUNT(*) FROM posts")
-            counts['posts'] = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM execution_logs")
-            counts['execution_logs'] = cursor.fetchone()[0]
-            
-            # Truncate tables in correct order (child tables first)
-            # CASCADE will automatically delete related records
-            cursor.execute("TRUNCATE TABLE comments CASCADE")
-            cursor.execute("TRUNCATE TABLE sentiments CASCADE")
-            cursor.execute("TRUNCATE TABLE posts CASCADE")
-            cursor.execute("TRUNCATE TABLE execution_logs CASCADE")
+            # One TRUNCATE empties every table at once, together with the
+            # tables referencing them (CASCADE), and restarts the id
+            # sequences the tables own at 1
+            cursor.execute(
+                "TRUNCATE TABLE comments, sentiments, posts, execution_logs "
+                "RESTART IDENTITY CASCADE"
+            )
             
-            # Reset sequences to start from 1
-            cursor.execute("ALTER SEQUENCE comments_id_seq RESTART WITH 1")
-            cursor.execute("ALTER SEQUENCE sentiments_id_seq RESTART WITH 1")
-            cursor.execute("ALTER SEQUENCE posts_id_seq RESTART WITH 1")
-            cursor.execute("ALTER SEQUENCE execution_logs_id_seq RESTART WITH 1")
+            # Keep the dashboard summary from reporting the deleted posts
+            _refresh_summary_views(cursor)
         
+        with _aggregate_cache_lock:
+            _aggregate_cache.clear()
         logger.warning(
             f"Database cleared: {counts['posts']} posts, "
             f"{counts['sentiments']} sentiments, "
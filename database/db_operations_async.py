@@ -0,0 +1,70 @@
+"""
+Async Database Operations Module
+
+This module exposes the database operations as coroutines for callers that
+run on an asyncio event loop, such as concurrent scraping workflows.
+
+psycopg2 has no asynchronous API, so each coroutine runs the matching
+function from db_operations on a worker thread. psycopg2 releases the GIL
+while it waits for the server, so database round trips overlap with the
+other tasks on the loop. The number of workers is capped at the size of
+the connection pool so concurrent calls queue for a thread instead of
+failing with an exhausted pool.
+
+The synchronous module remains the interface for scripts and cron jobs.
+
+Example:
+    results = await asyncio.gather(
+        *(insert_post(**post) for post in posts)
+    )
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from database import db_operations
+from database.db_connection import get_db_connection
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared worker pool, sized to the connection pool."""
+    global _executor
+    
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=get_db_connection().max_conn,
+                thread_name_prefix="db-async"
+            )
+        return _executor
+
+
+def _run_in_thread(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a synchronous database operation as a coroutine function."""
+    
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_executor(), functools.partial(func, *args, **kwargs)
+        )
+    
+    return wrapper
+
+
+insert_post = _run_in_thread(db_operations.insert_post)
+insert_sentiment = _run_in_thread(db_operations.insert_sentiment)
+insert_post_with_sentiment = _run_in_thread(db_operations.insert_post_with_sentiment)
+insert_posts_bulk = _run_in_thread(db_operations.insert_posts_bulk)
+insert_posts_with_sentiments_bulk = _run_in_thread(
+    db_operations.insert_posts_with_sentiments_bulk
+)
+insert_sentiments_bulk = _run_in_thread(db_operations.insert_sentiments_bulk)
+ingest_post_bundle = _run_in_thread(db_operations.ingest_post_bundle)
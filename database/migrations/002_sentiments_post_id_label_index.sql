@@ -0,0 +1,10 @@
+-- Migration 002: covering index for sentiment distribution queries
+--
+-- get_sentiment_distribution() joins the sentiments of posts in a date range
+-- and counts them per label. With (post_id, label) indexed together, the
+-- sentiments side of that join is answered by an index-only scan.
+--
+-- Run with: psql -d <database> -f database/migrations/002_sentiments_post_id_label_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sentiments_post_id_label
+    ON sentiments(post_id, label);
@@ -0,0 +1,21 @@
+-- Migration 003: stored total_engagement column for top-post queries
+--
+-- get_top_posts_by_engagement() orders posts by likes + comments_count +
+-- shares. Storing the sum lets an index return posts already in engagement
+-- order, so ORDER BY total_engagement DESC LIMIT n stops after the first
+-- n rows in the date range instead of sorting every matching post.
+--
+-- Adding a stored generated column rewrites the posts table; run this
+-- outside peak hours.
+--
+-- Run with: psql -d <database> -f database/migrations/003_posts_total_engagement.sql
+
+ALTER TABLE posts
+    ADD COLUMN IF NOT EXISTS total_engagement INTEGER
+    GENERATED ALWAYS AS (likes + comments_count + shares) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_posts_total_engagement
+    ON posts(total_engagement DESC);
+
+CREATE INDEX IF NOT EXISTS idx_posts_platform_total_engagement
+    ON posts(platform, total_engagement DESC);
@@ -0,0 +1,12 @@
+-- Migration 004: BRIN index on posts.timestamp
+--
+-- Posts are inserted roughly in time order, so the physical order of the
+-- table follows timestamp closely. A BRIN index stores only the min/max
+-- timestamp per block range, which makes it a tiny fraction of the size of
+-- the btree index while still letting time-range scans (daily counts,
+-- date-range reports) skip every block range outside the requested window.
+--
+-- Run with: psql -d <database> -f database/migrations/004_posts_timestamp_brin.sql
+
+CREATE INDEX IF NOT EXISTS idx_posts_timestamp_brin
+    ON posts USING BRIN (timestamp) WITH (pages_per_range = 32);
@@ -0,0 +1,15 @@
+-- Migration 005: indexes for filtered execution log listings
+--
+-- get_execution_logs() lists the newest logs, optionally filtered by
+-- workflow_name and/or status. Leading with the filter column and then
+-- executed_at DESC lets each filtered variant read its rows already in
+-- order and stop at LIMIT. The unfiltered listing is served by
+-- idx_logs_executed_at.
+--
+-- Run with: psql -d <database> -f database/migrations/005_execution_logs_filter_indexes.sql
+
+CREATE INDEX IF NOT EXISTS idx_logs_workflow_name_executed_at
+    ON execution_logs(workflow_name, executed_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_logs_status_executed_at
+    ON execution_logs(status, executed_at DESC);
@@ -0,0 +1,26 @@
+-- Migration 006: daily post/sentiment summary for dashboard aggregates
+--
+-- get_sentiment_distribution() scans every post in the requested window
+-- on each call. This view keeps one row per (platform, day, label), so
+-- whole-day dashboard queries read a few hundred summary rows instead.
+-- Like the scan, it counts every sentiment row, so a re-analyzed post is
+-- counted once per analysis; daily post counts are therefore summed from
+-- mv_hourly_posts (migration 015) instead. Posts without a sentiment yet
+-- are counted under a NULL label. The unique index is what allows REFRESH ... CONCURRENTLY,
+-- which refresh_daily_sentiment_summary() runs after each import so
+-- dashboard readers are never blocked.
+--
+-- Run with: psql -d <database> -f database/migrations/006_mv_daily_sentiment.sql
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_sentiment AS
+SELECT
+    p.platform,
+    date_trunc('day', p.timestamp)::date AS day,
+    s.label,
+    COUNT(*) AS post_count
+FROM posts p
+LEFT JOIN sentiments s ON s.post_id = p.id
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_daily_sentiment_key
+    ON mv_daily_sentiment(platform, day, label);
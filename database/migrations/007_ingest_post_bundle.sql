@@ -0,0 +1,96 @@
+-- Migration 007: server-side function for storing a post with its children
+--
+-- Storing a scraped post used to take a post upsert, a sentiment insert
+-- that needs the post id from the first reply, and the comment inserts.
+-- ingest_post_bundle() performs all three inside the server, so
+-- db_operations.ingest_post_bundle() needs a single round trip per post.
+--
+-- p: post object with the insert_post keys (timestamp as ISO 8601 text,
+--    hashtags as an array, raw_data as an object or null)
+-- s: sentiment object with the insert_sentiment keys, or null
+-- c: array of comment objects with author, content, timestamp, sentiment
+--    and raw_data, or null
+--
+-- Timestamps go through timestamptz so an explicit UTC offset is converted
+-- to the session time zone, as it is for parameters bound by psycopg2.
+--
+-- Run with: psql -d <database> -f database/migrations/007_ingest_post_bundle.sql
+
+CREATE OR REPLACE FUNCTION ingest_post_bundle(p JSONB, s JSONB, c JSONB)
+RETURNS TABLE (post_db_id INTEGER, sentiment_id INTEGER, comment_ids INTEGER[])
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO posts (
+        post_id, platform, author, author_id, content, timestamp,
+        likes, comments_count, shares, url, media_type, hashtags, raw_data
+    ) VALUES (
+        p->>'post_id',
+        p->>'platform',
+        p->>'author',
+        p->>'author_id',
+        p->>'content',
+        (p->>'timestamp')::timestamptz::timestamp,
+        (p->>'likes')::integer,
+        (p->>'comments_count')::integer,
+        (p->>'shares')::integer,
+        p->>'url',
+        p->>'media_type',
+        CASE WHEN jsonb_typeof(p->'hashtags') = 'array'
+             THEN ARRAY(SELECT jsonb_array_elements_text(p->'hashtags'))
+        END,
+        NULLIF(p->'raw_data', 'null'::jsonb)
+    )
+    ON CONFLICT (post_id) DO UPDATE SET
+        platform = EXCLUDED.platform,
+        author = EXCLUDED.author,
+        author_id = EXCLUDED.author_id,
+        content = EXCLUDED.content,
+        timestamp = EXCLUDED.timestamp,
+        likes = EXCLUDED.likes,
+        comments_count = EXCLUDED.comments_count,
+        shares = EXCLUDED.shares,
+        url = EXCLUDED.url,
+        media_type = EXCLUDED.media_type,
+        hashtags = EXCLUDED.hashtags,
+        raw_data = EXCLUDED.raw_data,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id INTO post_db_id;
+
+    IF jsonb_typeof(s) = 'object' THEN
+        INSERT INTO sentiments (
+            post_id, score, label, confidence, compound,
+            positive, neutral, negative, model
+        ) VALUES (
+            post_db_id,
+            (s->>'score')::numeric,
+            s->>'label',
+            (s->>'confidence')::numeric,
+            (s->>'compound')::numeric,
+            (s->>'positive')::numeric,
+            (s->>'neutral')::numeric,
+            (s->>'negative')::numeric,
+            s->>'model'
+        )
+        RETURNING id INTO sentiment_id;
+    END IF;
+
+    WITH inserted AS (
+        INSERT INTO comments (
+            post_id, author, content, timestamp, sentiment, raw_data
+        )
+        SELECT
+            post_db_id,
+            comment->>'author',
+            comment->>'content',
+            (comment->>'timestamp')::timestamptz::timestamp,
+            comment->>'sentiment',
+            NULLIF(comment->'raw_data', 'null'::jsonb)
+        FROM jsonb_array_elements(COALESCE(c, '[]'::jsonb)) AS comment
+        RETURNING id
+    )
+    SELECT COALESCE(array_agg(id ORDER BY id), '{}') INTO comment_ids
+    FROM inserted;
+
+    RETURN NEXT;
+END;
+$$;
@@ -0,0 +1,74 @@
+-- Migration 008: hashtags extracted once when a post is written
+--
+-- get_hashtag_frequency() used to run REGEXP_MATCHES over the content of
+-- every post in the requested window on each call. post_hashtags keeps the
+-- lowercased hashtags of each post with the number of times they occur,
+-- so the query becomes a GROUP BY over already extracted rows.
+--
+-- The table is maintained by statement-level triggers on posts rather
+-- than by each insert function, so every write path (single inserts,
+-- bulk inserts, COPY staging, ingest_post_bundle and manual SQL) keeps it
+-- current, and the hashtags are extracted with the same regular expression
+-- the query used before. An upsert that leaves the content unchanged does
+-- not touch the table.
+--
+-- Run with: psql -d <database> -f database/migrations/008_post_hashtags.sql
+
+CREATE TABLE IF NOT EXISTS post_hashtags (
+    post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    hashtag TEXT NOT NULL,
+    occurrences INTEGER NOT NULL,
+    PRIMARY KEY (post_id, hashtag)
+);
+
+CREATE INDEX IF NOT EXISTS idx_post_hashtags_hashtag ON post_hashtags(hashtag);
+
+CREATE OR REPLACE FUNCTION posts_insert_hashtags() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO post_hashtags (post_id, hashtag, occurrences)
+    SELECT p.id, LOWER(m[1]), COUNT(*)
+    FROM new_posts p, regexp_matches(p.content, '#(\w+)', 'g') AS m
+    GROUP BY p.id, LOWER(m[1]);
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION posts_update_hashtags() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM post_hashtags ph
+    USING new_posts n
+    JOIN old_posts o ON o.id = n.id
+    WHERE ph.post_id = n.id
+      AND n.content IS DISTINCT FROM o.content;
+
+    INSERT INTO post_hashtags (post_id, hashtag, occurrences)
+    SELECT n.id, LOWER(m[1]), COUNT(*)
+    FROM new_posts n
+    JOIN old_posts o ON o.id = n.id
+    CROSS JOIN LATERAL regexp_matches(n.content, '#(\w+)', 'g') AS m
+    WHERE n.content IS DISTINCT FROM o.content
+    GROUP BY n.id, LOWER(m[1]);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS posts_insert_hashtags ON posts;
+CREATE TRIGGER posts_insert_hashtags
+    AFTER INSERT ON posts
+    REFERENCING NEW TABLE AS new_posts
+    FOR EACH STATEMENT EXECUTE FUNCTION posts_insert_hashtags();
+
+DROP TRIGGER IF EXISTS posts_update_hashtags ON posts;
+CREATE TRIGGER posts_update_hashtags
+    AFTER UPDATE ON posts
+    REFERENCING OLD TABLE AS old_posts NEW TABLE AS new_posts
+    FOR EACH STATEMENT EXECUTE FUNCTION posts_update_hashtags();
+
+-- Backfill posts written before this migration
+INSERT INTO post_hashtags (post_id, hashtag, occurrences)
+SELECT p.id, LOWER(m[1]), COUNT(*)
+FROM posts p, regexp_matches(p.content, '#(\w+)', 'g') AS m
+GROUP BY p.id, LOWER(m[1])
+ON CONFLICT (post_id, hashtag) DO NOTHING;
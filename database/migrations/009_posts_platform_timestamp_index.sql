@@ -0,0 +1,20 @@
+-- Migration 009: composite indexes for platform-filtered date ranges
+--
+-- get_posts_by_date_range(), get_posts_with_sentiment() and the report
+-- queries filter on platform = %s and a timestamp range and return the
+-- newest posts first. idx_posts_platform only narrows by platform and
+-- idx_posts_timestamp only by time; with (platform, timestamp DESC) the
+-- platform-filtered variants read exactly the matching rows, already in
+-- the requested order. The unfiltered variants keep using
+-- idx_posts_timestamp, which serves DESC order by scanning backwards.
+--
+-- get_comments_by_post_id() returns a post's comments ordered by
+-- timestamp; (post_id, timestamp) returns them in order without a sort.
+--
+-- Run with: psql -d <database> -f database/migrations/009_posts_platform_timestamp_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_posts_platform_timestamp
+    ON posts(platform, timestamp DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_comments_post_id_timestamp
+    ON comments(post_id, timestamp);
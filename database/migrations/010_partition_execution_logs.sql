@@ -0,0 +1,127 @@
+-- Migration 010: monthly range partitions for execution_logs
+--
+-- delete_old_execution_logs() removed expired logs with a DELETE, which
+-- leaves dead tuples and index bloat behind for VACUUM. With execution_logs
+-- partitioned by month on executed_at, retention drops whole partitions
+-- named execution_logs_YYYY_MM (see _drop_expired_partitions) and only
+-- deletes rows from the month that straddles the cutoff.
+--
+-- Nothing references execution_logs, so the only schema change visible to
+-- the application is that the primary key becomes (id, executed_at):
+-- unique keys of a partitioned table must include the partition column.
+-- posts is not converted because its unique post_id (used by the ON
+-- CONFLICT upserts) and the sentiments/comments foreign keys to posts(id)
+-- could not be kept.
+--
+-- create_monthly_partitions() creates the partitions for the coming
+-- months; delete_old_execution_logs() calls it on every retention run.
+-- Rows outside every monthly partition land in execution_logs_default;
+-- when their month's partition is created later they are moved into it.
+--
+-- The table is rewritten and locked while the data is copied; run this
+-- outside peak hours.
+--
+-- Run with: psql -d <database> -f database/migrations/010_partition_execution_logs.sql
+
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    parent TEXT, key_column TEXT, months_ahead INTEGER DEFAULT 3
+) RETURNS INTEGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start DATE;
+    month_end DATE;
+    partition_name TEXT;
+    created INTEGER := 0;
+BEGIN
+    -- The current and coming months, plus every month that has rows
+    -- sitting in the default partition so they are moved out of it
+    FOR month_start IN EXECUTE format(
+        'SELECT generate_series(
+                    date_trunc(''month'', LOCALTIMESTAMP),
+                    date_trunc(''month'', LOCALTIMESTAMP) + make_interval(months => %s),
+                    INTERVAL ''1 month''
+                )::date
+         UNION
+         SELECT DISTINCT date_trunc(''month'', %I)::date FROM %I
+         ORDER BY 1',
+        months_ahead, key_column, parent || '_default'
+    ) LOOP
+        month_end := (month_start + INTERVAL '1 month')::date;
+        partition_name := format('%s_%s', parent, to_char(month_start, 'YYYY_MM'));
+
+        IF to_regclass(partition_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                partition_name, parent
+            );
+            EXECUTE format(
+                'WITH moved AS (
+                     DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *
+                 )
+                 INSERT INTO %I SELECT * FROM moved',
+                parent || '_default', key_column, month_start, key_column, month_end,
+                partition_name
+            );
+            EXECUTE format(
+                'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                parent, partition_name, month_start, month_end
+            );
+            created := created + 1;
+        END IF;
+    END LOOP;
+
+    RETURN created;
+END;
+$$;
+
+BEGIN;
+
+ALTER TABLE execution_logs RENAME TO execution_logs_unpartitioned;
+ALTER INDEX IF EXISTS execution_logs_pkey RENAME TO execution_logs_unpartitioned_pkey;
+DROP INDEX IF EXISTS idx_logs_workflow_id;
+DROP INDEX IF EXISTS idx_logs_status;
+DROP INDEX IF EXISTS idx_logs_executed_at;
+DROP INDEX IF EXISTS idx_logs_workflow_name_executed_at;
+DROP INDEX IF EXISTS idx_logs_status_executed_at;
+
+CREATE TABLE execution_logs (
+    id INTEGER NOT NULL DEFAULT nextval('execution_logs_id_seq'),
+    workflow_id VARCHAR(255) NOT NULL,
+    workflow_name VARCHAR(255) NOT NULL,
+    status VARCHAR(50) NOT NULL,
+    duration_ms INTEGER,
+    error_message TEXT,
+    error_stack TEXT,
+    metadata JSONB,
+    executed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, executed_at)
+) PARTITION BY RANGE (executed_at);
+
+ALTER SEQUENCE execution_logs_id_seq OWNED BY execution_logs.id;
+
+CREATE TABLE execution_logs_default PARTITION OF execution_logs DEFAULT;
+
+CREATE INDEX idx_logs_workflow_id ON execution_logs(workflow_id);
+CREATE INDEX idx_logs_status ON execution_logs(status);
+CREATE INDEX idx_logs_executed_at ON execution_logs(executed_at);
+CREATE INDEX idx_logs_workflow_name_executed_at
+    ON execution_logs(workflow_name, executed_at DESC);
+CREATE INDEX idx_logs_status_executed_at
+    ON execution_logs(status, executed_at DESC);
+
+-- Existing logs go to the default partition first and are moved into
+-- their monthly partitions by create_monthly_partitions()
+INSERT INTO execution_logs (
+    id, workflow_id, workflow_name, status, duration_ms,
+    error_message, error_stack, metadata, executed_at
+)
+SELECT
+    id, workflow_id, workflow_name, status, duration_ms,
+    error_message, error_stack, metadata, COALESCE(executed_at, LOCALTIMESTAMP)
+FROM execution_logs_unpartitioned;
+
+SELECT create_monthly_partitions('execution_logs', 'executed_at');
+
+DROP TABLE execution_logs_unpartitioned;
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- Migration 011: planner statistics for the day of posts.timestamp
+--
+-- get_daily_post_counts() groups posts by timestamp::date. Without
+-- statistics on that expression the planner assumes one group per row,
+-- sorts the whole range (spilling to disk for wide ranges) and then
+-- aggregates. With the number of distinct days known it hashes the rows
+-- into a few hundred groups and only sorts those.
+--
+-- Expression statistics (PostgreSQL 14+) give the planner this estimate
+-- without an expression index: the range itself is still read through
+-- the timestamp indexes, so an index on the day would only add write cost
+-- to every post insert. The statistics are collected by the next ANALYZE.
+--
+-- Run with: psql -d <database> -f database/migrations/011_posts_timestamp_date_statistics.sql
+
+CREATE STATISTICS IF NOT EXISTS posts_timestamp_date
+    ON ((timestamp::date)) FROM posts;
+
+ANALYZE posts;
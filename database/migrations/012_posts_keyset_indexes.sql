@@ -0,0 +1,24 @@
+-- Migration 012: indexes for keyset pagination of search_posts
+--
+-- search_posts(page_cursor=...) continues after the last row of the
+-- previous page with WHERE (sort column, p.id) < (%s, %s) ORDER BY sort
+-- column, p.id. An index on (column, id) turns that into a seek to the
+-- cursor position followed by reading exactly one page, however deep the
+-- page is. Cursors are offered for the NOT NULL sort columns timestamp
+-- and author (KEYSET_SORT_COLUMNS).
+--
+-- The new indexes serve every lookup the single-column idx_posts_timestamp
+-- and idx_posts_author did, so those are dropped once the replacements
+-- exist.
+--
+-- Run with: psql -d <database> -f database/migrations/012_posts_keyset_indexes.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_posts_timestamp_id
+    ON posts(timestamp, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_posts_author_id
+    ON posts(author, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_posts_timestamp;
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_posts_author;
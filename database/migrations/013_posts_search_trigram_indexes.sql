@@ -0,0 +1,23 @@
+-- Migration 013: trigram indexes for post search
+--
+-- search_posts() and the dashboard post list match the search term
+-- anywhere in the caption or author name (ILIKE '%term%'). A btree index
+-- cannot serve a pattern with a leading wildcard, so every search read
+-- the whole posts table. pg_trgm GIN indexes answer LIKE and ILIKE with
+-- wildcards on both sides from the trigrams of the term; the two indexes
+-- are combined with a BitmapOr for the content-or-author condition.
+-- Terms shorter than three characters have no trigrams to look up and
+-- still scan.
+--
+-- pg_trgm ships with PostgreSQL's contrib modules; creating the extension
+-- needs the CREATE privilege on the database.
+--
+-- Run with: psql -d <database> -f database/migrations/013_posts_search_trigram_indexes.sql
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_posts_content_trgm
+    ON posts USING GIN (content gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_posts_author_trgm
+    ON posts USING GIN (author gin_trgm_ops);
@@ -0,0 +1,25 @@
+-- Migration 014: full-text search over post content and author
+--
+-- search_posts() matched each word of a search as a substring with
+-- ILIKE, which cannot rank results and, for terms shorter than three
+-- characters, still reads every post. search_tsv holds the words of the
+-- caption and the author name, kept current by Postgres as a stored
+-- generated column, and its GIN index finds the posts containing all
+-- words of a plainto_tsquery() directly. search_posts() uses it for
+-- terms without a % wildcard and can sort by ts_rank() relevance.
+--
+-- The 'simple' configuration lowercases words without stemming, since
+-- captions mix Indonesian, English and slang that no single dictionary
+-- stems correctly.
+--
+-- Adding a stored column rewrites posts under an exclusive lock; run this
+-- outside peak hours.
+--
+-- Run with: psql -d <database> -f database/migrations/014_posts_search_tsvector.sql
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', coalesce(content, '') || ' ' || coalesce(author, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_posts_search_tsv ON posts USING GIN (search_tsv);
@@ -0,0 +1,25 @@
+-- Migration 015: hourly post counts for the posting time heatmap
+--
+-- get_posting_time_heatmap() extracts the weekday and hour of every post
+-- in the requested window and aggregates them on each call. This view
+-- keeps one row per (platform, day, hour), at most 24 per platform and
+-- day, so the heatmap sums a few thousand summary rows for a month
+-- instead. The weekday is derived from the day when the view is read.
+--
+-- refresh_daily_sentiment_summary(), which importers run after each
+-- batch, refreshes this view together with mv_daily_sentiment; the unique
+-- index is what allows it to do so CONCURRENTLY.
+--
+-- Run with: psql -d <database> -f database/migrations/015_mv_hourly_posts.sql
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_hourly_posts AS
+SELECT
+    platform,
+    timestamp::date AS day,
+    EXTRACT(HOUR FROM timestamp)::INTEGER AS hour,
+    COUNT(*) AS post_count
+FROM posts
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_hourly_posts_key
+    ON mv_hourly_posts(platform, day, hour);
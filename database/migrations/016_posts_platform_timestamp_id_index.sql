@@ -0,0 +1,25 @@
+-- Migration 016: platform index that matches search_posts' order
+--
+-- search_posts orders by sort column and p.id so that pages and keyset
+-- cursors follow one total order, and platform is its most common
+-- filter. idx_posts_platform_timestamp only covers (platform, timestamp),
+-- so platform-filtered pages still went through an Incremental Sort on
+-- id, and a keyset page applied its (timestamp, id) < (%s, %s) cursor as
+-- a filter on the rows of the index scan. With id as the last index
+-- column the rows come back in the requested order and the cursor is an
+-- index condition, so a page reads exactly its rows.
+--
+-- The new index serves every lookup idx_posts_platform_timestamp did
+-- (migration 009), so that one is dropped once the replacement exists.
+--
+-- A covering INCLUDE list was not added: search_posts returns content,
+-- url and hashtags, so an index-only scan would need a copy of most of
+-- the table. The sentiments side of the join already uses
+-- idx_sentiments_post_id_label (migration 002).
+--
+-- Run with: psql -d <database> -f database/migrations/016_posts_platform_timestamp_id_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_posts_platform_timestamp_id
+    ON posts(platform, timestamp DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_posts_platform_timestamp;
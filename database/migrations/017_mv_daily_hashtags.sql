@@ -0,0 +1,30 @@
+-- Migration 017: daily hashtag counts for get_hashtag_frequency
+--
+-- get_hashtag_frequency() groups every post_hashtags row of the requested
+-- window on each call, joining posts to filter by date and platform. This
+-- view keeps one row per (day, platform, hashtag) with the summed
+-- occurrences, so a month of posts is answered from the day rows of that
+-- month without touching posts.
+--
+-- A trigger-maintained counter table was not used: every post insert
+-- would update the same popular hashtag rows, serializing concurrent
+-- importers on those row locks, and content edits and deletes would each
+-- need their own decrement. Like mv_daily_sentiment and mv_hourly_posts,
+-- the view is refreshed by refresh_daily_sentiment_summary(), which
+-- importers run after each batch; the unique index is what allows it to
+-- do so CONCURRENTLY, and its leading day column serves the date range.
+--
+-- Run with: psql -d <database> -f database/migrations/017_mv_daily_hashtags.sql
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_hashtags AS
+SELECT
+    p.timestamp::date AS day,
+    p.platform,
+    ph.hashtag,
+    SUM(ph.occurrences) AS occurrences
+FROM post_hashtags ph
+JOIN posts p ON p.id = ph.post_id
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_daily_hashtags_key
+    ON mv_daily_hashtags(day, platform, hashtag);
@@ -0,0 +1,19 @@
+-- Migration 018: newest sentiment of a post in one index probe
+--
+-- A post can have several sentiments rows once it is re-analyzed.
+-- search_posts() joins only the newest one, the row with the highest id,
+-- through a LATERAL subquery, and get_sentiments_by_post_ids() picks the
+-- same row with DISTINCT ON (post_id) ORDER BY post_id, id DESC. With
+-- (post_id, id DESC) indexed, that row is the first index entry of the
+-- post, so neither needs a sort per post.
+--
+-- The new index serves every lookup the single-column
+-- idx_sentiments_post_id did, so that one is dropped once the
+-- replacement exists.
+--
+-- Run with: psql -d <database> -f database/migrations/018_sentiments_post_id_id_index.sql
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sentiments_post_id_id
+    ON sentiments(post_id, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_sentiments_post_id;
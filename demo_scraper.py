@@ -3,13 +3,14 @@ Demo Script - Social Media Scraper
 Demonstrates basic scraping functionality with mock data
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 
-def create_demo_data():
-    """Create demo scraped data"""
-    demo_posts = [
+from scraper.utils.json_output import WRITE_BUFFER_SIZE, dumps_json
+
+def iter_demo_posts():
+    """Yield the demo posts one at a time"""
+    yield from [
         {
             "post_id": "demo_001",
             "author": "rusdi_sutejo",
@@ -56,6 +57,10 @@ def create_demo_data():
             "hashtags": ["#work"]
         }
     ]
+
+def create_demo_data():
+    """Create demo scraped data"""
+    demo_posts = list(iter_demo_posts())
     
     return {
         "metadata": {
@@ -77,9 +82,16 @@ def save_demo_data(output_path):
     # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     
-    # Save to file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Save to file, one post per line, so the whole document is never
+    # encoded into a single string
+    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(b'{\n  "metadata": ')
+        f.write(dumps_json(data['metadata']).replace(b'\n', b'\n  '))
+        f.write(b',\n  "posts": [')
+        for i, post in enumerate(data['posts']):
+            f.write(b',\n    ' if i else b'\n    ')
+            f.write(dumps_json(post, indent=False))
+        f.write(b'\n  ]\n}\n' if data['posts'] else b']\n}\n')
     
     return output_path, data
 
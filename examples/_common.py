@@ -0,0 +1,187 @@
+"""
+Shared main() of the scraper examples.
+
+The Facebook, Instagram and Twitter examples only differ in the scraper
+class, the environment variable prefix and the post fields they print,
+so the configuration, scraping and output handling live here once.
+
+Configuration is read from the environment; .env is only loaded when
+the platform's username is not already set:
+    <PREFIX>_USERNAME, <PREFIX>_PASSWORD: Login credentials
+    <PREFIX>_TARGET_URL: Target to scrape
+    <PREFIX>_TARGET_URLS: Several comma-separated targets, scraped in one
+        browser session with a single login
+    SCRAPER_MAX_POSTS: Number of posts to scrape per target
+    SCRAPER_STREAM_OUTPUT: Write posts to a JSON Lines file as they arrive
+    SCRAPER_PRETTY_OUTPUT: Indent the JSON result file
+    SCRAPER_COMPRESS_OUTPUT: zstd-compress the JSON result file (.json.zst)
+    SCRAPER_CACHE_TTL: Seconds to reuse a previous result (0 disables)
+"""
+
+import os
+import traceback
+from typing import Sequence, Tuple, Type
+
+from dotenv import load_dotenv
+from scraper.scrapers.base_scraper import BaseScraper
+from scraper.utils.json_output import JsonLinesWriter, write_json
+from scraper.utils.result_cache import ResultCache
+
+
+def run_example(
+    platform_name: str,
+    scraper_cls: Type[BaseScraper],
+    env_prefix: str,
+    target_default: str,
+    item_name: str = 'post',
+    counters: Sequence[Tuple[str, str]] = (('Likes', 'likes'), ('Comments', 'comments_count')),
+    author_prefix: str = ''
+) -> None:
+    """
+    Scrape the configured targets and save the result to output/.
+
+    Args:
+        platform_name: Display name, e.g. 'Instagram'
+        scraper_cls: Scraper class of the platform
+        env_prefix: Prefix of the credential and target variables, e.g. 'INSTAGRAM'
+        target_default: Target URL when none is configured
+        item_name: What a scraped item is called, e.g. 'tweet'
+        counters: (label, post key) of the counts printed for sample posts
+        author_prefix: Printed before sample post authors, e.g. '@'
+    """
+    platform = platform_name.lower()
+    item_title = item_name.capitalize()
+
+    # Load environment variables from .env unless the credentials are
+    # already set, as in CI or when started by another program
+    if not os.getenv(f'{env_prefix}_USERNAME'):
+        load_dotenv()
+
+    # Get credentials from environment variables
+    credentials = {
+        'username': os.getenv(f'{env_prefix}_USERNAME'),
+        'password': os.getenv(f'{env_prefix}_PASSWORD')
+    }
+
+    # Check if credentials are provided
+    if not credentials['username'] or not credentials['password']:
+        print(f"Error: {platform_name} credentials not found in environment variables")
+        print(f"Please set {env_prefix}_USERNAME and {env_prefix}_PASSWORD in your .env file")
+        return
+
+    # Target URL to scrape
+    target_url = os.getenv(f'{env_prefix}_TARGET_URL', target_default)
+
+    # Several targets, separated by commas, are scraped in one browser
+    # session with a single login
+    target_urls = [
+        url.strip() for url in os.getenv(f'{env_prefix}_TARGET_URLS', '').split(',') if url.strip()
+    ] or [target_url]
+
+    # Number of posts to scrape
+    limit = int(os.getenv('SCRAPER_MAX_POSTS', '10'))
+
+    # Write each post to a JSON Lines file as soon as it is scraped
+    stream = os.getenv('SCRAPER_STREAM_OUTPUT', 'false').lower() == 'true'
+
+    # Indent the result file for reading by hand; compact output is about
+    # half the size and is all the analyzer and organizer scripts need
+    pretty = os.getenv('SCRAPER_PRETTY_OUTPUT', 'false').lower() == 'true'
+
+    # Compress the result file for large scrapes; needs zstandard
+    compress = os.getenv('SCRAPER_COMPRESS_OUTPUT', 'false').lower() == 'true'
+
+    # Reuse results of the same targets and limit for this many seconds
+    # (0 always scrapes)
+    cache_ttl = int(os.getenv('SCRAPER_CACHE_TTL', '3600'))
+    cache = ResultCache(ttl=cache_ttl) if cache_ttl > 0 else None
+
+    # Each block of console output is written with one print call
+    print("\n".join([
+        f"{platform_name} Scraper Example",
+        "=" * 50,
+        f"Target URL: {', '.join(target_urls)}",
+        f"{item_title} limit: {limit}",
+        "=" * 50,
+        ""
+    ]))
+
+    # Create scraper instance
+    scraper = scraper_cls(
+        credentials=credentials,
+        rate_limit=30,  # 30 requests per minute
+        timeout=300,    # 5 minutes timeout
+        headless=True,  # Run in headless mode
+        max_retries=5   # Retry failed requests up to 5 times
+    )
+
+    try:
+        print("Starting scraping process...\n")
+
+        # Scrape posts; when streaming, the metadata follows the posts
+        # as the last line, since it is only known once the run is done
+        os.makedirs('output', exist_ok=True)
+        if stream:
+            output_file = f'output/{platform}_posts.jsonl'
+            with JsonLinesWriter(output_file) as writer:
+                result = scraper.scrape_many(
+                    target_urls,
+                    limit=limit,
+                    authenticate=True,
+                    on_post=writer.write,
+                    cache=cache
+                )
+                writer.write({'metadata': result['metadata']})
+        else:
+            result = scraper.scrape_many(
+                target_urls,
+                limit=limit,
+                authenticate=True,
+                cache=cache
+            )
+
+        # Display results
+        metadata = result['metadata']
+        print("\n".join([
+            "\nScraping Complete!",
+            "=" * 50,
+            f"Platform: {metadata['platform']}",
+            f"Scraped at: {metadata['scraped_at']}",
+            f"Total {item_name}s: {metadata['total_posts']}",
+            f"Execution time: {metadata['execution_time_ms']}ms",
+            f"Errors encountered: {metadata['errors_encountered']}",
+            ""
+        ]))
+
+        # Display sample posts
+        if result['posts']:
+            lines = [f"Sample {item_title}s:", "-" * 50]
+            for i, post in enumerate(result['posts'][:3], 1):
+                content = post['content']
+                lines += [
+                    f"\n{item_title} {i}:",
+                    f"  ID: {post['post_id']}",
+                    f"  Author: {author_prefix}{post['author']}",
+                    f"  Content: {content[:100]}{'...' if len(content) > 100 else ''}"
+                ]
+                lines += [f"  {label}: {post[key]}" for label, key in counters]
+                lines += [
+                    f"  Hashtags: {', '.join(post['hashtags'][:5])}" if post['hashtags'] else "  Hashtags: None",
+                    f"  URL: {post['url']}"
+                ]
+            print("\n".join(lines))
+
+        # Save results to file
+        if not stream:
+            output_file = f'output/{platform}_posts.json' + ('.zst' if compress else '')
+            write_json(output_file, result, indent=pretty)
+
+        print(f"\n\nResults saved to: {output_file}")
+
+    except Exception as e:
+        print(f"\nError during scraping: {e}")
+        traceback.print_exc()
+
+    finally:
+        # Cleanup is handled automatically by the scraper
+        print("\nScraper closed.")
@@ -37,13 +37,14 @@ def example_single_post():
         max_comments=50,
     )
 
+    comments = result['comments']
     print(f"\nResults:")
-    print(f"  Total comments: {len(result['comments'])}")
+    print(f"  Total comments: {len(comments)}")
     print(f"  Exported files: {result['exported_files']}")
 
-    if result['comments']:
+    if comments:
         print(f"\nSample comment:")
-        comment = result['comments'][0]
+        comment = comments[0]
         print(f"  Author: {comment.get('comment_author_name', 'N/A')}")
         print(f"  Text: {comment.get('comment_text', 'N/A')[:100]}")
         print(f"  Timestamp: {comment.get('comment_timestamp', 'N/A')}")
@@ -24,9 +24,9 @@ def demo_basic_usage():
     # Make 5 requests
     print("\nMaking 5 requests...")
     for i in range(5):
-        start = time.time()
+        start = time.monotonic()
         limiter.acquire()
-        elapsed = time.time() - start
+        elapsed = time.monotonic() - start
         print(f"Request {i+1}: waited {elapsed:.3f}s, "
               f"tokens remaining: {limiter.get_available_tokens():.2f}")
     
@@ -78,16 +78,16 @@ def demo_with_timeout():
     
     # Try with short timeout (should fail)
     print("\nTrying to acquire with 0.5s timeout...")
-    start = time.time()
+    start = time.monotonic()
     success = limiter.acquire(timeout=0.5)
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
     print(f"Result: {'Success' if success else 'Timeout'}, elapsed: {elapsed:.2f}s")
     
     # Try with longer timeout (should succeed)
     print("\nTrying to acquire with 2s timeout...")
-    start = time.time()
+    start = time.monotonic()
     success = limiter.acquire(timeout=2.0)
-    elapsed = time.time() - start
+    elapsed = time.monotonic() - start
     print(f"Result: {'Success' if success else 'Timeout'}, elapsed: {elapsed:.2f}s")
     
     print()
@@ -139,20 +139,20 @@ def demo_scraping_simulation():
     print(f"Scraping {len(urls)} URLs with rate limit of 30 requests/minute")
     print()
     
-    start_time = time.time()
+    start_time = time.monotonic()
     
     for i, url in enumerate(urls, 1):
         # Wait for rate limiter
         limiter.acquire()
         
         # Simulate scraping (in real code, this would be actual HTTP request)
-        print(f"[{time.time() - start_time:.2f}s] Scraping {url}...")
+        print(f"[{time.monotonic() - start_time:.2f}s] Scraping {url}...")
         time.sleep(0.1)  # Simulate request time
         
         tokens_left = limiter.get_available_tokens()
         print(f"  -> Success! Tokens remaining: {tokens_left:.2f}")
     
-    total_time = time.time() - start_time
+    total_time = time.monotonic() - start_time
     print(f"\nTotal time: {total_time:.2f}s")
     print(f"Average time per request: {total_time/len(urls):.2f}s")
     
@@ -0,0 +1,49 @@
+"""
+Example: Running the Facebook, Instagram and Twitter Scrapers Together
+
+The three scraper examples target independent sites with their own rate
+limits, so there is no reason to wait for one to finish before starting
+the next. Each example runs in its own thread with its own browser and
+rate limiter, and the whole run takes about as long as the slowest
+platform instead of the sum of all three.
+
+The examples are configured exactly as when run on their own (see
+examples/_common.py). Their console output is interleaved.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path to import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from examples.facebook_scraper_example import main as facebook_main
+from examples.instagram_scraper_example import main as instagram_main
+from examples.twitter_scraper_example import main as twitter_main
+
+
+async def run_all():
+    """Run the three scraper examples concurrently."""
+    results = await asyncio.gather(
+        asyncio.to_thread(facebook_main),
+        asyncio.to_thread(instagram_main),
+        asyncio.to_thread(twitter_main),
+        return_exceptions=True
+    )
+
+    for name, result in zip(('Facebook', 'Instagram', 'Twitter'), results):
+        if isinstance(result, BaseException):
+            print(f"{name} example failed: {result}")
+
+
+def main():
+    """Main function to run all scraper examples at once."""
+    start = time.monotonic()
+    asyncio.run(run_all())
+    print(f"\nAll examples finished in {time.monotonic() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
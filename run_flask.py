@@ -2,26 +2,68 @@
 Flask Analytics Dashboard - Main Entry Point
 
 Run this script to start the Flask development server.
-For production, use a WSGI server like Gunicorn or uWSGI.
+
+With FLASK_ENV=production the dashboard is served by Gunicorn instead,
+started in-process with several worker processes and HTTP keep-alive.
+WEB_CONCURRENCY sets the number of workers (default: 2 x CPUs + 1).
+Gunicorn does not run on Windows; there the development server is used.
 """
 
 import os
 from app import create_app
 from app.config import Config
 
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:  # not installed, or on Windows
+    BaseApplication = None
+
 # Create Flask application
 app = create_app()
 
+
+def run_production_server():
+    """Serve the app with Gunicorn worker processes."""
+    from database.db_connection import forget_db_connection
+
+    def post_fork(server, worker):
+        # Each worker opens its own connection pool on first use
+        forget_db_connection()
+
+    class DashboardApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f"{Config.HOST}:{Config.PORT}")
+            self.cfg.set('workers', int(os.getenv('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1)))
+            # psycopg2 blocks, so workers use threads rather than gevent
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('threads', 4)
+            self.cfg.set('keepalive', 30)
+            self.cfg.set('post_fork', post_fork)
+
+        def load(self):
+            return app
+
+    app.logger.info(f"Starting Gunicorn on {Config.HOST}:{Config.PORT}")
+    DashboardApplication().run()
+
+
 if __name__ == '__main__':
     # Validate configuration and log warnings
     warnings = Config.validate_config()
     for warning in warnings:
         app.logger.warning(warning)
-    
-    # Run development server
-    app.logger.info(f"Starting Flask server on {Config.HOST}:{Config.PORT}")
-    app.run(
-        host=Config.HOST,
-        port=Config.PORT,
-        debug=Config.DEBUG
-    )
+
+    production = os.getenv('FLASK_ENV') == 'production'
+    if production and BaseApplication is not None:
+        run_production_server()
+    else:
+        if production:
+            app.logger.warning("Gunicorn is not available; using the development server")
+
+        # Run development server
+        app.logger.info(f"Starting Flask server on {Config.HOST}:{Config.PORT}")
+        app.run(
+            host=Config.HOST,
+            port=Config.PORT,
+            debug=Config.DEBUG
+        )
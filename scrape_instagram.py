@@ -4,16 +4,20 @@ Instagram Scraper - Simplified Script with Better Error Handling
 
 import os
 import sys
-import json
-import time
 from datetime import datetime
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from scraper.scrapers.instagram import InstagramScraper
-from scraper.config import get_config
+from scraper.utils.json_output import write_json
+from scraper.utils.result_cache import ResultCache
+
+# Set UTF-8 encoding for Windows console, once, when run as a script
+if sys.platform == 'win32' and __name__ == '__main__':
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 def print_banner():
     """Print banner"""
@@ -24,6 +28,8 @@ def print_banner():
 
 def load_credentials():
     """Load Instagram credentials from .env"""
+    from scraper.config import get_config
+    
     config = get_config()
     
     username = config.username or os.getenv('INSTAGRAM_USERNAME')
@@ -40,15 +46,11 @@ def load_credentials():
     
     return username, password
 
-def scrape_instagram(target_url, limit=5, headless=False):
+def scrape_instagram(target_url, limit=5, headless=False, use_cache=True, pretty=False,
+                     compress=False):
     """Scrape Instagram with better error handling"""
-    
-    # Set UTF-8 encoding for Windows console
-    import sys
-    if sys.platform == 'win32':
-        import io
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    # Selenium is only loaded once a scrape is started, not on import
+    from scraper.scrapers.instagram import InstagramScraper
     
     print(f"Target: {target_url}")
     print(f"Limit: {limit} posts")
@@ -78,48 +80,61 @@ def scrape_instagram(target_url, limit=5, headless=False):
     print()
     
     try:
+        # A result of the same target and limit from the last hour is
+        # reused instead of logging in and scraping again
         result = scraper.scrape(
             target_url=target_url,
             limit=limit,
-            authenticate=True
+            authenticate=True,
+            cache=ResultCache() if use_cache else None
         )
         
         # Save results
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_path = f"output/instagram_real_{timestamp}.json"
+        if compress:
+            output_path += ".zst"
         
         Path("output").mkdir(exist_ok=True)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        write_json(output_path, result, indent=pretty)
         
-        print()
-        print("=" * 70)
-        print("Scraping Completed Successfully!")
-        print("=" * 70)
-        print()
-        print(f"Output: {output_path}")
-        print(f"Posts scraped: {result['metadata']['total_posts']}")
-        print(f"Execution time: {result['metadata'].get('execution_time_ms', 0)}ms")
-        print()
+        # The report is collected and written with one print call
+        lines = [
+            "",
+            "=" * 70,
+            "Scraping Completed Successfully!",
+            "=" * 70,
+            "",
+            f"Output: {output_path}",
+            f"Posts scraped: {result['metadata']['total_posts']}",
+            f"Execution time: {result['metadata'].get('execution_time_ms', 0)}ms",
+            ""
+        ]
         
         # Show sample posts
         if result['posts']:
-            print("Sample Posts:")
-            print("-" * 70)
+            lines += ["Sample Posts:", "-" * 70]
             for i, post in enumerate(result['posts'][:3], 1):
-                print(f"{i}. @{post['author']}")
-                print(f"   {post['content'][:60]}...")
-                print(f"   Likes: {post['likes']} | Comments: {post['comments_count']}")
-                print()
+                content = post['content']
+                lines += [
+                    f"{i}. @{post['author']}",
+                    f"   {content[:60]}{'...' if len(content) > 60 else ''}",
+                    f"   Likes: {post['likes']} | Comments: {post['comments_count']}",
+                    ""
+                ]
         
-        print("Next Steps:")
-        print(f"1. Run sentiment analysis:")
-        print(f"   python -m sentiment.main_analyzer --input {output_path} --output {output_path.replace('.json', '_sentiment.json')}")
-        print()
-        print(f"2. View results:")
-        print(f"   python view_results.py {output_path.replace('.json', '_sentiment.json')}")
-        print()
+        sentiment_path = output_path.removesuffix('.zst').replace('.json', '_sentiment.json')
+        lines += [
+            "Next Steps:",
+            "1. Run sentiment analysis:",
+            f"   python -m sentiment.main_analyzer --input {output_path} --output {sentiment_path}",
+            "",
+            "2. View results:",
+            f"   python view_results.py {sentiment_path}",
+            ""
+        ]
+        print("\n".join(lines))
         
         return output_path
         
@@ -129,24 +144,26 @@ def scrape_instagram(target_url, limit=5, headless=False):
         return None
         
     except Exception as e:
-        print()
-        print("=" * 70)
-        print("ERROR: Scraping Failed")
-        print("=" * 70)
-        print()
-        print(f"Error: {str(e)}")
-        print()
-        print("Common Issues:")
-        print("1. Instagram detected automation - try again later")
-        print("2. Invalid credentials - check .env file")
-        print("3. 2FA enabled - disable temporarily")
-        print("4. Rate limiting - wait a few minutes")
-        print()
-        print("Troubleshooting:")
-        print("- Run with headless=False to see what's happening")
-        print("- Check logs in logs/ directory")
-        print("- Try demo mode: python demo_scraper.py")
-        print()
+        print("\n".join([
+            "",
+            "=" * 70,
+            "ERROR: Scraping Failed",
+            "=" * 70,
+            "",
+            f"Error: {str(e)}",
+            "",
+            "Common Issues:",
+            "1. Instagram detected automation - try again later",
+            "2. Invalid credentials - check .env file",
+            "3. 2FA enabled - disable temporarily",
+            "4. Rate limiting - wait a few minutes",
+            "",
+            "Troubleshooting:",
+            "- Run with headless=False to see what's happening",
+            "- Check logs in logs/ directory",
+            "- Try demo mode: python demo_scraper.py",
+            ""
+        ]))
         
         return None
 
@@ -159,16 +176,23 @@ def main():
     limit = 5
     headless = False  # Set to True for production
     
-    # Allow command line override
-    if len(sys.argv) > 1:
-        target_url = sys.argv[1]
-    if len(sys.argv) > 2:
-        limit = int(sys.argv[2])
-    if len(sys.argv) > 3:
-        headless = sys.argv[3].lower() == 'true'
+    # Allow command line override; --no-cache always scrapes,
+    # --pretty indents the output file for reading by hand and
+    # --compress writes it zstd-compressed (.json.zst)
+    flags = {'--no-cache', '--pretty', '--compress'}
+    args = [arg for arg in sys.argv[1:] if arg not in flags]
+    use_cache = '--no-cache' not in sys.argv[1:]
+    pretty = '--pretty' in sys.argv[1:]
+    compress = '--compress' in sys.argv[1:]
+    if len(args) > 0:
+        target_url = args[0]
+    if len(args) > 1:
+        limit = int(args[1])
+    if len(args) > 2:
+        headless = args[2].lower() == 'true'
     
     # Run scraper
-    result = scrape_instagram(target_url, limit, headless)
+    result = scrape_instagram(target_url, limit, headless, use_cache, pretty, compress)
     
     if result:
         print("=" * 70)
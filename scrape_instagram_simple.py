@@ -51,6 +51,9 @@ Basic usage:
 With options:
     python scrape_instagram_simple.py <profile_url> <limit> <headless> <scrape_comments> <comments_per_post>
 
+Set INSTAGRAM_SESSIONS (1-4, default 1) to scrape that many posts at once,
+each in its own browser logged in with the same session.
+
 Examples:
     # Scrape 5 posts with comments
     python scrape_instagram_simple.py https://www.instagram.com/username/ 5
@@ -132,6 +135,7 @@ DEPENDENCIES:
 - scraper.utils.anti_detection: Anti-detection utilities
 """
 
+import asyncio
 import os
 import sys
 import json
@@ -158,6 +162,73 @@ sys.path.insert(0, str(Path(__file__).parent))
 from scraper.config import get_config
 from scraper.utils.anti_detection import AntiDetection
 
+# Patterns used for every scraped post, compiled once at import
+# og:description counts, e.g. "1,234 likes, 56 comments - ..."
+OG_LIKES_RE = re.compile(r'([\d,.KkMm]+)\s*[Ll]ikes?')
+OG_COMMENTS_RE = re.compile(r'([\d,.KkMm]+)\s*[Cc]omments?')
+# og:description caption after 'YEAR: "' or 'Instagram: "'; may be truncated
+OG_CAPTION_RE = re.compile(r'(?:\d{4}|[Ii]nstagram):\s*["\u201c](.+)', re.DOTALL)
+
+# Embedded JSON in the page source
+CAPTION_TEXT_RE = re.compile(r'"caption"\s*:\s*\{[^}]*?"text"\s*:\s*"((?:[^"\\]|\\.){5,})"')
+CAPTION_PATTERNS = (
+    CAPTION_TEXT_RE,
+    re.compile(r'"edge_media_to_caption".*?"text"\s*:\s*"((?:[^"\\]|\\.){5,})"'),
+    re.compile(r'"accessibility_caption"\s*:\s*"((?:[^"\\]|\\.){10,})"'),
+)
+# Like and comment counts, each field in order of preference, found in
+# one pass over the page source: group 1-3 are likes, 4-6 comments. Each
+# alternative starts with its own key and cannot contain another's, so
+# the first match of every alternative is the same as searching for it
+# separately.
+COUNTS_RE = re.compile('|'.join((
+    r'"edge_media_preview_like"\s*:\s*\{"count"\s*:\s*(\d+)',
+    r'"like_count"\s*:\s*(\d+)',
+    r'"edge_liked_by"\s*:\s*\{"count"\s*:\s*(\d+)',
+    r'"edge_media_to_parent_comment"\s*:\s*\{"count"\s*:\s*(\d+)',
+    r'"edge_media_to_comment"\s*:\s*\{"count"\s*:\s*(\d+)',
+    r'"comment_count"\s*:\s*(\d+)',
+)))
+LIKE_GROUPS = (1, 2, 3)
+COMMENT_COUNT_GROUPS = (4, 5, 6)
+COMMENT_EDGES_PATTERNS = (
+    re.compile(r'"edge_media_to_parent_comment"\s*:\s*\{[^{]*?"edges"\s*:\s*\[(.+?)\]\s*,\s*"page_info"', re.DOTALL),
+    re.compile(r'"edge_media_to_comment"\s*:\s*\{[^{]*?"edges"\s*:\s*\[(.+?)\]\s*,\s*"page_info"', re.DOTALL),
+)
+COMMENT_NODE_RE = re.compile(r'"text"\s*:\s*"((?:[^"\\]|\\.)*)".*?"username"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Relative comment timestamps shown instead of text, e.g. "3d"
+RELATIVE_TIME_RE = re.compile(r'^\d+[hdwmy]$')
+FIRST_NUMBER_RE = re.compile(r'(\d+)')
+HASHTAG_RE = re.compile(r'#\w+')
+
+# Each WebDriver call is an HTTP round trip to the browser, so element
+# lookups that would otherwise go one element at a time run as one script.
+# Clicks the first element matched by the XPaths, tried in order; with
+# visibleOnly, hidden matches are skipped. Returns whether it clicked.
+CLICK_FIRST_XPATH_JS = """
+const [xpaths, visibleOnly] = arguments;
+for (const xpath of xpaths) {
+    const el = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (!el || (visibleOnly && el.offsetParent === null)) continue;
+    el.click();
+    return true;
+}
+return false;
+"""
+# Rendered text of the elements matched by each CSS selector, at most
+# arguments[1] per selector
+ELEMENT_TEXTS_JS = """
+const [selectors, maxPerSelector] = arguments;
+return selectors.map(selector =>
+    Array.from(document.querySelectorAll(selector))
+        .slice(0, maxPerSelector)
+        .map(el => el.innerText || '')
+);
+"""
+
 
 def shortcode_to_media_id(shortcode):
     """Convert an Instagram shortcode (from URL) to numeric media ID."""
@@ -523,10 +594,10 @@ def extract_post_data_from_page(driver, post_url='', post_author=''):
         desc = meta.get_attribute('content') or ''
         if desc:
             # Extract likes & comments from description
-            like_m = re.search(r'([\d,.KkMm]+)\s*[Ll]ikes?', desc)
+            like_m = OG_LIKES_RE.search(desc)
             if like_m:
                 result['likes'] = _parse_count(like_m.group(1))
-            comment_m = re.search(r'([\d,.KkMm]+)\s*[Cc]omments?', desc)
+            comment_m = OG_COMMENTS_RE.search(desc)
             if comment_m:
                 result['comments_count'] = _parse_count(comment_m.group(1))
                 og_reliable = True  # og:description explicitly reported count (even 0)
@@ -537,9 +608,7 @@ def extract_post_data_from_page(driver, post_url='', post_author=''):
             #   "N likes, M comments - user on Instagram: \"caption\""
             # Match: YEAR: "caption  OR  Instagram: "caption
             # Caption may be truncated (no closing quote) so don't require it
-            caption_match = re.search(
-                r'(?:\d{4}|[Ii]nstagram):\s*["\u201c](.+)', desc, re.DOTALL
-            )
+            caption_match = OG_CAPTION_RE.search(desc)
             if caption_match:
                 caption = caption_match.group(1).rstrip().rstrip('"').rstrip('\u201d')
                 if len(caption) > 3:
@@ -565,10 +634,7 @@ def extract_post_data_from_page(driver, post_url='', post_author=''):
             if shortcode_pos >= 0:
                 # Search only within a reasonable window after the shortcode
                 search_window = page_source[shortcode_pos:shortcode_pos + 2000]
-                caption_match = re.search(
-                    r'"caption"\s*:\s*\{[^}]*?"text"\s*:\s*"((?:[^"\\]|\\.){5,})"',
-                    search_window
-                )
+                caption_match = CAPTION_TEXT_RE.search(search_window)
                 if caption_match:
                     text = _safe_decode(caption_match.group(1))
                     if len(text) > 5:
@@ -576,45 +642,40 @@ def extract_post_data_from_page(driver, post_url='', post_author=''):
 
         # Fallback: generic caption patterns
         if not result['content']:
-            caption_patterns = [
-                r'"caption"\s*:\s*\{[^}]*?"text"\s*:\s*"((?:[^"\\]|\\.){5,})"',
-                r'"edge_media_to_caption".*?"text"\s*:\s*"((?:[^"\\]|\\.){5,})"',
-                r'"accessibility_caption"\s*:\s*"((?:[^"\\]|\\.){10,})"',
-            ]
-            for pattern in caption_patterns:
-                match = re.search(pattern, page_source)
+            for pattern in CAPTION_PATTERNS:
+                match = pattern.search(page_source)
                 if match:
                     text = _safe_decode(match.group(1))
                     if len(text) > 5:
                         result['content'] = text
                         break
 
-    if result['likes'] == 0:
-        like_patterns = [
-            r'"edge_media_preview_like"\s*:\s*\{"count"\s*:\s*(\d+)',
-            r'"like_count"\s*:\s*(\d+)',
-            r'"edge_liked_by"\s*:\s*\{"count"\s*:\s*(\d+)',
-        ]
-        for pattern in like_patterns:
-            match = re.search(pattern, page_source)
-            if match:
-                result['likes'] = int(match.group(1))
-                break
-
     # Only fallback to JSON for comments_count if og:description didn't provide it.
     # og:description is most reliable; JSON in page source can contain cached/stale data.
-    if result['comments_count'] == 0 and not og_reliable:
-        comment_count_patterns = [
-            r'"edge_media_to_parent_comment"\s*:\s*\{"count"\s*:\s*(\d+)',
-            r'"edge_media_to_comment"\s*:\s*\{"count"\s*:\s*(\d+)',
-            r'"comment_count"\s*:\s*(\d+)',
-        ]
-        for pattern in comment_count_patterns:
-            match = re.search(pattern, page_source)
-            if match:
-                result['comments_count'] = int(match.group(1))
+    need_likes = result['likes'] == 0
+    need_comments = result['comments_count'] == 0 and not og_reliable
+    if need_likes or need_comments:
+        # First value of each count pattern; the scan stops early once the
+        # preferred pattern of every needed field has been seen
+        counts = {}
+        for match in COUNTS_RE.finditer(page_source):
+            counts.setdefault(match.lastindex, match.group(match.lastindex))
+            if ((not need_likes or LIKE_GROUPS[0] in counts)
+                    and (not need_comments or COMMENT_COUNT_GROUPS[0] in counts)):
                 break
 
+        if need_likes:
+            for group in LIKE_GROUPS:
+                if group in counts:
+                    result['likes'] = int(counts[group])
+                    break
+
+        if need_comments:
+            for group in COMMENT_COUNT_GROUPS:
+                if group in counts:
+                    result['comments_count'] = int(counts[group])
+                    break
+
     # ── STRATEGY 3: DOM+JS scoped extraction ─────────────────────────
     # Uses JavaScript to find the caption tied to the post author,
     # scoped to the correct reel/post container (not other reels in feed)
@@ -716,16 +777,14 @@ def extract_post_data_from_page(driver, post_url='', post_author=''):
                 'section span a span',
                 'section span',
             ]
-            for selector in like_selectors:
-                try:
-                    elems = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elems:
-                        text = elem.text.strip().replace(',', '').replace('.', '')
-                        if text.isdigit() and int(text) > 0:
-                            result['likes'] = int(text)
-                            break
-                except Exception:
-                    continue
+            # All candidate texts in one call instead of one per element
+            texts_per_selector = driver.execute_script(ELEMENT_TEXTS_JS, like_selectors, 10000) or []
+            for texts in texts_per_selector:
+                for text in texts:
+                    text = text.strip().replace(',', '').replace('.', '')
+                    if text.isdigit() and int(text) > 0:
+                        result['likes'] = int(text)
+                        break
                 if result['likes'] > 0:
                     break
         except Exception:
@@ -736,6 +795,10 @@ def extract_post_data_from_page(driver, post_url='', post_author=''):
 COOKIE_DIR = Path(__file__).parent / "cookies"
 COOKIE_FILE = COOKIE_DIR / "instagram_cookies.json"
 
+# Upper limit of concurrent browser sessions (INSTAGRAM_SESSIONS); more
+# parallel requests from one account get it rate limited or blocked
+MAX_SESSIONS = 4
+
 
 def setup_driver(headless=False):
     """Setup Chrome driver"""
@@ -765,6 +828,21 @@ def save_cookies(driver, username):
     print(f"  🍪 Cookies saved ({len(cookies)} cookies)")
 
 
+def add_cookies(driver, cookies):
+    """Inject saved or copied cookies into a driver on instagram.com."""
+    for cookie in cookies:
+        # Selenium doesn't accept 'expiry' as float, and some fields
+        # may cause issues, so clean up
+        clean = {k: v for k, v in cookie.items()
+                 if k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')}
+        if 'expiry' in cookie:
+            clean['expiry'] = int(cookie['expiry'])
+        try:
+            driver.add_cookie(clean)
+        except Exception:
+            continue
+
+
 def load_cookies(driver, username):
     """
     Load cookies from file and verify the session is still valid.
@@ -792,17 +870,7 @@ def load_cookies(driver, username):
         time.sleep(2)
 
         # Inject cookies
-        for cookie in cookies:
-            # Selenium doesn't accept 'expiry' as float, and some fields
-            # may cause issues, so clean up
-            clean = {k: v for k, v in cookie.items()
-                     if k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly')}
-            if 'expiry' in cookie:
-                clean['expiry'] = int(cookie['expiry'])
-            try:
-                driver.add_cookie(clean)
-            except Exception:
-                continue
+        add_cookies(driver, cookies)
 
         # Reload page with cookies applied
         driver.get("https://www.instagram.com/")
@@ -970,6 +1038,32 @@ def login_instagram(driver, username, password):
     print("  ✓ Password login successful!")
     return True
 
+def clone_session(driver, headless=False):
+    """
+    Start another Chrome logged in with the session of an existing driver.
+
+    The cookies of the logged-in driver are copied instead of logging in
+    again. Chrome locks its profile directory, so the sessions cannot
+    share a --user-data-dir.
+
+    Args:
+        driver: Selenium WebDriver instance with an active Instagram session
+        headless: Whether to run the new browser headless
+
+    Returns:
+        New WebDriver instance with the same Instagram session
+    """
+    session = setup_driver(headless)
+    try:
+        # Cookies can only be set for the domain of the current page
+        session.get("https://www.instagram.com/")
+        add_cookies(session, driver.get_cookies())
+    except Exception:
+        session.quit()
+        raise
+    return session
+
+
 def scrape_comments_from_post_dom(driver, post_url, post_type='post', limit=20):
     """
     Strategy 2: DOM-based comment extraction with scrolling and JS extraction.
@@ -1012,15 +1106,12 @@ def scrape_comments_from_post_dom(driver, post_url, post_type='post', limit=20):
             "//button[contains(., 'Lihat semua')]",
         ]
 
-        for selector in view_all_selectors:
-            try:
-                view_all_btn = driver.find_element(By.XPATH, selector)
-                driver.execute_script("arguments[0].click();", view_all_btn)
+        try:
+            if driver.execute_script(CLICK_FIRST_XPATH_JS, view_all_selectors, False):
                 print(f"  ✓ Clicked 'View all comments'")
                 time.sleep(4)
-                break
-            except Exception:
-                continue
+        except Exception:
+            pass
 
         # Identify the scrollable comment container ONCE before the loop.
         # Instagram 2026 uses a scrollable div panel for comments (especially reels).
@@ -1602,17 +1693,12 @@ def scrape_comments_from_post_json(driver, post_url, limit=20):
         page_source = driver.page_source
 
         # ── Strategy 1: Extract from page source JSON ────────────────
-        comment_json_patterns = [
-            r'"edge_media_to_parent_comment"\s*:\s*\{[^{]*?"edges"\s*:\s*\[(.+?)\]\s*,\s*"page_info"',
-            r'"edge_media_to_comment"\s*:\s*\{[^{]*?"edges"\s*:\s*\[(.+?)\]\s*,\s*"page_info"',
-        ]
-        for pattern in comment_json_patterns:
-            match = re.search(pattern, page_source, re.DOTALL)
+        for pattern in COMMENT_EDGES_PATTERNS:
+            match = pattern.search(page_source)
             if match:
                 edges_str = match.group(1)
                 # Match pairs of text + username in each comment node
-                node_pattern = r'"text"\s*:\s*"((?:[^"\\]|\\.)*)".*?"username"\s*:\s*"((?:[^"\\]|\\.)*)"'
-                for cm in re.finditer(node_pattern, edges_str):
+                for cm in COMMENT_NODE_RE.finditer(edges_str):
                     text = _safe_decode(cm.group(1))
                     author = cm.group(2)
                     if text and len(text) >= 2:
@@ -1640,19 +1726,9 @@ def scrape_comments_from_post_json(driver, post_url, limit=20):
                         '//span[contains(text(), "Lihat semua")]',
                         '//a[contains(text(), "Lihat semua")]',
                     ]
-                    clicked = False
-                    for selector in load_more_selectors:
-                        try:
-                            btn = driver.find_element(By.XPATH, selector)
-                            if btn.is_displayed():
-                                driver.execute_script("arguments[0].click();", btn)
-                                time.sleep(3)
-                                clicked = True
-                                break
-                        except Exception:
-                            continue
-                    if not clicked:
+                    if not driver.execute_script(CLICK_FIRST_XPATH_JS, load_more_selectors, True):
                         break
+                    time.sleep(3)
                 except Exception:
                     break
 
@@ -1669,14 +1745,21 @@ def scrape_comments_from_post_json(driver, post_url, limit=20):
             seen_texts = set()
             skip_words = {'Reply', 'Replies', 'View replies', 'Liked by', 'See translation'}
 
-            for selector in comment_container_selectors:
+            # Texts of all candidate elements in one call instead of one per element
+            try:
+                texts_per_selector = driver.execute_script(
+                    ELEMENT_TEXTS_JS, comment_container_selectors, limit * 3
+                ) or []
+            except Exception:
+                texts_per_selector = []
+
+            for texts in texts_per_selector:
                 try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if not elements:
+                    if not texts:
                         continue
-                    for elem in elements[:limit * 3]:
+                    for full_text in texts:
                         try:
-                            full_text = elem.text.strip()
+                            full_text = full_text.strip()
                             if not full_text or len(full_text) < 3:
                                 continue
                             lines = [l.strip() for l in full_text.split('\n') if l.strip()]
@@ -1688,7 +1771,7 @@ def scrape_comments_from_post_json(driver, post_url, limit=20):
 
                             if comment_text in seen_texts or len(comment_text) < 3:
                                 continue
-                            if re.match(r'^\d+[hdwmy]$', comment_text) or comment_text in skip_words:
+                            if RELATIVE_TIME_RE.match(comment_text) or comment_text in skip_words:
                                 continue
                             if comment_text == author:
                                 continue
@@ -1698,7 +1781,7 @@ def scrape_comments_from_post_json(driver, post_url, limit=20):
                             likes = 0
                             for line in lines:
                                 if 'like' in line.lower() or 'suka' in line.lower():
-                                    m = re.search(r'(\d+)', line)
+                                    m = FIRST_NUMBER_RE.search(line)
                                     if m:
                                         likes = int(m.group(1))
                                         break
@@ -1726,7 +1809,159 @@ def scrape_comments_from_post_json(driver, post_url, limit=20):
     return comments
 
 
-def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, comments_per_post=20):
+def scrape_post(driver, post_id, post_url, post_type, profile_url, profile_username,
+                scrape_comments=True, comments_per_post=20, index=1, total=1):
+    """
+    Scrape one post or reel of a profile.
+
+    Args:
+        driver: Selenium WebDriver instance with an active Instagram session
+        post_id: Shortcode of the post/reel
+        post_url: Full URL of the post/reel
+        post_type: Either 'post' or 'reel'
+        profile_url: Full URL of the profile the post belongs to
+        profile_username: Lowercase username of the profile
+        scrape_comments: Whether to extract actual comment text (default: True)
+        comments_per_post: Max comments to extract if scraping enabled (default: 20)
+        index: Position of the post, for progress output
+        total: Number of posts being scraped, for progress output
+
+    Returns:
+        dict: Post/reel object as described in scrape_profile_simple(), or
+            None if the post could not be scraped
+    """
+    post_data = None
+    try:
+        print(f"\n📄 {post_type.capitalize()} {index}/{total}: {post_id}")
+
+        # Force clean navigation: go to blank page first to clear SPA state,
+        # then navigate to the actual post URL. This prevents stale meta tags
+        # and page source from the previous post/reel.
+        driver.get('about:blank')
+        time.sleep(0.5)
+        driver.get(post_url)
+        time.sleep(4)
+
+        # For reels: scroll to top to ensure target reel is in view
+        # (Instagram reel feed can auto-scroll to different reels)
+        if post_type == 'reel':
+            driver.execute_script("window.scrollTo(0, 0);")
+            time.sleep(1)
+
+        # Verify we're on the right page
+        current_url = driver.current_url
+        if post_id not in current_url:
+            print(f"  ⚠ URL mismatch, retrying: {current_url}")
+            driver.get(post_url)
+            time.sleep(4)
+
+        # Extract post data using multi-strategy extraction
+        post_info = extract_post_data_from_page(driver, post_url, profile_username)
+        content = post_info['content']
+        likes = post_info['likes']
+
+        # Extract hashtags from content
+        hashtags = HASHTAG_RE.findall(content) if content else []
+
+        # Create post data
+        post_data = {
+            'post_id': post_id,
+            'post_type': post_type,
+            'post_url': post_url,
+            'author': profile_url.split('/')[-2],
+            'content': content or f"Post {post_id}",
+            'timestamp': datetime.now().isoformat() + 'Z',
+            'likes': likes,
+            'comments_count': post_info['comments_count'],
+            'comments': None,
+            'hashtags': hashtags,
+            'scraped_at': datetime.now().isoformat() + 'Z'
+        }
+
+        # ═══════════════════════════════════════════════════════════════
+        # COMMENT EXTRACTION WITH 3-STRATEGY FALLBACK
+        # ═══════════════════════════════════════════════════════════════
+        # If comment scraping is enabled, we use a robust 3-strategy approach
+        # to extract actual comment text. The scrape_comments_from_post()
+        # function will automatically try:
+        #
+        # 1. JSON parsing from page source (fastest)
+        # 2. DOM extraction with WebDriverWait (most comprehensive)
+        # 3. JavaScript execution fallback (most resilient)
+        #
+        # Each strategy is independent with its own error handling. If one
+        # fails, the next is tried automatically. This ensures we can extract
+        # comments even when Instagram changes their page structure.
+        #
+        # The post_type parameter helps with logging and debugging.
+        # ═══════════════════════════════════════════════════════════════
+        if scrape_comments:
+            # Always try scraping comments when enabled - comments_count from
+            # meta/JSON can be inaccurate (stale or 0 even when comments exist)
+            comments = scrape_comments_from_post(driver, post_url, post_type, limit=comments_per_post)
+            if comments:
+                post_data['comments'] = comments
+                post_data['comments_count'] = max(post_data['comments_count'], len(comments))
+            else:
+                post_data['comments'] = None
+        else:
+            post_data['comments'] = None
+
+        actual = len(post_data['comments']) if post_data['comments'] else 0
+        print(f"  ✓ Scraped post with {actual} comments")
+
+        # Return to profile for next post
+        driver.get(profile_url)
+        time.sleep(2)
+
+    except Exception as e:
+        print(f"  ✗ Error processing post: {e}")
+
+    return post_data
+
+
+async def scrape_posts_concurrently(drivers, post_urls, profile_url, profile_username,
+                                    scrape_comments=True, comments_per_post=20):
+    """
+    Scrape posts with several browser sessions at once.
+
+    Loading a post is mostly waiting for the network, so with N sessions
+    about N posts are in flight at a time. A WebDriver must not be used by
+    two threads at once, so each post waits for an idle session and runs
+    scrape_post() with it in a worker thread.
+
+    Args:
+        drivers: WebDriver instances sharing the Instagram session
+        post_urls: (post_id, post_url, post_type) tuples to scrape
+        profile_url: Full URL of the profile the posts belong to
+        profile_username: Lowercase username of the profile
+        scrape_comments: Whether to extract actual comment text (default: True)
+        comments_per_post: Max comments to extract per post if scraping enabled (default: 20)
+
+    Returns:
+        list: Result of scrape_post() for each post, in the order of post_urls
+    """
+    idle_drivers = asyncio.Queue()
+    for driver in drivers:
+        idle_drivers.put_nowait(driver)
+
+    async def scrape_post_async(index, post_id, post_url, post_type):
+        driver = await idle_drivers.get()
+        try:
+            return await asyncio.to_thread(
+                scrape_post, driver, post_id, post_url, post_type, profile_url, profile_username,
+                scrape_comments, comments_per_post, index, len(post_urls)
+            )
+        finally:
+            idle_drivers.put_nowait(driver)
+
+    return await asyncio.gather(*(
+        scrape_post_async(index, *post) for index, post in enumerate(post_urls, 1)
+    ))
+
+
+def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, comments_per_post=20,
+                          extra_drivers=()):
     """
     Scrape Instagram profile with support for both posts and reels.
     
@@ -1749,6 +1984,8 @@ def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, co
         limit: Maximum number of posts/reels to scrape (default: 5)
         scrape_comments: Whether to extract actual comment text (default: True)
         comments_per_post: Max comments to extract per post if scraping enabled (default: 20)
+        extra_drivers: More WebDriver instances with the same session (see
+            clone_session()); posts are then scraped concurrently
     
     Returns:
         list: Array of post/reel objects, each containing:
@@ -1774,8 +2011,6 @@ def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, co
     driver.get(profile_url)
     time.sleep(3)
 
-    posts = []
-
     # Scroll down to load more posts (Instagram uses lazy loading)
     # We need to scroll multiple times to ensure we have enough posts
     print("📸 Finding posts and reels...")
@@ -1790,9 +2025,11 @@ def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, co
         driver.execute_script(f"window.scrollTo(0, {scroll_increment * (scroll_attempt + 1)});")
         time.sleep(2)  # Wait for content to load
         
-        # Count current posts
-        post_links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/p/"], a[href*="/reel/"]')
-        current_count = len(post_links)
+        # Count current posts; only the number is needed here, so the
+        # browser counts them instead of returning every element
+        current_count = driver.execute_script(
+            "return document.querySelectorAll('a[href*=\"/p/\"], a[href*=\"/reel/\"]').length;"
+        )
         
         # Check if we found new posts
         if current_count > last_post_count:
@@ -1830,12 +2067,17 @@ def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, co
     # Scan more links to handle pinned + dupes (Instagram grid can have 2-3 <a> per cell)
     scan_limit = max(limit * 5, 30)
 
-    for link in post_links[:scan_limit]:
+    # All hrefs in one call instead of one get_attribute() per link
+    scanned_links = post_links[:scan_limit]
+    hrefs = driver.execute_script(
+        "return arguments[0].map(a => a.getAttribute('href') && a.href);", scanned_links
+    ) if scanned_links else []
+
+    for link, href in zip(scanned_links, hrefs):
         if len(post_urls) >= limit:
             break
 
         try:
-            href = link.get_attribute('href')
             if not href:
                 continue
 
@@ -1875,97 +2117,22 @@ def scrape_profile_simple(driver, profile_url, limit=5, scrape_comments=True, co
 
     print(f"📋 Will scrape {len(post_urls)} unique post(s)")
 
-    # Process each post
-    for i, (post_id, post_url, post_type) in enumerate(post_urls, 1):
-        try:
-            print(f"\n📄 {post_type.capitalize()} {i}/{len(post_urls)}: {post_id}")
-
-            # Force clean navigation: go to blank page first to clear SPA state,
-            # then navigate to the actual post URL. This prevents stale meta tags
-            # and page source from the previous post/reel.
-            driver.get('about:blank')
-            time.sleep(0.5)
-            driver.get(post_url)
-            time.sleep(4)
-
-            # For reels: scroll to top to ensure target reel is in view
-            # (Instagram reel feed can auto-scroll to different reels)
-            if post_type == 'reel':
-                driver.execute_script("window.scrollTo(0, 0);")
-                time.sleep(1)
-
-            # Verify we're on the right page
-            current_url = driver.current_url
-            if post_id not in current_url:
-                print(f"  ⚠ URL mismatch, retrying: {current_url}")
-                driver.get(post_url)
-                time.sleep(4)
-
-            # Extract post data using multi-strategy extraction
-            post_info = extract_post_data_from_page(driver, post_url, profile_username)
-            content = post_info['content']
-            likes = post_info['likes']
-
-            # Extract hashtags from content
-            hashtags = re.findall(r'#\w+', content) if content else []
-
-            # Create post data
-            post_data = {
-                'post_id': post_id,
-                'post_type': post_type,
-                'post_url': post_url,
-                'author': profile_url.split('/')[-2],
-                'content': content or f"Post {post_id}",
-                'timestamp': datetime.now().isoformat() + 'Z',
-                'likes': likes,
-                'comments_count': post_info['comments_count'],
-                'comments': None,
-                'hashtags': hashtags,
-                'scraped_at': datetime.now().isoformat() + 'Z'
-            }
-
-            # ═══════════════════════════════════════════════════════════════
-            # COMMENT EXTRACTION WITH 3-STRATEGY FALLBACK
-            # ═══════════════════════════════════════════════════════════════
-            # If comment scraping is enabled, we use a robust 3-strategy approach
-            # to extract actual comment text. The scrape_comments_from_post()
-            # function will automatically try:
-            #
-            # 1. JSON parsing from page source (fastest)
-            # 2. DOM extraction with WebDriverWait (most comprehensive)
-            # 3. JavaScript execution fallback (most resilient)
-            #
-            # Each strategy is independent with its own error handling. If one
-            # fails, the next is tried automatically. This ensures we can extract
-            # comments even when Instagram changes their page structure.
-            #
-            # The post_type parameter helps with logging and debugging.
-            # ═══════════════════════════════════════════════════════════════
-            if scrape_comments:
-                # Always try scraping comments when enabled - comments_count from
-                # meta/JSON can be inaccurate (stale or 0 even when comments exist)
-                comments = scrape_comments_from_post(driver, post_url, post_type, limit=comments_per_post)
-                if comments:
-                    post_data['comments'] = comments
-                    post_data['comments_count'] = max(post_data['comments_count'], len(comments))
-                else:
-                    post_data['comments'] = None
-            else:
-                post_data['comments'] = None
-
-            posts.append(post_data)
-            actual = len(post_data['comments']) if post_data['comments'] else 0
-            print(f"  ✓ Scraped post with {actual} comments")
-
-            # Return to profile for next post
-            driver.get(profile_url)
-            time.sleep(2)
-
-        except Exception as e:
-            print(f"  ✗ Error processing post: {e}")
-            continue
+    # Process each post; with more than one session the posts are
+    # scraped concurrently
+    drivers = [driver, *extra_drivers]
+    if len(drivers) > 1:
+        print(f"⚡ Scraping with {len(drivers)} browser sessions")
+        results = asyncio.run(scrape_posts_concurrently(
+            drivers, post_urls, profile_url, profile_username, scrape_comments, comments_per_post
+        ))
+    else:
+        results = [
+            scrape_post(driver, post_id, post_url, post_type, profile_url, profile_username,
+                        scrape_comments, comments_per_post, i, len(post_urls))
+            for i, (post_id, post_url, post_type) in enumerate(post_urls, 1)
+        ]
 
-    return posts
+    return [post for post in results if post is not None]
 
 def main():
     """Main function"""
@@ -2004,15 +2171,21 @@ def main():
     if len(sys.argv) > 5:
         comments_per_post = int(sys.argv[5])
 
+    # Browser sessions scraping posts at once
+    sessions = min(max(int(os.getenv('INSTAGRAM_SESSIONS', '1')), 1), MAX_SESSIONS)
+
     print(f"🎯 Target: {target_url}")
     print(f"📊 Limit: {limit} posts")
     print(f"🖥️  Headless: {headless}")
     print(f"💬 Scrape Comments: {scrape_comments}")
     if scrape_comments:
         print(f"📝 Comments per post: {'all' if comments_per_post >= 9999 else comments_per_post}")
+    if sessions > 1:
+        print(f"⚡ Browser sessions: {sessions}")
     print()
     
     driver = None
+    extra_drivers = []
     try:
         # Setup driver
         print("🚀 Starting Chrome...")
@@ -2021,8 +2194,14 @@ def main():
         # Login
         login_instagram(driver, username, password)
 
+        # More browsers for scraping posts concurrently, logged in with
+        # the cookies of the first one
+        for _ in range(sessions - 1):
+            extra_drivers.append(clone_session(driver, headless))
+
         # Scrape
-        posts = scrape_profile_simple(driver, target_url, limit, scrape_comments, comments_per_post)
+        posts = scrape_profile_simple(driver, target_url, limit, scrape_comments, comments_per_post,
+                                      extra_drivers)
         
         # Save results with hybrid output (JSON + CSV)
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -2141,6 +2320,8 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        for extra_driver in extra_drivers:
+            extra_driver.quit()
         if driver:
             print("\n🔒 Closing browser...")
             driver.quit()
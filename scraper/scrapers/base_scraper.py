@@ -14,7 +14,7 @@ Validates: Requirements 1.1, 1.8, 11.1, 11.5
 import time
 import traceback
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -29,6 +29,7 @@ from selenium.common.exceptions import (
 from scraper.utils.rate_limiter import RateLimiter
 from scraper.utils.anti_detection import AntiDetection
 from scraper.utils.logger import get_logger
+from scraper.utils.result_cache import ResultCache
 
 
 class ScraperError(Exception):
@@ -118,6 +119,12 @@ class BaseScraper(ABC):
         self.posts_scraped: int = 0
         self.errors_encountered: int = 0
         
+        # Called with each post as it is scraped (set by scrape())
+        self.on_post: Optional[Callable[[Dict[str, Any]], None]] = None
+        
+        # Whether the current WebDriver session is logged in
+        self.authenticated: bool = False
+        
         self.logger.info(
             f"Initialized {self.__class__.__name__} with rate_limit={rate_limit}, "
             f"timeout={timeout}s, headless={headless}, max_retries={max_retries}"
@@ -355,11 +362,34 @@ class BaseScraper(ABC):
         """
         pass
     
+    @property
+    def platform_name(self) -> str:
+        """Platform name used in results, e.g. 'instagram' for InstagramScraper."""
+        return self.__class__.__name__.replace('Scraper', '').lower()
+    
+    def add_post(self, posts: List[Dict[str, Any]], post_data: Dict[str, Any]) -> None:
+        """
+        Record a scraped post.
+        
+        Platform scrape_posts() implementations call this for every post
+        they extract, so that the on_post callback given to scrape() sees
+        each post as soon as it is scraped.
+        
+        Args:
+            posts: List of posts scraped so far
+            post_data: Newly scraped post
+        """
+        posts.append(post_data)
+        if self.on_post is not None:
+            self.on_post(post_data)
+    
     def scrape(
         self,
         target_url: str,
         limit: int = 100,
-        authenticate: bool = True
+        authenticate: bool = True,
+        on_post: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cache: Optional[ResultCache] = None
     ) -> Dict[str, Any]:
         """
         Main scraping workflow with error handling.
@@ -371,10 +401,26 @@ class BaseScraper(ABC):
         4. Handle errors gracefully
         5. Cleanup resources
         
+        A WebDriver that is already running, started with setup_driver()
+        before the call, is used as is and left open, together with its
+        login. Consecutive scrape() calls then share one browser session,
+        with its cookies and open connections, instead of starting Chrome
+        and logging in again for every target:
+        
+            with InstagramScraper(credentials) as scraper:
+                scraper.setup_driver()
+                for url in urls:
+                    results.append(scraper.scrape(url))
+        
         Args:
             target_url: URL to scrape
             limit: Maximum number of posts to scrape
             authenticate: Whether to authenticate before scraping
+            on_post: Optional callback called with each post as soon as it
+                is scraped, e.g. to write it out before the run finishes
+            cache: Optional result cache. A stored result for the same
+                target and limit is returned without scraping (on_post is
+                called with its posts); a new result is stored in it
         
         Returns:
             Dictionary with metadata and scraped posts:
@@ -393,15 +439,32 @@ class BaseScraper(ABC):
         Raises:
             ScraperError: If scraping fails critically
         """
+        if cache is not None:
+            cache_key = cache.key(self.platform_name, target_url, limit)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"Using cached result for {target_url}")
+                if on_post is not None:
+                    for post in cached['posts']:
+                        on_post(post)
+                return cached
+        
         self.start_time = time.time()
+        self.on_post = on_post
         posts = []
         
+        # Only a driver started here is closed here
+        owns_driver = self.driver is None
+        
         try:
             # Setup WebDriver
-            self.setup_driver()
+            if owns_driver:
+                self.setup_driver()
             
             # Authenticate if required
-            if authenticate:
+            if authenticate and self.authenticated:
+                self.logger.info("Reusing authenticated session")
+            elif authenticate:
                 if not self.credentials.get('username') or not self.credentials.get('password'):
                     self.logger.warning("No credentials provided, skipping authentication")
                 else:
@@ -414,6 +477,7 @@ class BaseScraper(ABC):
                     if not auth_success:
                         raise AuthenticationError("Authentication failed")
                     
+                    self.authenticated = True
                     self.logger.info("Authentication successful")
             
             # Scrape posts
@@ -448,8 +512,10 @@ class BaseScraper(ABC):
             raise ScraperError(f"Scraping failed: {e}")
             
         finally:
-            # Always cleanup
-            self.close()
+            # Always cleanup, unless the caller manages the driver
+            self.on_post = None
+            if owns_driver:
+                self.close()
         
         # Calculate execution time
         execution_time_ms = int((time.time() - self.start_time) * 1000)
@@ -457,7 +523,7 @@ class BaseScraper(ABC):
         # Build result with metadata
         result = {
             'metadata': {
-                'platform': self.__class__.__name__.replace('Scraper', '').lower(),
+                'platform': self.platform_name,
                 'scraped_at': datetime.utcnow().isoformat() + 'Z',
                 'target_url': target_url,
                 'total_posts': len(posts),
@@ -467,8 +533,80 @@ class BaseScraper(ABC):
             'posts': posts
         }
         
+        if cache is not None:
+            cache.set(cache_key, result)
+        
         return result
     
+    def scrape_many(
+        self,
+        target_urls: List[str],
+        limit: int = 100,
+        authenticate: bool = True,
+        on_post: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cache: Optional[ResultCache] = None
+    ) -> Dict[str, Any]:
+        """
+        Scrape several targets in one browser session.
+        
+        Starts the WebDriver and logs in once, then scrapes each target in
+        turn with scrape(), so the login, cookies and rate limiter are
+        shared by all of them. A driver that was already running is left
+        open, like in scrape().
+        
+        Args:
+            target_urls: URLs to scrape, in order
+            limit: Maximum number of posts to scrape per target
+            authenticate: Whether to authenticate before scraping
+            on_post: Optional callback called with each post as soon as it
+                is scraped
+            cache: Optional result cache, used per target like in scrape();
+                no browser is started when every target is cached
+        
+        Returns:
+            Dictionary in the format of scrape(), with the posts of all
+            targets. metadata['target_url'] lists the targets separated by
+            commas, and metadata['targets'] holds the metadata of each
+            target's scrape() result.
+        
+        Raises:
+            ScraperError: If scraping a target fails critically
+        """
+        start_time = time.time()
+        owns_driver = self.driver is None and (
+            cache is None or not all(
+                cache.key(self.platform_name, target_url, limit) in cache
+                for target_url in target_urls
+            )
+        )
+        results = []
+        
+        try:
+            if owns_driver:
+                self.setup_driver()
+            
+            for target_url in target_urls:
+                results.append(
+                    self.scrape(target_url, limit, authenticate, on_post, cache)
+                )
+        finally:
+            if owns_driver:
+                self.close()
+        
+        posts = [post for result in results for post in result['posts']]
+        return {
+            'metadata': {
+                'platform': self.platform_name,
+                'scraped_at': datetime.utcnow().isoformat() + 'Z',
+                'target_url': ', '.join(target_urls),
+                'total_posts': len(posts),
+                'execution_time_ms': int((time.time() - start_time) * 1000),
+                'errors_encountered': self.errors_encountered,
+                'targets': [result['metadata'] for result in results]
+            },
+            'posts': posts
+        }
+    
     def close(self) -> None:
         """
         Clean up resources and close WebDriver.
@@ -481,6 +619,7 @@ class BaseScraper(ABC):
                 self.logger.info("Closing WebDriver...")
                 self.driver.quit()
                 self.driver = None
+                self.authenticated = False
                 self.logger.info("WebDriver closed successfully")
             except Exception as e:
                 self.logger.warning(f"Error closing WebDriver: {e}")
@@ -297,7 +297,7 @@ class FacebookScraper(BaseScraper):
                         seen_post_ids.add(post_id)
                         new_posts_found = True
                         
-                        posts.append(post_data)
+                        self.add_post(posts, post_data)
                         self.logger.info(f"Scraped post {len(posts)}/{limit}: {post_id}")
                         
                     except StaleElementReferenceException:
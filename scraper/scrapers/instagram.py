@@ -417,7 +417,7 @@ class InstagramScraper(BaseScraper):
                         post_data = self._extract_post_data_from_feed(link, post_id, post_url)
                         
                         if post_data:
-                            posts.append(post_data)
+                            self.add_post(posts, post_data)
                             self.logger.info(f"Scraped post {len(posts)}/{limit}: {post_id}")
                         
                     except StaleElementReferenceException:
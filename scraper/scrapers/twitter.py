@@ -285,7 +285,7 @@ class TwitterScraper(BaseScraper):
                         seen_post_ids.add(post_id)
                         new_posts_found = True
                         
-                        posts.append(tweet_data)
+                        self.add_post(posts, tweet_data)
                         self.logger.info(f"Scraped tweet {len(posts)}/{limit}: {post_id}")
                         
                     except StaleElementReferenceException:
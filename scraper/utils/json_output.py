@@ -0,0 +1,157 @@
+"""
+JSON output files for scrape results.
+
+Scrape results are written once, after the whole run, and are held in
+memory at that point. They are encoded into a single bytes object and
+written through a large buffer, instead of json.dump issuing a small
+write for every token of the indented document. JsonLinesWriter instead
+writes posts one line at a time while a scrape is running.
+
+Paths ending in .zst are written and read zstd-compressed; the repeated
+keys of large results shrink several times over. This needs the
+zstandard package.
+
+Requirements:
+- 1.5: Output scraped data in JSON format
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional faster JSON encoder
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, only needed for .zst files
+    zstandard = None
+
+# Buffer size of output files; results up to this size take one write call
+WRITE_BUFFER_SIZE = 1 << 20
+
+# zstd level of compressed results; fast, with most of the size reduction
+ZSTD_LEVEL = 3
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """
+    Encode data as UTF-8 JSON.
+
+    Uses orjson when it is installed. Non-ASCII text is written as is,
+    like json.dump(..., ensure_ascii=False). Values orjson cannot encode,
+    such as integers beyond 64 bits, fall back to the json module.
+
+    Args:
+        data: JSON-serializable data
+        indent: Indent nested values by two spaces
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            )
+        except TypeError:
+            pass
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False
+    ).encode('utf-8')
+
+
+def _require_zstandard(path: Union[str, Path]) -> None:
+    if zstandard is None:
+        raise ImportError(f"zstandard is required for compressed file {path}")
+
+
+def write_json(path: Union[str, Path], data: Any, indent: bool = True) -> None:
+    """
+    Write data to a JSON file in a single buffered write.
+
+    Args:
+        path: Output file path; its directory must exist. A .zst suffix
+            writes the file zstd-compressed.
+        data: JSON-serializable data
+        indent: Indent nested values by two spaces
+
+    Raises:
+        ImportError: If path ends in .zst and zstandard is not installed
+    """
+    encoded = dumps_json(data, indent=indent)
+    if str(path).endswith('.zst'):
+        _require_zstandard(path)
+        encoded = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(encoded)
+    with open(path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(encoded)
+
+
+def read_json(path: Union[str, Path]) -> Any:
+    """
+    Read a JSON file written by write_json.
+
+    Args:
+        path: File path; a .zst suffix reads the file zstd-compressed
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        ImportError: If path ends in .zst and zstandard is not installed
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if str(path).endswith('.zst'):
+        _require_zstandard(path)
+        # stream_reader copes with frames that do not record their size
+        raw = zstandard.ZstdDecompressor().stream_reader(raw).read()
+    # json rather than orjson, which would turn integers beyond 64 bits
+    # into floats
+    return json.loads(raw)
+
+
+class JsonLinesWriter:
+    """
+    Write records to a JSON Lines file as they arrive.
+
+    Each record is encoded compactly on its own line and goes through
+    the same large buffer as write_json, so scraped posts reach the file
+    while the scrape is still running instead of all at the end.
+
+    Usage:
+        with JsonLinesWriter('output/posts.jsonl') as writer:
+            result = scraper.scrape(url, on_post=writer.write)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Output file path; its directory must exist
+        """
+        self.path = path
+        self.records_written = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        return self
+
+    def write(self, record: Any) -> None:
+        """
+        Append one record as a line.
+
+        Args:
+            record: JSON-serializable data
+        """
+        self._file.write(dumps_json(record, indent=False) + b'\n')
+        self.records_written += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._file.close()
+        self._file = None
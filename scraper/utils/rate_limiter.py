@@ -28,7 +28,7 @@ class RateLimiter:
         _tokens (float): Current number of tokens in the bucket
         _max_tokens (float): Maximum capacity of the bucket
         _refill_rate (float): Rate at which tokens are added (tokens per second)
-        _last_refill (float): Timestamp of last token refill
+        _last_refill (float): time.monotonic() reading of last token refill
         _lock (threading.Lock): Thread lock for thread-safe operations
     """
     
@@ -52,7 +52,7 @@ class RateLimiter:
         self._max_tokens = float(requests_per_minute)
         self._tokens = float(requests_per_minute)  # Start with full bucket
         self._refill_rate = requests_per_minute / 60.0  # tokens per second
-        self._last_refill = time.time()
+        self._last_refill = time.monotonic()
         
         # Thread safety
         self._lock = threading.Lock()
@@ -62,9 +62,12 @@ class RateLimiter:
         Refill tokens based on elapsed time since last refill.
         
         This method is called internally before each token acquisition to ensure
-        the bucket is up-to-date with the current time.
+        the bucket is up-to-date with the current time. Tokens are computed from
+        the elapsed time rather than added by a timer, so an acquire with tokens
+        available never sleeps. The monotonic clock keeps wall clock adjustments
+        from emptying or overfilling the bucket.
         """
-        now = time.time()
+        now = time.monotonic()
         elapsed = now - self._last_refill
         
         # Calculate tokens to add based on elapsed time
@@ -97,7 +100,19 @@ class RateLimiter:
         if timeout is not None and timeout < 0:
             raise ValueError("timeout must be non-negative")
         
-        start_time = time.time()
+        if not blocking:
+            # Fast path: refill inline and take a token if there is one,
+            # without the wait loop or the _refill_tokens() call
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._max_tokens,
+                                   self._tokens + (now - self._last_refill) * self._refill_rate)
+                self._last_refill = now
+                acquired = self._tokens >= 1.0
+                self._tokens -= acquired
+                return acquired
+        
+        start_time = time.monotonic()
         
         while True:
             with self._lock:
@@ -108,17 +123,13 @@ class RateLimiter:
                     self._tokens -= 1.0
                     return True
                 
-                # If non-blocking, return immediately
-                if not blocking:
-                    return False
-                
                 # Calculate how long to wait for next token
                 tokens_needed = 1.0 - self._tokens
                 wait_time = tokens_needed / self._refill_rate
             
             # Check timeout
             if timeout is not None:
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if elapsed >= timeout:
                     return False
                 # Adjust wait time to not exceed timeout
@@ -137,7 +148,7 @@ class RateLimiter:
         """
         with self._lock:
             self._tokens = self._max_tokens
-            self._last_refill = time.time()
+            self._last_refill = time.monotonic()
     
     def get_available_tokens(self) -> float:
         """
@@ -0,0 +1,123 @@
+"""
+On-disk cache of scrape results.
+
+Scraping a target means starting a browser, logging in and scrolling
+through the page, which takes minutes and counts against the platform's
+rate limits. Re-running a script for the same target and limit within
+the cache lifetime returns the stored result instead.
+
+Each result is a JSON file named after a hash of (platform, target URL,
+limit); its modification time is its age, so no index has to be kept
+and stale entries are simply overwritten.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from scraper.utils.json_output import write_json
+
+# Default location and lifetime of cached results
+DEFAULT_CACHE_DIR = 'output/.cache'
+DEFAULT_TTL = 3600
+
+
+class ResultCache:
+    """
+    Cache of scrape() results stored as JSON files.
+
+    Usage:
+        cache = ResultCache(ttl=3600)
+        result = scraper.scrape(url, limit=10, cache=cache)
+    """
+
+    def __init__(self, directory: Union[str, Path] = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the cached results
+            ttl: Seconds a result stays valid
+
+        Raises:
+            ValueError: If ttl is not positive
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self._directory_ready = False
+
+    def key(self, platform: str, target_url: str, limit: int) -> str:
+        """
+        Return the cache key of a scrape.
+
+        Args:
+            platform: Platform name, e.g. 'instagram'
+            target_url: Scraped URL
+            limit: Maximum number of posts requested
+
+        Returns:
+            Hex digest identifying the scrape
+        """
+        data = json.dumps([platform, target_url, limit]).encode('utf-8')
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def __contains__(self, key: str) -> bool:
+        """Whether a result younger than the TTL is stored under key."""
+        try:
+            return time.time() - self._path(key).stat().st_mtime < self.ttl
+        except FileNotFoundError:
+            return False
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the stored result, or None if it is missing or expired.
+
+        Args:
+            key: Key from key()
+
+        Returns:
+            The cached scrape() result, or None
+        """
+        if key not in self:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            # Removed concurrently or left truncated; scrape again
+            return None
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a result.
+
+        The file is written under a temporary name and renamed into place,
+        so readers never see a partially written result.
+
+        Args:
+            key: Key from key()
+            result: scrape() result
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+
+        # The directory is created by the first store rather than checked
+        # on every one; if it was removed since, it is created again
+        if not self._directory_ready:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._directory_ready = True
+        try:
+            write_json(tmp_path, result, indent=False)
+        except FileNotFoundError:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            write_json(tmp_path, result, indent=False)
+        os.replace(tmp_path, path)
@@ -44,7 +44,10 @@ from typing import Dict, List, Optional, Tuple
 # Add parent directory to path to import database module
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from database.db_operations import insert_post, insert_sentiment, DatabaseOperationError
+from database.db_operations import (
+    insert_post, insert_sentiment, insert_posts_bulk, insert_sentiments_bulk,
+    refresh_daily_sentiment_summary, DatabaseOperationError
+)
 from database.db_connection import get_db_connection, DatabaseConnectionError
 
 
@@ -161,18 +164,18 @@ def parse_timestamp(timestamp_str: str) -> datetime:
     return timestamp_str
 
 
-def import_post_from_json(post_data: Dict, platform: str = 'instagram') -> Optional[int]:
+def parse_post_from_json(post_data: Dict, platform: str = 'instagram') -> Optional[Dict]:
     """
-    Import a single post from JSON data structure.
+    Validate a post from a JSON file and convert it to insert_post arguments.
     
     Args:
         post_data: Post dictionary from JSON file
         platform: Social media platform (default: instagram)
         
     Returns:
-        Database ID of inserted/updated post, or None if validation failed
+        Dictionary of insert_post keyword arguments, or None if the post is invalid
         
-    Validates: Requirements 9.2, 9.3, 9.7
+    Validates: Requirements 9.2, 9.7
     """
     # Validate post data
     is_valid, error_msg = validate_post_data(post_data)
@@ -181,70 +184,114 @@ def import_post_from_json(post_data: Dict, platform: str = 'instagram') -> Optio
         return None
     
     try:
-        # Extract post fields
-        post_id = post_data['post_id']
-        author = post_data['author']
-        content = post_data.get('content', '')
-        timestamp = parse_timestamp(post_data['timestamp'])
-        likes = int(post_data.get('likes', 0))
-        comments_count = int(post_data.get('comments_count', 0))
-        shares = int(post_data.get('shares', 0))
-        url = post_data.get('post_url')
-        media_type = post_data.get('post_type', 'post')
-        
         # Extract hashtags
         hashtags = post_data.get('hashtags', [])
         if isinstance(hashtags, str):
             # Handle comma-separated string
             hashtags = [h.strip() for h in hashtags.split(',') if h.strip()]
         
-        # Insert post with upsert logic
-        db_id = insert_post(
-            post_id=post_id,
-            platform=platform,
-            author=author,
-            content=content,
-            timestamp=timestamp,
-            likes=likes,
-            comments_count=comments_count,
-            shares=shares,
-            url=url,
-            media_type=media_type,
-            hashtags=hashtags,
-            raw_data=post_data
-        )
-        
-        # Insert sentiment if available
-        if 'sentiment' in post_data and post_data['sentiment']:
-            sentiment = post_data['sentiment']
-            try:
-                insert_sentiment(
-                    post_id=db_id,
-                    score=float(sentiment.get('score', 0.0)),
-                    label=sentiment.get('label', 'neutral'),
-                    confidence=float(sentiment.get('confidence', 0.0)),
-                    compound=float(sentiment.get('compound', 0.0)),
-                    positive=float(sentiment.get('positive', 0.0)),
-                    neutral=float(sentiment.get('neutral', 0.0)),
-                    negative=float(sentiment.get('negative', 0.0)),
-                    model=sentiment.get('model', 'vader')
-                )
-            except DatabaseOperationError as e:
-                logger.warning(f"Failed to insert sentiment for post {post_id}: {e}")
-        
-        return db_id
+        return {
+            'post_id': post_data['post_id'],
+            'platform': platform,
+            'author': post_data['author'],
+            'content': post_data.get('content', ''),
+            'timestamp': parse_timestamp(post_data['timestamp']),
+            'likes': int(post_data.get('likes', 0)),
+            'comments_count': int(post_data.get('comments_count', 0)),
+            'shares': int(post_data.get('shares', 0)),
+            'url': post_data.get('post_url'),
+            'media_type': post_data.get('post_type', 'post'),
+            'hashtags': hashtags,
+            'raw_data': post_data
+        }
         
     except (KeyError, ValueError, TypeError) as e:
         logger.warning(f"Error processing post {post_data.get('post_id', 'unknown')}: {e}")
         return None
+
+
+def parse_sentiment_from_json(post_data: Dict) -> Optional[Dict]:
+    """
+    Convert the sentiment of a JSON post to insert_sentiment arguments.
+    
+    Args:
+        post_data: Post dictionary from JSON file
+        
+    Returns:
+        Dictionary of insert_sentiment keyword arguments without post_id,
+        or None if the post has no sentiment
+        
+    Raises:
+        ValueError: If a sentiment score is not numeric
+    """
+    sentiment = post_data.get('sentiment')
+    if not sentiment:
+        return None
+    
+    return {
+        'score': float(sentiment.get('score', 0.0)),
+        'label': sentiment.get('label', 'neutral'),
+        'confidence': float(sentiment.get('confidence', 0.0)),
+        'compound': float(sentiment.get('compound', 0.0)),
+        'positive': float(sentiment.get('positive', 0.0)),
+        'neutral': float(sentiment.get('neutral', 0.0)),
+        'negative': float(sentiment.get('negative', 0.0)),
+        'model': sentiment.get('model', 'vader')
+    }
+
+
+def import_post_from_json(post_data: Dict, platform: str = 'instagram') -> Optional[int]:
+    """
+    Import a single post from JSON data structure.
+    
+    Args:
+        post_data: Post dictionary from JSON file
+        platform: Social media platform (default: instagram)
+        
+    Returns:
+        Database ID of inserted/updated post, or None if validation failed
+        
+    Validates: Requirements 9.2, 9.3, 9.7
+    """
+    record = parse_post_from_json(post_data, platform)
+    if record is None:
+        return None
+    
+    try:
+        sentiment = parse_sentiment_from_json(post_data)
+    except (ValueError, TypeError, AttributeError) as e:
+        logger.warning(f"Error processing post {record['post_id']}: {e}")
+        return None
+    
+    return _insert_post_record(record, sentiment)
+
+
+def _insert_post_sentiment(db_id: int, record: Dict, sentiment: Dict) -> None:
+    """Insert the sentiment of an imported post, logging a failure."""
+    try:
+        insert_sentiment(post_id=db_id, **sentiment)
+    except DatabaseOperationError as e:
+        logger.warning(f"Failed to insert sentiment for post {record['post_id']}: {e}")
+
+
+def _insert_post_record(record: Dict, sentiment: Optional[Dict] = None) -> Optional[int]:
+    """Insert one parsed post and its sentiment, returning None on failure."""
+    try:
+        # Insert post with upsert logic
+        db_id = insert_post(**record)
     except DatabaseOperationError as e:
-        logger.error(f"Database error importing post {post_data.get('post_id', 'unknown')}: {e}")
+        logger.error(f"Database error importing post {record['post_id']}: {e}")
         return None
+    
+    if sentiment:
+        _insert_post_sentiment(db_id, record, sentiment)
+    
+    return db_id
 
 
-def import_post_from_csv(post_data: Dict, platform: str = 'instagram') -> Optional[int]:
+def parse_post_from_csv(post_data: Dict, platform: str = 'instagram') -> Optional[Dict]:
     """
-    Import a single post from CSV data structure.
+    Validate a post from a CSV file and convert it to insert_post arguments.
     
     CSV files typically don't include sentiment data.
     
@@ -253,9 +300,9 @@ def import_post_from_csv(post_data: Dict, platform: str = 'instagram') -> Option
         platform: Social media platform (default: instagram)
         
     Returns:
-        Database ID of inserted/updated post, or None if validation failed
+        Dictionary of insert_post keyword arguments, or None if the post is invalid
         
-    Validates: Requirements 9.2, 9.3, 9.7
+    Validates: Requirements 9.2, 9.7
     """
     # Validate post data
     is_valid, error_msg = validate_post_data(post_data)
@@ -264,45 +311,98 @@ def import_post_from_csv(post_data: Dict, platform: str = 'instagram') -> Option
         return None
     
     try:
-        # Extract post fields
-        post_id = post_data['post_id']
-        author = post_data['author']
-        content = post_data.get('content', '')
-        timestamp = parse_timestamp(post_data['timestamp'])
-        likes = int(post_data.get('likes', 0))
-        comments_count = int(post_data.get('comments_count', 0))
-        shares = int(post_data.get('shares', 0))
-        url = post_data.get('post_url', '')
-        media_type = post_data.get('post_type', 'post')
-        
         # Extract hashtags from string
         hashtags_str = post_data.get('hashtags', '')
         hashtags = [h.strip() for h in hashtags_str.split(',') if h.strip()] if hashtags_str else []
         
-        # Insert post with upsert logic
-        db_id = insert_post(
-            post_id=post_id,
-            platform=platform,
-            author=author,
-            content=content,
-            timestamp=timestamp,
-            likes=likes,
-            comments_count=comments_count,
-            shares=shares,
-            url=url,
-            media_type=media_type,
-            hashtags=hashtags,
-            raw_data=None  # CSV doesn't include full raw data
-        )
-        
-        return db_id
+        return {
+            'post_id': post_data['post_id'],
+            'platform': platform,
+            'author': post_data['author'],
+            'content': post_data.get('content', ''),
+            'timestamp': parse_timestamp(post_data['timestamp']),
+            'likes': int(post_data.get('likes', 0)),
+            'comments_count': int(post_data.get('comments_count', 0)),
+            'shares': int(post_data.get('shares', 0)),
+            'url': post_data.get('post_url', ''),
+            'media_type': post_data.get('post_type', 'post'),
+            'hashtags': hashtags,
+            'raw_data': None  # CSV doesn't include full raw data
+        }
         
     except (KeyError, ValueError, TypeError) as e:
         logger.warning(f"Error processing post {post_data.get('post_id', 'unknown')}: {e}")
         return None
-    except DatabaseOperationError as e:
-        logger.error(f"Database error importing post {post_data.get('post_id', 'unknown')}: {e}")
+
+
+def import_post_from_csv(post_data: Dict, platform: str = 'instagram') -> Optional[int]:
+    """
+    Import a single post from CSV data structure.
+    
+    Args:
+        post_data: Post dictionary from CSV file
+        platform: Social media platform (default: instagram)
+        
+    Returns:
+        Database ID of inserted/updated post, or None if validation failed
+        
+    Validates: Requirements 9.2, 9.3, 9.7
+    """
+    record = parse_post_from_csv(post_data, platform)
+    if record is None:
         return None
+    
+    return _insert_post_record(record)
+
+
+def import_post_batch(
+    records: List[Dict],
+    sentiments: Optional[List[Optional[Dict]]] = None
+) -> int:
+    """
+    Insert a batch of parsed posts and their sentiments.
+    
+    Posts go through insert_posts_bulk, which streams large batches with
+    binary COPY, and sentiments follow in one multi-row INSERT. If either
+    is rejected, its rows are retried one at a time so that a single bad
+    row only skips itself.
+    
+    Args:
+        records: insert_post keyword arguments, one dictionary per post
+        sentiments: insert_sentiment arguments without post_id, aligned with
+            records (None where a post has no sentiment)
+        
+    Returns:
+        Number of posts imported
+        
+    Validates: Requirements 9.2, 9.3, 10.4
+    """
+    if sentiments is None:
+        sentiments = [None] * len(records)
+    
+    try:
+        db_ids = insert_posts_bulk(records)
+    except DatabaseOperationError as e:
+        logger.warning(f"Batch import failed, importing posts one by one: {e}")
+        return sum(
+            1 for record, sentiment in zip(records, sentiments)
+            if _insert_post_record(record, sentiment)
+        )
+    
+    sentiment_rows = [
+        dict(sentiment, post_id=db_id)
+        for db_id, sentiment in zip(db_ids, sentiments)
+        if sentiment
+    ]
+    try:
+        insert_sentiments_bulk(sentiment_rows)
+    except DatabaseOperationError as e:
+        logger.warning(f"Batch sentiment insert failed, inserting sentiments one by one: {e}")
+        for db_id, record, sentiment in zip(db_ids, records, sentiments):
+            if sentiment:
+                _insert_post_sentiment(db_id, record, sentiment)
+    
+    return len(db_ids)
 
 
 def import_json_file(file_path: str, platform: str = 'instagram') -> Tuple[int, int, int]:
@@ -336,15 +436,23 @@ def import_json_file(file_path: str, platform: str = 'instagram') -> Tuple[int,
         logger.error(f"Unexpected JSON structure in {file_path}")
         return 0, 0, 0
     
-    inserted = 0
-    skipped = 0
+    records = []
+    sentiments = []
     
     for post in posts:
-        db_id = import_post_from_json(post, platform)
-        if db_id:
-            inserted += 1
-        else:
-            skipped += 1
+        record = parse_post_from_json(post, platform)
+        if record is None:
+            continue
+        
+        try:
+            sentiments.append(parse_sentiment_from_json(post))
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Error processing post {record['post_id']}: {e}")
+            continue
+        records.append(record)
+    
+    inserted = import_post_batch(records, sentiments)
+    skipped = len(posts) - inserted
     
     logger.info(f"Completed {file_path}: {inserted} imported, {skipped} skipped")
     return inserted, 0, skipped  # Note: Can't distinguish insert vs update without checking
@@ -371,15 +479,13 @@ def import_csv_file(file_path: str, platform: str = 'instagram') -> Tuple[int, i
         logger.error(f"Failed to read file: {e}")
         return 0, 0, 0
     
-    inserted = 0
-    skipped = 0
+    records = [
+        record for record in (parse_post_from_csv(post, platform) for post in posts)
+        if record is not None
+    ]
     
-    for post in posts:
-        db_id = import_post_from_csv(post, platform)
-        if db_id:
-            inserted += 1
-        else:
-            skipped += 1
+    inserted = import_post_batch(records)
+    skipped = len(posts) - inserted
     
     logger.info(f"Completed {file_path}: {inserted} imported, {skipped} skipped")
     return inserted, 0, skipped
@@ -575,6 +681,13 @@ Examples:
             total_updated = updated
             total_skipped = skipped
         
+        # Refresh the dashboard summary before dropping cached responses
+        if total_inserted or total_updated:
+            try:
+                refresh_daily_sentiment_summary()
+            except DatabaseOperationError as e:
+                logger.warning(f"Daily sentiment summary not refreshed: {e}")
+        
         # Invalidate cache
         invalidate_cache()
         
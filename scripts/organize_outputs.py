@@ -3,18 +3,96 @@ Script to organize output files into proper folders
 Moves old output files to platform-specific folders
 """
 
+import errno
 import os
+import re
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import json
 
+try:
+    import orjson
+except ImportError:  # optional faster JSON parser
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional, needed to peek into .json.zst files
+    zstandard = None
+
+try:
+    import ijson
+except ImportError:  # optional streaming parser for the metadata probe
+    ijson = None
+
 # Fix Windows console encoding for emoji support
 if sys.platform == 'win32':
     import codecs
     sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
 
+# Scraper output starts with its metadata, so the platform is usually
+# found in the first few KB without parsing the whole file
+HEAD_SIZE = 4096
+PLATFORM_RE = re.compile(rb'"metadata"\s*:\s*\{[^{}]*?"platform"\s*:\s*"([^"\\]+)"')
+
+# Platform named in a file name, in order of precedence: each lookahead
+# scans the whole name, so 'sentiment_instagram.json' is instagram as
+# with separate substring checks, in a single search
+FILENAME_PLATFORM_RE = re.compile(
+    r'(?=.*(instagram))|(?=.*(twitter))|(?=.*(facebook))|(?=.*(sentiment))'
+)
+
+# Output file suffixes; .json.zst files are zstd-compressed JSON
+OUTPUT_SUFFIXES = ('.json', '.json.zst')
+
+def open_output(file_path):
+    """Open an output file for reading, decompressing .zst files as read"""
+    if file_path.name.endswith('.zst'):
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, 'rb'))
+    return open(file_path, 'rb')
+
+def read_platform(file_path):
+    """Return metadata.platform of a JSON output file, or None"""
+    # Only the head of a compressed file is decompressed for the peek
+    with open_output(file_path) as f:
+        head = f.read(HEAD_SIZE)
+        match = PLATFORM_RE.search(head)
+        if match:
+            return match.group(1).decode('utf-8')
+        if ijson is None:
+            raw = head + f.read()
+
+    if ijson is not None:
+        # Stream the file and stop at metadata.platform, or at the end of
+        # metadata, instead of parsing every post
+        with open_output(file_path) as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'metadata.platform':
+                    return value
+                if prefix == 'metadata' and event == 'end_map':
+                    return None
+        return None
+
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    if 'metadata' in data and 'platform' in data['metadata']:
+        return data['metadata']['platform']
+    return None
+
+def classify(file_path):
+    """Determine the platform of an output file from its name or content"""
+    match = FILENAME_PLATFORM_RE.match(file_path.name)
+    if match:
+        return match.group(match.lastindex)
+
+    # Try to read file and determine from metadata
+    try:
+        return read_platform(file_path)
+    except:
+        return 'other'
+
 def organize_outputs():
     """Organize output files into platform folders"""
     print("📂 Organizing output files...")
@@ -38,47 +116,45 @@ def organize_outputs():
     for platform_dir in platforms.values():
         platform_dir.mkdir(exist_ok=True)
 
-    # Get all JSON files in output root
-    json_files = list(output_dir.glob('*.json'))
+    # Get all JSON files in output root in one directory pass; DirEntry
+    # knows whether it is a file without another stat call
+    with os.scandir(output_dir) as entries:
+        json_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(OUTPUT_SUFFIXES) and entry.is_file()
+        ]
+
+    # Classifying may read each file; those reads overlap in threads,
+    # while the moves below stay serial and in order so that collision
+    # suffixes are assigned deterministically
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        platforms_found = list(executor.map(classify, json_files))
 
     moved_count = 0
 
-    for file_path in json_files:
+    for file_path, platform in zip(json_files, platforms_found):
         try:
-            # Determine platform from filename or content
-            platform = None
-
-            if 'instagram' in file_path.name:
-                platform = 'instagram'
-            elif 'twitter' in file_path.name:
-                platform = 'twitter'
-            elif 'facebook' in file_path.name:
-                platform = 'facebook'
-            elif 'sentiment' in file_path.name:
-                platform = 'sentiment'
-            else:
-                # Try to read file and determine from metadata
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        if 'metadata' in data and 'platform' in data['metadata']:
-                            platform = data['metadata']['platform']
-                except:
-                    platform = 'other'
-
             if platform:
                 dest_dir = platforms.get(platform, platforms['other'])
                 dest_path = dest_dir / file_path.name
 
                 # Avoid overwriting
                 counter = 1
+                suffix = '.json.zst' if file_path.name.endswith('.json.zst') else file_path.suffix
+                stem = file_path.name[:-len(suffix)]
                 while dest_path.exists():
-                    stem = file_path.stem
-                    suffix = file_path.suffix
                     dest_path = dest_dir / f"{stem}_{counter}{suffix}"
                     counter += 1
 
-                shutil.move(str(file_path), str(dest_path))
+                # Platform folders are inside output/, so a rename is all a
+                # move takes; copy only if one is mounted from elsewhere
+                try:
+                    os.replace(file_path, dest_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+                    shutil.move(str(file_path), str(dest_path))
                 print(f"✓ Moved: {file_path.name} -> {platform}/{dest_path.name}")
                 moved_count += 1
 
@@ -91,7 +167,8 @@ def organize_outputs():
     print()
     print("Folder structure:")
     for platform, path in platforms.items():
-        file_count = len(list(path.glob('*.json')))
+        with os.scandir(path) as entries:
+            file_count = sum(1 for entry in entries if entry.name.endswith(OUTPUT_SUFFIXES))
         if file_count > 0:
             print(f"  📁 {platform}: {file_count} files")
 
@@ -16,6 +16,7 @@ from pathlib import Path
 from typing import Optional
 
 from sentiment.sentiment_analyzer import SentimentAnalyzer
+from scraper.utils.json_output import read_json
 
 
 # Configure logging
@@ -121,8 +122,7 @@ def validate_input_file(input_path: str) -> bool:
         return False
     
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(input_file)
             
         if 'posts' not in data:
             logger.error("Input JSON must contain 'posts' array")
@@ -271,7 +271,8 @@ def main() -> int:
         if args.output_dir:
             # Create sentiment folder structure
             input_path = Path(args.input)
-            input_filename = input_path.stem  # filename without extension
+            # filename without extension, .json.zst included
+            input_filename = Path(input_path.name.removesuffix('.zst')).stem
             
             sentiment_dir = Path(args.output_dir) / "sentiment"
             sentiment_dir.mkdir(parents=True, exist_ok=True)
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from sentiment.text_cleaner import TextCleaner
+from scraper.utils.json_output import read_json
 
 
 logger = logging.getLogger(__name__)
@@ -82,8 +83,8 @@ class SentimentAnalyzer:
         if not input_file.exists():
             raise FileNotFoundError(f"Input file not found: {input_path}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Scrape results may be zstd-compressed (.json.zst)
+        data = read_json(input_file)
         
         # Validate input structure
         if 'posts' not in data:
@@ -27,6 +27,7 @@ from scraper.scrapers.base_scraper import (
     NetworkError,
     TimeoutError as ScraperTimeoutError
 )
+from scraper.utils.result_cache import ResultCache
 
 
 # Concrete implementation for testing
@@ -394,6 +395,26 @@ class TestBaseScraperErrorHandling:
         assert len(result['posts']) == 2
         assert result['metadata']['target_url'] == "http://example.com"
     
+    @patch.object(TestScraper, 'setup_driver')
+    def test_scrape_passes_each_post_to_on_post(self, mock_setup):
+        """Test posts reach the on_post callback as they are scraped."""
+        scraper = TestScraper()
+        received = []
+        
+        def scrape_posts(target_url, limit=100):
+            posts = []
+            scraper.add_post(posts, {'post_id': '1'})
+            assert received == [{'post_id': '1'}]
+            scraper.add_post(posts, {'post_id': '2'})
+            return posts
+        
+        with patch.object(scraper, 'scrape_posts', side_effect=scrape_posts):
+            result = scraper.scrape("http://example.com", authenticate=False,
+                                    on_post=received.append)
+        
+        assert received == result['posts']
+        assert scraper.on_post is None
+    
     @patch.object(TestScraper, 'setup_driver')
     @patch.object(TestScraper, 'scrape_posts')
     def test_scrape_without_authentication(self, mock_scrape, mock_setup):
@@ -406,6 +427,81 @@ class TestBaseScraperErrorHandling:
         assert 'metadata' in result
         assert 'posts' in result
 
+    
+    @patch.object(TestScraper, 'setup_driver')
+    @patch.object(TestScraper, 'authenticate')
+    @patch.object(TestScraper, 'scrape_posts')
+    def test_scrape_reuses_running_driver(self, mock_scrape, mock_auth, mock_setup):
+        """Test a driver started by the caller is shared by scrape() calls."""
+        mock_auth.return_value = True
+        mock_scrape.return_value = []
+        
+        scraper = TestScraper(credentials={'username': 'test', 'password': 'pass'})
+        driver = Mock()
+        scraper.driver = driver
+        
+        scraper.scrape("http://example.com/a")
+        scraper.scrape("http://example.com/b")
+        
+        mock_setup.assert_not_called()
+        mock_auth.assert_called_once()
+        driver.quit.assert_not_called()
+        assert scraper.driver is driver
+        
+        scraper.close()
+        assert scraper.authenticated is False
+
+    
+    @patch.object(TestScraper, 'setup_driver')
+    @patch.object(TestScraper, 'authenticate')
+    @patch.object(TestScraper, 'scrape_posts')
+    def test_scrape_many_logs_in_once(self, mock_scrape, mock_auth, mock_setup):
+        """Test several targets share one driver and one login."""
+        mock_auth.return_value = True
+        mock_scrape.side_effect = [
+            [{'post_id': '1'}],
+            [{'post_id': '2'}, {'post_id': '3'}],
+        ]
+        scraper = TestScraper(credentials={'username': 'test', 'password': 'pass'})
+        driver = Mock()
+        mock_setup.side_effect = lambda: setattr(scraper, 'driver', driver)
+        
+        result = scraper.scrape_many(["http://a.example", "http://b.example"], limit=5)
+        
+        mock_setup.assert_called_once()
+        mock_auth.assert_called_once()
+        driver.quit.assert_called_once()
+        assert mock_scrape.call_args_list == [
+            call("http://a.example", 5), call("http://b.example", 5)
+        ]
+        assert [post['post_id'] for post in result['posts']] == ['1', '2', '3']
+        assert result['metadata']['total_posts'] == 3
+        assert result['metadata']['target_url'] == "http://a.example, http://b.example"
+        assert [m['total_posts'] for m in result['metadata']['targets']] == [1, 2]
+
+    
+    @patch.object(TestScraper, 'setup_driver')
+    @patch.object(TestScraper, 'scrape_posts')
+    def test_scrape_returns_cached_result(self, mock_scrape, mock_setup, tmp_path):
+        """Test a cached result is returned without starting a browser."""
+        mock_scrape.return_value = [{'post_id': '1'}]
+        cache = ResultCache(tmp_path)
+        
+        first = TestScraper().scrape("http://example.com", limit=10,
+                                     authenticate=False, cache=cache)
+        received = []
+        second = TestScraper().scrape_many(["http://example.com"], limit=10,
+                                           authenticate=False, on_post=received.append,
+                                           cache=cache)
+        
+        mock_setup.assert_called_once()
+        mock_scrape.assert_called_once()
+        assert second['posts'] == first['posts'] == received
+        
+        # Another limit is another scrape
+        TestScraper().scrape("http://example.com", limit=20, authenticate=False, cache=cache)
+        assert mock_scrape.call_count == 2
+
 
 class TestBaseScraperResourceCleanup:
     """Test resource cleanup functionality."""
@@ -11,25 +11,54 @@ Tests cover:
 """
 
 import os
+import json
+import struct
 import pytest
 from unittest.mock import patch, MagicMock, Mock
 from datetime import datetime, timedelta
 from psycopg2 import DatabaseError, IntegrityError
+from psycopg2.errors import UniqueViolation
 
 from database.db_operations import (
     insert_post,
     insert_sentiment,
     insert_execution_log,
+    insert_posts_bulk,
+    insert_post_with_sentiment,
+    insert_posts_with_sentiments_bulk,
+    insert_sentiments_bulk,
+    insert_comments,
+    insert_comments_bulk,
+    ingest_post_bundle,
+    copy_posts,
+    db_session,
+    _json_dumps,
+    _jsonb,
+    COPY_THRESHOLD,
+    STREAM_ITERSIZE,
     get_post_by_post_id,
     get_post_by_id,
+    get_post_raw,
+    get_comments_by_post_id,
+    get_sentiments_by_post_ids,
+    search_posts,
+    _encode_page_cursor,
     get_posts_by_date_range,
     get_sentiment_by_post_id,
     get_posts_with_sentiment,
+    get_posts_with_sentiment_light,
+    get_posts_with_sentiment_full,
     get_sentiment_distribution,
     get_top_posts_by_engagement,
     get_execution_logs,
     get_daily_post_counts,
+    get_dashboard_bundle,
+    get_hashtag_frequency,
+    backfill_hashtags,
+    refresh_daily_sentiment_summary,
+    get_posting_time_heatmap,
     delete_old_posts,
+    clear_all_data,
     delete_old_execution_logs,
     DatabaseOperationError
 )
@@ -44,8 +73,11 @@ def mock_db_connection():
     # Setup context manager for get_cursor
     mock_db.get_cursor.return_value.__enter__.return_value = mock_cursor
     mock_db.get_cursor.return_value.__exit__.return_value = False
+    mock_cursor.connection.info.parameter_status.return_value = 'UTC'
     
-    with patch('database.db_operations.get_db_connection', return_value=mock_db):
+    with patch('database.db_operations.get_db_connection', return_value=mock_db), \
+            patch.dict('database.db_operations._column_names_cache', clear=True), \
+            patch.dict('database.db_operations._aggregate_cache', clear=True):
         yield mock_db, mock_cursor
 
 
@@ -75,7 +107,7 @@ class TestInsertPost:
         )
         
         assert result == 1
-        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_count == 2  # PREPARE + EXECUTE
         
         # Verify parameterized query was used
         call_args = mock_cursor.execute.call_args
@@ -105,7 +137,7 @@ class TestInsertPost:
         )
         
         assert result == 2
-        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_count == 2  # PREPARE + EXECUTE
     
     def test_insert_post_upsert_on_conflict(self, mock_db_connection):
         """Test upsert behavior when post_id already exists"""
@@ -125,12 +157,31 @@ class TestInsertPost:
         
         assert result == 1
         
-        # Verify ON CONFLICT UPDATE is in the query
-        call_args = mock_cursor.execute.call_args
-        query = call_args[0][0]
+        # Verify ON CONFLICT UPDATE is in the prepared query
+        query = mock_cursor.execute.call_args_list[0][0][0]
+        assert query.startswith("PREPARE insert_post_v1")
         assert "ON CONFLICT" in query
         assert "DO UPDATE SET" in query
     
+    def test_insert_post_reuses_prepared_statement(self, mock_db_connection):
+        """Test that the statement is prepared only once per connection"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (1,)
+        
+        for post_id in ("post1", "post2"):
+            insert_post(
+                post_id=post_id,
+                platform="instagram",
+                author="user",
+                content="content",
+                timestamp=datetime.now()
+            )
+        
+        queries = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        assert len(queries) == 3
+        assert sum(q.startswith("PREPARE") for q in queries) == 1
+        assert mock_cursor.execute.call_args[0][1][0] == "post2"
+    
     def test_insert_post_database_error(self, mock_db_connection):
         """Test handling of database errors"""
         mock_db, mock_cursor = mock_db_connection
@@ -148,6 +199,74 @@ class TestInsertPost:
         assert "Failed to insert post" in str(exc_info.value)
 
 
+class TestInsertPostInsertFirst:
+    """Test the insert_first strategy of insert_post"""
+    
+    @staticmethod
+    def _executed(mock_cursor):
+        return [c[0][0] for c in mock_cursor.execute.call_args_list]
+    
+    def test_new_post_uses_plain_insert(self, mock_db_connection):
+        """Test a new post is written with a single plain INSERT"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (1,)
+        
+        result = insert_post(
+            post_id='p1', platform='x', author='a', content='c',
+            timestamp=datetime(2024, 1, 1), insert_first=True
+        )
+        
+        assert result == 1
+        statements = self._executed(mock_cursor)
+        assert statements[0].startswith('PREPARE insert_post_plain_v1')
+        assert 'ON CONFLICT' not in statements[0]
+        mock_cursor.connection.rollback.assert_not_called()
+    
+    def test_conflict_falls_back_to_update(self, mock_db_connection):
+        """Test a unique violation rolls back and updates the existing row"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (9,)
+        
+        def execute(query, params=None):
+            if query.startswith('EXECUTE insert_post_plain_v1'):
+                raise UniqueViolation()
+        mock_cursor.execute.side_effect = execute
+        
+        result = insert_post(
+            post_id='p1', platform='x', author='a', content='c',
+            timestamp=datetime(2024, 1, 1), insert_first=True
+        )
+        
+        assert result == 9
+        mock_cursor.connection.rollback.assert_called_once()
+        statements = self._executed(mock_cursor)
+        assert statements[-2].startswith('PREPARE update_post_v1')
+        assert 'WHERE post_id = $1' in statements[-2]
+        assert statements[-1].startswith('EXECUTE update_post_v1')
+    
+    def test_conflict_in_session_rolls_back_to_savepoint(self, mock_db_connection):
+        """Test a caller's transaction only loses the failed INSERT"""
+        mock_db, mock_cursor = mock_db_connection
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (9,)
+        
+        def execute(query, params=None):
+            if query.startswith('EXECUTE insert_post_plain_v1'):
+                raise UniqueViolation()
+        mock_cursor.execute.side_effect = execute
+        
+        insert_post(
+            post_id='p1', platform='x', author='a', content='c',
+            timestamp=datetime(2024, 1, 1), conn=conn, insert_first=True
+        )
+        
+        statements = self._executed(mock_cursor)
+        assert statements[0] == 'SAVEPOINT insert_post;'
+        assert 'ROLLBACK TO SAVEPOINT insert_post;' in statements
+        conn.rollback.assert_not_called()
+
+
 class TestInsertSentiment:
     """Test insert_sentiment function with foreign key handling"""
     
@@ -169,7 +288,7 @@ class TestInsertSentiment:
         )
         
         assert result == 1
-        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_count == 2  # PREPARE + EXECUTE
         
         # Verify parameterized query
         call_args = mock_cursor.execute.call_args
@@ -220,6 +339,457 @@ class TestInsertSentiment:
         assert "textblob" in call_args[0][1]
 
 
+class TestJsonEncoding:
+    """Test JSONB parameter encoding"""
+    
+    def test_json_dumps_round_trips(self):
+        """Test encoded payloads decode to the original value"""
+        value = {'caption': 'caf\u00e9 \U0001f600', 'nested': {'n': [1, 2.5, None]}}
+        
+        assert json.loads(_json_dumps(value)) == value
+    
+    def test_json_dumps_falls_back_for_big_integers(self):
+        """Test values orjson rejects are still encoded"""
+        value = {'id': 2 ** 70}
+        
+        assert json.loads(_json_dumps(value)) == value
+    
+    def test_jsonb_encodes_once(self):
+        """Test a JSONB parameter is serialized once however often it is quoted"""
+        with patch('database.db_operations._json_bytes',
+                   return_value=b'{"a": 1}') as mock_json_bytes:
+            param = _jsonb({'a': 1})
+            first = param.getquoted()
+            second = param.getquoted()
+        
+        assert first == second == b"'{\"a\": 1}'"
+        mock_json_bytes.assert_called_once_with({'a': 1})
+    
+    def test_jsonb_empty_is_null(self):
+        """Test empty payloads are stored as NULL"""
+        assert _jsonb(None) is None
+        assert _jsonb({}) is None
+
+
+class TestDbSession:
+    """Test grouping writes on one connection with db_session"""
+    
+    def test_session_commits_once(self, mock_db_connection):
+        """Test that inserts share one connection and commit once"""
+        mock_db, _ = mock_db_connection
+        mock_conn = MagicMock()
+        session_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        session_cursor.fetchone.return_value = (7,)
+        mock_db.get_connection.return_value = mock_conn
+        
+        with db_session() as conn:
+            post_db_id = insert_post(
+                post_id="post1",
+                platform="instagram",
+                author="user",
+                content="content",
+                timestamp=datetime.now(),
+                conn=conn
+            )
+            insert_sentiment(
+                post_id=post_db_id,
+                score=0.5,
+                label="positive",
+                confidence=0.9,
+                compound=0.5,
+                positive=0.6,
+                neutral=0.3,
+                negative=0.1,
+                conn=conn
+            )
+        
+        assert post_db_id == 7
+        mock_db.get_connection.assert_called_once()
+        mock_db.get_cursor.assert_not_called()
+        mock_conn.commit.assert_called_once()
+        mock_conn.rollback.assert_not_called()
+        mock_db.return_connection.assert_called_once_with(mock_conn)
+    
+    def test_session_rolls_back_on_error(self, mock_db_connection):
+        """Test that a failing statement rolls back the whole session"""
+        mock_db, _ = mock_db_connection
+        mock_conn = MagicMock()
+        session_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        session_cursor.execute.side_effect = DatabaseError("Connection lost")
+        mock_db.get_connection.return_value = mock_conn
+        
+        with pytest.raises(DatabaseOperationError):
+            with db_session() as conn:
+                insert_post(
+                    post_id="post1",
+                    platform="instagram",
+                    author="user",
+                    content="content",
+                    timestamp=datetime.now(),
+                    conn=conn
+                )
+        
+        mock_conn.commit.assert_not_called()
+        mock_conn.rollback.assert_called_once()
+        mock_db.return_connection.assert_called_once_with(mock_conn)
+
+
+class TestInsertPostWithSentiment:
+    """Test fused post and sentiment inserts"""
+    
+    SENTIMENT = {
+        'score': 0.5, 'label': 'positive', 'confidence': 0.9, 'compound': 0.5,
+        'positive': 0.6, 'neutral': 0.3, 'negative': 0.1,
+    }
+    
+    def test_single_statement(self, mock_db_connection):
+        """Test post and sentiment are written by one CTE statement"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (3, 8)
+        
+        result = insert_post_with_sentiment(
+            post_id="post1",
+            platform="instagram",
+            author="user",
+            content="content",
+            timestamp=datetime.now(),
+            sentiment=self.SENTIMENT
+        )
+        
+        assert result == (3, 8)
+        prepare, execute = [c[0] for c in mock_cursor.execute.call_args_list]
+        assert "WITH inserted AS" in prepare[0]
+        assert "INSERT INTO sentiments" in prepare[0]
+        assert execute[1][0] == "post1"
+        assert execute[1][-1] == "vader"
+    
+    def test_bulk_joins_sentiments_by_post_id(self, mock_db_connection):
+        """Test bulk form sends one row per post and maps ids back"""
+        mock_db, mock_cursor = mock_db_connection
+        now = datetime.now()
+        posts = [
+            {'post_id': 'p1', 'platform': 'x', 'author': 'a', 'content': 'one',
+             'timestamp': now, 'sentiment': self.SENTIMENT},
+            {'post_id': 'p2', 'platform': 'x', 'author': 'b', 'content': 'two',
+             'timestamp': now},
+        ]
+        
+        with patch('database.db_operations.execute_values',
+                   return_value=[('p1', 10, 20), ('p2', 11, None)]) as mock_execute_values:
+            result = insert_posts_with_sentiments_bulk(posts)
+        
+        assert result == [(10, 20), (11, None)]
+        mock_execute_values.assert_called_once()
+        query = mock_execute_values.call_args[0][1]
+        rows = mock_execute_values.call_args[0][2]
+        assert 'JOIN input i USING (post_id)' in query
+        assert rows[0][13:15] == (0.5, 'positive')
+        assert rows[1][13:] == (None,) * 8
+    
+    def test_bulk_empty_input(self, mock_db_connection):
+        """Test empty input does not touch the database"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        assert insert_posts_with_sentiments_bulk([]) == []
+        mock_db.get_cursor.assert_not_called()
+
+
+class TestBulkInserts:
+    """Test bulk insert functions built on execute_values"""
+    
+    def test_insert_posts_bulk_single_statement(self, mock_db_connection):
+        """Test posts are upserted with one execute_values call"""
+        mock_db, mock_cursor = mock_db_connection
+        now = datetime.now()
+        posts = [
+            {'post_id': 'p1', 'platform': 'instagram', 'author': 'a',
+             'content': 'one', 'timestamp': now, 'raw_data': {'k': 1}},
+            {'post_id': 'p2', 'platform': 'instagram', 'author': 'b',
+             'content': 'two', 'timestamp': now},
+        ]
+        
+        with patch('database.db_operations.execute_values',
+                   return_value=[('p1', 10), ('p2', 11)]) as mock_execute_values:
+            result = insert_posts_bulk(posts)
+        
+        assert result == [10, 11]
+        mock_execute_values.assert_called_once()
+        query = mock_execute_values.call_args[0][1]
+        rows = mock_execute_values.call_args[0][2]
+        assert 'ON CONFLICT (post_id) DO UPDATE SET' in query
+        assert [row[0] for row in rows] == ['p1', 'p2']
+        mock_db.get_cursor.assert_called_once_with(commit=True, async_commit=True)
+    
+    def test_insert_posts_bulk_collapses_duplicate_post_ids(self, mock_db_connection):
+        """Test duplicate post_ids in one batch are sent only once"""
+        mock_db, mock_cursor = mock_db_connection
+        now = datetime.now()
+        posts = [
+            {'post_id': 'p1', 'platform': 'x', 'author': 'a', 'content': 'old', 'timestamp': now},
+            {'post_id': 'p1', 'platform': 'x', 'author': 'a', 'content': 'new', 'timestamp': now},
+        ]
+        
+        with patch('database.db_operations.execute_values',
+                   return_value=[('p1', 5)]) as mock_execute_values:
+            result = insert_posts_bulk(posts)
+        
+        rows = mock_execute_values.call_args[0][2]
+        assert len(rows) == 1
+        assert rows[0][4] == 'new'
+        assert result == [5, 5]
+    
+    def test_insert_posts_bulk_empty(self, mock_db_connection):
+        """Test empty input does not touch the database"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        assert insert_posts_bulk([]) == []
+        mock_db.get_cursor.assert_not_called()
+    
+    def test_insert_posts_bulk_uses_copy_for_large_batches(self, mock_db_connection):
+        """Test batches at the COPY threshold go through copy_posts"""
+        mock_db, mock_cursor = mock_db_connection
+        now = datetime.now()
+        posts = [
+            {'post_id': f'p{i}', 'platform': 'x', 'author': 'a',
+             'content': 'c', 'timestamp': now}
+            for i in range(COPY_THRESHOLD)
+        ]
+        mock_cursor.fetchall.return_value = [(p['post_id'], i) for i, p in enumerate(posts)]
+        
+        with patch('database.db_operations.execute_values') as mock_execute_values:
+            result = insert_posts_bulk(posts)
+        
+        mock_execute_values.assert_not_called()
+        mock_cursor.copy_expert.assert_called_once()
+        assert result == list(range(COPY_THRESHOLD))
+    
+    def test_copy_posts_binary_format(self, mock_db_connection):
+        """Test COPY rows use the binary wire formats and encode NULLs"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [('p1', 1)]
+        posts = [{
+            'post_id': 'p1', 'platform': 'x', 'author': 'a',
+            'content': 'line1\nline2\tend', 'timestamp': datetime(2000, 1, 1, 0, 0, 1),
+            'likes': 7, 'hashtags': ['one', None], 'raw_data': {'k': 'v'}
+        }]
+        
+        assert copy_posts(posts) == [1]
+        
+        sql, buffer = mock_cursor.copy_expert.call_args[0]
+        assert 'COPY posts_staging' in sql
+        assert 'FORMAT BINARY' in sql
+        
+        data = buffer.getvalue()
+        assert data.startswith(b'PGCOPY\n\xff\r\n\x00')
+        assert data.endswith(struct.pack('!h', -1))
+        
+        # Walk the single tuple after the 19-byte header
+        offset = 19
+        (field_count,) = struct.unpack_from('!h', data, offset)
+        offset += 2
+        fields = []
+        for _ in range(field_count):
+            (length,) = struct.unpack_from('!i', data, offset)
+            offset += 4
+            if length < 0:
+                fields.append(None)
+            else:
+                fields.append(data[offset:offset + length])
+                offset += length
+        
+        assert field_count == 13
+        assert fields[3] is None  # author_id
+        assert fields[4] == b'line1\nline2\tend'
+        assert struct.unpack('!q', fields[5]) == (1000000,)
+        assert struct.unpack('!i', fields[6]) == (7,)
+        # One-dimensional TEXT[] with a NULL element
+        assert struct.unpack_from('!iiiii', fields[11]) == (1, 1, 25, 2, 1)
+        assert fields[12][:1] == b'\x01'
+        assert json.loads(fields[12][1:]) == {'k': 'v'}
+        
+        merge_query = mock_cursor.execute.call_args[0][0]
+        assert 'ON CONFLICT (post_id) DO UPDATE SET' in merge_query
+        
+        # The stage is kept for the session and emptied at commit. Temporary
+        # tables are never WAL-logged, and CREATE TABLE AS copies no indexes
+        # or constraints for the COPY to maintain
+        create_query = mock_cursor.execute.call_args_list[0][0][0]
+        assert 'CREATE TEMP TABLE IF NOT EXISTS posts_staging' in create_query
+        assert 'ON COMMIT DELETE ROWS' in create_query
+        assert 'AS' in create_query and 'WITH NO DATA' in create_query
+        assert 'LIKE' not in create_query
+    
+    def test_copy_posts_converts_aware_timestamps_to_session_zone(self, mock_db_connection):
+        """Test offset-aware timestamps are stored like INSERT would store them"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.connection.info.parameter_status.return_value = 'Asia/Jakarta'
+        mock_cursor.fetchall.return_value = [('p1', 1)]
+        posts = [{
+            'post_id': 'p1', 'platform': 'x', 'author': 'a', 'content': 'c',
+            'timestamp': datetime.fromisoformat('2000-01-01T00:00:00+00:00')
+        }]
+        
+        copy_posts(posts)
+        
+        data = mock_cursor.copy_expert.call_args[0][1].getvalue()
+        # Header, field count, then post_id..content ('p1', 'x', 'a', NULL, 'c')
+        offset = 19 + 2 + (4 + 2) + (4 + 1) + (4 + 1) + 4 + (4 + 1)
+        assert struct.unpack_from('!iq', data, offset) == (8, 7 * 3600 * 1000000)
+    
+    def test_insert_sentiments_bulk(self, mock_db_connection):
+        """Test sentiments are inserted with one execute_values call"""
+        mock_db, mock_cursor = mock_db_connection
+        sentiments = [
+            {'post_id': 1, 'score': 0.5, 'label': 'positive', 'confidence': 0.9,
+             'compound': 0.5, 'positive': 0.6, 'neutral': 0.3, 'negative': 0.1},
+        ]
+        
+        with patch('database.db_operations.execute_values',
+                   return_value=[(7,)]) as mock_execute_values:
+            result = insert_sentiments_bulk(sentiments)
+        
+        assert result == [7]
+        rows = mock_execute_values.call_args[0][2]
+        assert rows[0][-1] == 'vader'
+    
+    def test_insert_sentiments_bulk_foreign_key_violation(self, mock_db_connection):
+        """Test missing posts are reported as DatabaseOperationError"""
+        mock_db, mock_cursor = mock_db_connection
+        sentiments = [
+            {'post_id': 999, 'score': 0.0, 'label': 'neutral', 'confidence': 0.5,
+             'compound': 0.0, 'positive': 0.3, 'neutral': 0.4, 'negative': 0.3},
+        ]
+        
+        with patch('database.db_operations.execute_values',
+                   side_effect=IntegrityError('violates foreign key constraint')):
+            with pytest.raises(DatabaseOperationError) as exc_info:
+                insert_sentiments_bulk(sentiments)
+        
+        assert 'does not exist' in str(exc_info.value)
+
+
+class TestInsertComments:
+    """Test multi-row comment insertion"""
+    
+    def test_insert_comments_bulk_uses_execute_values(self, mock_db_connection):
+        """Test comments of several posts go out as one multi-row INSERT"""
+        mock_db, mock_cursor = mock_db_connection
+        comments = [
+            {'post_id': 7, 'author': 'a', 'content': 'first',
+             'timestamp': datetime(2024, 1, 1)},
+            {'post_id': 8, 'author': 'b', 'content': 'second',
+             'timestamp': datetime(2024, 1, 2), 'raw_data': {'likes': 3}}
+        ]
+        
+        with patch('database.db_operations.execute_values',
+                   return_value=[(1,), (2,)]) as mock_execute_values:
+            result = insert_comments_bulk(comments)
+        
+        assert result == [1, 2]
+        mock_execute_values.assert_called_once()
+        query, rows = mock_execute_values.call_args[0][1:3]
+        assert 'INSERT INTO comments' in query
+        assert 'VALUES %s' in query
+        assert rows[0] == (7, 'a', 'first', datetime(2024, 1, 1), None, None)
+        assert rows[1][0] == 8
+        assert mock_execute_values.call_args[1]['fetch'] is True
+        mock_db.get_cursor.assert_called_once_with(commit=True, async_commit=True)
+    
+    def test_insert_comments_for_one_post(self, mock_db_connection):
+        """Test insert_comments fills in the parent post and counts rows"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        with patch('database.db_operations.execute_values',
+                   return_value=[(1,), (2,)]) as mock_execute_values:
+            result = insert_comments(7, [
+                {'author': 'a', 'content': 'x', 'timestamp': datetime(2024, 1, 1)},
+                {'author': 'b', 'content': 'y', 'timestamp': datetime(2024, 1, 1)}
+            ])
+        
+        assert result == 2
+        rows = mock_execute_values.call_args[0][2]
+        assert [row[0] for row in rows] == [7, 7]
+    
+    def test_insert_comments_empty(self, mock_db_connection):
+        """Test an empty list makes no database call"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        assert insert_comments(7, []) == 0
+        assert insert_comments_bulk([]) == []
+        mock_db.get_cursor.assert_not_called()
+    
+    def test_insert_comments_bulk_database_error(self, mock_db_connection):
+        """Test a failed batch raises DatabaseOperationError"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        with patch('database.db_operations.execute_values',
+                   side_effect=DatabaseError("boom")):
+            with pytest.raises(DatabaseOperationError):
+                insert_comments_bulk([{'post_id': 7, 'author': 'a', 'content': 'x',
+                                       'timestamp': datetime(2024, 1, 1)}])
+
+
+class TestIngestPostBundle:
+    """Test storing a post with its sentiment and comments in one transaction"""
+    
+    POST = {
+        'post_id': 'post1',
+        'platform': 'instagram',
+        'author': 'user',
+        'content': 'content',
+        'timestamp': datetime(2024, 1, 1)
+    }
+    SENTIMENT = {
+        'score': 0.5, 'label': 'positive', 'confidence': 0.9, 'compound': 0.5,
+        'positive': 0.6, 'neutral': 0.3, 'negative': 0.1
+    }
+    
+    def test_bundle_is_one_function_call(self, mock_db_connection):
+        """Test post, sentiment and comments go out in one statement"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (7, 3, [11, 12])
+        
+        result = ingest_post_bundle(self.POST, self.SENTIMENT, [
+            {'author': 'a', 'content': 'x', 'timestamp': datetime(2024, 1, 1)},
+            {'author': 'b', 'content': 'y', 'timestamp': datetime(2024, 1, 2),
+             'raw_data': {'likes': 3}}
+        ])
+        
+        assert result == (7, 3, [11, 12])
+        prepare, execute = mock_cursor.execute.call_args_list
+        assert prepare[0][0].startswith('PREPARE ingest_post_bundle_v1')
+        assert 'FROM ingest_post_bundle($1, $2, $3)' in prepare[0][0]
+        
+        post, sentiment, comments = (param.adapted for param in execute[0][1])
+        assert post['timestamp'] == '2024-01-01T00:00:00'
+        assert post['likes'] == 0
+        assert post['raw_data'] is None
+        assert sentiment['model'] == 'vader'
+        assert [c['timestamp'] for c in comments] == [
+            '2024-01-01T00:00:00', '2024-01-02T00:00:00'
+        ]
+        assert comments[1]['raw_data'] == {'likes': 3}
+        mock_db.get_cursor.assert_called_once_with(commit=True, async_commit=False)
+    
+    def test_bundle_without_sentiment_or_comments(self, mock_db_connection):
+        """Test missing children are sent as NULL"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (7, None, [])
+        
+        assert ingest_post_bundle(self.POST) == (7, None, [])
+        assert mock_cursor.execute.call_args[0][1][1:] == (None, None)
+    
+    def test_bundle_database_error(self, mock_db_connection):
+        """Test a rejected bundle raises DatabaseOperationError"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.execute.side_effect = DatabaseError("boom")
+        
+        with pytest.raises(DatabaseOperationError):
+            ingest_post_bundle(self.POST, comments=[
+                {'author': 'a', 'content': 'x', 'timestamp': datetime(2024, 1, 1)}
+            ])
+
+
 class TestInsertExecutionLog:
     """Test insert_execution_log function"""
     
@@ -237,7 +807,8 @@ class TestInsertExecutionLog:
         )
         
         assert result == 1
-        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_count == 2  # PREPARE + EXECUTE
+        mock_db.get_cursor.assert_called_once_with(commit=True, async_commit=True)
         
         call_args = mock_cursor.execute.call_args
         assert "wf_123" in call_args[0][1]
@@ -284,6 +855,78 @@ class TestQueryMethods:
         
         call_args = mock_cursor.execute.call_args
         assert 'post123' in call_args[0][1]
+        assert 'SELECT *' not in call_args[0][0]
+        assert 'raw_data' not in call_args[0][0]
+    
+    def test_get_post_raw(self, mock_db_connection):
+        """Test raw scraper data is fetched on its own"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = ({'extra': 'data'},)
+        
+        result = get_post_raw('post123')
+        
+        assert result == {'extra': 'data'}
+        prepare, execute = mock_cursor.execute.call_args_list
+        assert prepare[0][0].startswith('PREPARE get_post_raw_v1')
+        assert 'SELECT raw_data FROM posts' in prepare[0][0]
+        assert execute[0] == ('EXECUTE get_post_raw_v1 (%s)', ('post123',))
+    
+    def test_point_lookups_are_prepared_once(self, mock_db_connection):
+        """Test repeated lookups on a connection only EXECUTE the statement"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.description = [('id',), ('post_id',), ('label',)]
+        mock_cursor.fetchone.return_value = (1, 7, 'positive')
+        
+        get_sentiment_by_post_id(7)
+        get_sentiment_by_post_id(8)
+        
+        queries = [c[0][0] for c in mock_cursor.execute.call_args_list]
+        assert len(queries) == 3
+        assert queries[0].startswith('PREPARE get_sentiment_by_post_id_v1')
+        assert 'SELECT *' not in queries[0]
+        assert queries[1:] == ['EXECUTE get_sentiment_by_post_id_v1 (%s)'] * 2
+    
+    def test_get_comments_by_post_id_returns_dict_rows(self, mock_db_connection):
+        """Test comments are read through a RealDictCursor"""
+        mock_db, mock_cursor = mock_db_connection
+        rows = [{'id': 1, 'post_id': 7, 'content': 'nice'}]
+        mock_cursor.fetchall.return_value = rows
+        
+        assert get_comments_by_post_id(7) == rows
+        mock_db.get_cursor.assert_called_once_with(dict_rows=True)
+    
+    def test_get_sentiments_by_post_ids_single_query(self, mock_db_connection):
+        """Test sentiments for many posts are fetched with one ANY() query"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [
+            {'id': 4, 'post_id': 1, 'label': 'positive'},
+            {'id': 9, 'post_id': 3, 'label': 'negative'},
+        ]
+        
+        result = get_sentiments_by_post_ids((1, 2, 3))
+        
+        assert result == {
+            1: {'id': 4, 'post_id': 1, 'label': 'positive'},
+            3: {'id': 9, 'post_id': 3, 'label': 'negative'},
+        }
+        mock_cursor.execute.assert_called_once()
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'post_id = ANY(%s::integer[])' in query
+        assert params == ([1, 2, 3],)
+    
+    def test_get_sentiments_by_post_ids_empty(self, mock_db_connection):
+        """Test no query is sent for an empty id list"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        assert get_sentiments_by_post_ids([]) == {}
+        mock_db.get_cursor.assert_not_called()
+    
+    def test_get_post_raw_not_found(self, mock_db_connection):
+        """Test get_post_raw returns None for unknown posts"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = None
+        
+        assert get_post_raw('nonexistent') is None
     
     def test_get_post_by_post_id_not_found(self, mock_db_connection):
         """Test retrieving post by post_id when it doesn't exist"""
@@ -311,12 +954,9 @@ class TestQueryMethods:
     def test_get_posts_by_date_range(self, mock_db_connection):
         """Test retrieving posts by date range"""
         mock_db, mock_cursor = mock_db_connection
-        mock_cursor.description = [
-            ('id',), ('post_id',), ('timestamp',)
-        ]
         mock_cursor.fetchall.return_value = [
-            (1, 'post1', datetime.now()),
-            (2, 'post2', datetime.now())
+            {'id': 1, 'post_id': 'post1', 'timestamp': datetime.now()},
+            {'id': 2, 'post_id': 'post2', 'timestamp': datetime.now()}
         ]
         
         start_date = datetime.now() - timedelta(days=7)
@@ -326,6 +966,7 @@ class TestQueryMethods:
         
         assert len(result) == 2
         assert result[0]['post_id'] == 'post1'
+        mock_db.get_cursor.assert_called_once_with(dict_rows=True)
         
         call_args = mock_cursor.execute.call_args
         assert start_date in call_args[0][1]
@@ -348,6 +989,33 @@ class TestQueryMethods:
         call_args = mock_cursor.execute.call_args
         assert 'instagram' in call_args[0][1]
     
+    def test_column_names_cached_per_query(self, mock_db_connection):
+        """Test column names are built once per query text"""
+        mock_db, mock_cursor = mock_db_connection
+        description = MagicMock()
+        description.__len__.return_value = 3
+        description.__iter__.side_effect = lambda: iter([('id',), ('post_id',), ('platform',)])
+        mock_cursor.description = description
+        mock_cursor.fetchone.return_value = (1, 'post123', 'twitter')
+        
+        first = get_post_by_id(1)
+        second = get_post_by_id(2)
+        
+        assert first == second == {'id': 1, 'post_id': 'post123', 'platform': 'twitter'}
+        assert description.__iter__.call_count == 1
+    
+    def test_column_names_rebuilt_when_columns_change(self, mock_db_connection):
+        """Test a cached name list is replaced when the column count changes"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.description = [('id',), ('post_id',)]
+        mock_cursor.fetchone.return_value = (1, 1)
+        get_sentiment_by_post_id(1)
+        
+        mock_cursor.description = [('id',), ('post_id',), ('label',)]
+        mock_cursor.fetchone.return_value = (1, 1, 'positive')
+        
+        assert get_sentiment_by_post_id(1)['label'] == 'positive'
+    
     def test_get_sentiment_by_post_id(self, mock_db_connection):
         """Test retrieving sentiment by post ID"""
         mock_db, mock_cursor = mock_db_connection
@@ -365,12 +1033,11 @@ class TestQueryMethods:
     def test_get_posts_with_sentiment(self, mock_db_connection):
         """Test retrieving posts with sentiment data (JOIN query)"""
         mock_db, mock_cursor = mock_db_connection
-        mock_cursor.description = [
-            ('id',), ('post_id',), ('content',), ('score',), ('label',)
-        ]
         mock_cursor.fetchall.return_value = [
-            (1, 'post1', 'content1', 0.8, 'positive'),
-            (2, 'post2', 'content2', -0.3, 'negative')
+            {'id': 1, 'post_id': 'post1', 'content': 'content1',
+             'score': 0.8, 'label': 'positive'},
+            {'id': 2, 'post_id': 'post2', 'content': 'content2',
+             'score': -0.3, 'label': 'negative'}
         ]
         
         start_date = datetime.now() - timedelta(days=7)
@@ -386,6 +1053,59 @@ class TestQueryMethods:
         call_args = mock_cursor.execute.call_args
         query = call_args[0][0]
         assert 'JOIN' in query
+    
+    def test_get_posts_with_sentiment_variants(self, mock_db_connection):
+        """Test the light and full variants select their own post columns"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        start_date = datetime(2024, 1, 1)
+        end_date = datetime(2024, 1, 31)
+        
+        get_posts_with_sentiment_light(start_date, end_date, platform='twitter')
+        light_query, params = mock_cursor.execute.call_args[0]
+        get_posts_with_sentiment_full(start_date, end_date)
+        full_query = mock_cursor.execute.call_args[0][0]
+        
+        assert 'p.content' not in light_query
+        assert 'p.raw_data' not in light_query
+        assert 's.label' in light_query
+        assert params == (start_date, end_date, 'twitter')
+        assert 'p.content' in full_query
+        assert 'p.raw_data' in full_query
+    
+    def test_get_posts_with_sentiment_streaming(self, mock_db_connection):
+        """Test fetch_all=False streams rows through a server-side cursor"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.__iter__.return_value = iter([
+            {'id': 1, 'post_id': 'post1', 'label': 'positive'},
+            {'id': 2, 'post_id': 'post2', 'label': 'negative'}
+        ])
+        
+        start_date = datetime.now() - timedelta(days=7)
+        end_date = datetime.now()
+        
+        result = get_posts_with_sentiment(start_date, end_date, fetch_all=False)
+        
+        # Nothing runs until the iterator is consumed
+        mock_db.get_cursor.assert_not_called()
+        assert [row['post_id'] for row in result] == ['post1', 'post2']
+        mock_db.get_cursor.assert_called_once_with(
+            dict_rows=True, name='posts_with_sentiment_stream'
+        )
+        assert mock_cursor.itersize == STREAM_ITERSIZE
+        mock_cursor.fetchall.assert_not_called()
+    
+    def test_get_posts_by_date_range_streaming_error(self, mock_db_connection):
+        """Test streaming errors surface as DatabaseOperationError"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.execute.side_effect = DatabaseError("Query failed")
+        
+        result = get_posts_by_date_range(
+            datetime.now() - timedelta(days=7), datetime.now(), fetch_all=False
+        )
+        
+        with pytest.raises(DatabaseOperationError):
+            list(result)
 
 
 class TestReportQueries:
@@ -409,12 +1129,154 @@ class TestReportQueries:
         assert result['neutral'] == 75
         assert result['negative'] == 25
     
+    def test_get_dashboard_bundle(self, mock_db_connection):
+        """Test the three dashboard aggregates are read from one result set"""
+        mock_db, mock_cursor = mock_db_connection
+        summary = {
+            'days': [datetime(2024, 1, 1).date(), datetime(2024, 1, 2).date()],
+            'day_counts': [4, 3],
+            'labels': ['positive', 'neutral', 'negative'],
+            'label_counts': [2, 1, 0]
+        }
+        post_columns = dict.fromkeys(
+            ['post_id', 'platform', 'author', 'content', 'timestamp', 'likes',
+             'comments_count', 'shares', 'url', 'media_type', 'hashtags']
+        )
+        mock_cursor.fetchall.return_value = [
+            {**summary, **post_columns, 'id': 9, 'total_engagement': 50},
+            {**summary, **post_columns, 'id': 4, 'total_engagement': 20}
+        ]
+        start_date = datetime(2024, 1, 1)
+        end_date = datetime(2024, 1, 8)
+        
+        result = get_dashboard_bundle(start_date, end_date, platform='twitter', top_limit=2)
+        
+        assert result['daily_counts'] == [
+            (datetime(2024, 1, 1).date(), 4), (datetime(2024, 1, 2).date(), 3)
+        ]
+        assert result['sentiment_distribution'] == {
+            'positive': 2, 'neutral': 1, 'negative': 0
+        }
+        assert [post['id'] for post in result['top_posts']] == [9, 4]
+        assert 'days' not in result['top_posts'][0]
+        
+        mock_cursor.execute.assert_called_once()
+        query, params = mock_cursor.execute.call_args[0]
+        assert query.count('FROM posts') == 1
+        assert params == (start_date, end_date, 'twitter', end_date, 2)
+    
+    def test_get_dashboard_bundle_without_posts(self, mock_db_connection):
+        """Test an empty range still returns every label"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [{
+            'days': None, 'day_counts': None,
+            'labels': ['positive', 'neutral', 'negative'], 'label_counts': [0, 0, 0],
+            'id': None
+        }]
+        
+        result = get_dashboard_bundle(datetime(2024, 1, 1), datetime(2024, 1, 2))
+        
+        assert result == {
+            'daily_counts': [],
+            'sentiment_distribution': {'positive': 0, 'neutral': 0, 'negative': 0},
+            'top_posts': []
+        }
+    
+    def test_get_hashtag_frequency(self, mock_db_connection):
+        """Test hashtags are counted from post_hashtags, not the content"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [('travel', 12), ('food', 4)]
+        
+        result = get_hashtag_frequency(limit=5)
+        
+        assert result == [
+            {'hashtag': 'travel', 'count': 12},
+            {'hashtag': 'food', 'count': 4}
+        ]
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'SUM(ph.occurrences)' in query
+        assert 'REGEXP' not in query.upper()
+        assert 'JOIN posts' not in query
+        assert params == (5,)
+    
+    def test_get_hashtag_frequency_filters_join_posts(self, mock_db_connection):
+        """Test date and platform filters are applied through posts"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        start_date = datetime(2024, 1, 1)
+        end_date = datetime(2024, 1, 31)
+        
+        get_hashtag_frequency(start_date, end_date, platform='instagram')
+        
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'JOIN posts p ON p.id = ph.post_id' in query
+        assert 'p.platform = %s' in query
+        assert params == (start_date, end_date, 'instagram', 'instagram', 20)
+    
+    def test_get_hashtag_frequency_from_summary(self, mock_db_connection):
+        """Test the summary variant sums the daily hashtag rows"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [('travel', 12)]
+        start_date = datetime(2024, 1, 1, 9)
+        
+        result = get_hashtag_frequency(start_date, platform='x', from_summary=True)
+        
+        assert result == [{'hashtag': 'travel', 'count': 12}]
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'FROM mv_daily_hashtags' in query
+        assert 'post_hashtags' not in query
+        assert params == (start_date, None, 'x', 'x', 20)
+    
+    def test_get_hashtag_frequency_fixed_query_text(self, mock_db_connection):
+        """Test every filter combination sends the same filtered query text"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_hashtag_frequency(start_date=datetime(2024, 1, 1))
+        get_hashtag_frequency(platform='tiktok', limit=3)
+        
+        (first, first_params), (second, second_params) = [
+            call[0] for call in mock_cursor.execute.call_args_list
+        ]
+        assert first == second
+        assert first_params == (datetime(2024, 1, 1), None, None, None, 20)
+        assert second_params == (None, None, 'tiktok', 'tiktok', 3)
+    
+    def test_backfill_hashtags_copies_extracted_counts(self, mock_db_connection):
+        """Test hashtags are extracted client-side and copied per batch"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.rowcount = 2
+        rows = [
+            {'id': 1, 'content': '#Food and #food at #travel'},
+            {'id': 2, 'content': None},
+            {'id': 3, 'content': '#café'},
+        ]
+        
+        with patch('database.db_operations._stream_rows',
+                   return_value=iter(rows)) as mock_stream:
+            result = backfill_hashtags(batch_size=2)
+        
+        assert result == 4
+        assert mock_stream.call_args[0][3] == 2
+        first, second = [
+            call[0][1].getvalue() for call in mock_cursor.copy_expert.call_args_list
+        ]
+        assert first == "1\tfood\t2\n1\ttravel\t1\n"
+        assert second == "3\tcafé\t1\n"
+        merge_query = mock_cursor.execute.call_args[0][0]
+        assert 'ON CONFLICT (post_id, hashtag) DO NOTHING' in merge_query
+        create_query = mock_cursor.execute.call_args_list[0][0][0]
+        assert 'CREATE TEMP TABLE IF NOT EXISTS post_hashtags_staging' in create_query
+        mock_db.get_cursor.assert_called_with(commit=True, async_commit=True)
+    
     def test_get_sentiment_distribution_missing_labels(self, mock_db_connection):
         """Test sentiment distribution fills in missing labels with 0"""
         mock_db, mock_cursor = mock_db_connection
+        # The query returns a zero-count row for labels with no sentiments
         mock_cursor.fetchall.return_value = [
-            ('positive', 100)
-            # neutral and negative missing
+            ('positive', 100),
+            ('neutral', 0),
+            ('negative', 0)
         ]
         
         start_date = datetime.now() - timedelta(days=7)
@@ -425,17 +1287,39 @@ class TestReportQueries:
         assert result['positive'] == 100
         assert result['neutral'] == 0
         assert result['negative'] == 0
+        
+        query = mock_cursor.execute.call_args[0][0]
+        assert "VALUES ('positive'), ('neutral'), ('negative')" in query
+        assert 'LEFT JOIN' in query
+    
+    def test_get_sentiment_distribution_from_summary(self, mock_db_connection):
+        """Test the summary variant reads the daily materialized view"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [
+            ('positive', 10), ('neutral', 0), ('negative', 2)
+        ]
+        
+        start_date = datetime(2024, 1, 1, 9, 30)
+        end_date = datetime(2024, 1, 7, 18, 0)
+        
+        result = get_sentiment_distribution(
+            start_date, end_date, platform='instagram', from_summary=True
+        )
+        
+        assert result == {'positive': 10, 'neutral': 0, 'negative': 2}
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'FROM posts' not in query
+        assert 'mv_daily_sentiment' in query
+        assert params == (start_date, end_date, 'instagram')
     
     def test_get_top_posts_by_engagement(self, mock_db_connection):
         """Test getting top posts by engagement"""
         mock_db, mock_cursor = mock_db_connection
-        mock_cursor.description = [
-            ('id',), ('post_id',), ('likes',), ('comments_count',), 
-            ('shares',), ('total_engagement',)
-        ]
         mock_cursor.fetchall.return_value = [
-            (1, 'post1', 100, 50, 25, 175),
-            (2, 'post2', 80, 40, 20, 140)
+            {'id': 1, 'post_id': 'post1', 'likes': 100, 'comments_count': 50,
+             'shares': 25, 'total_engagement': 175},
+            {'id': 2, 'post_id': 'post2', 'likes': 80, 'comments_count': 40,
+             'shares': 20, 'total_engagement': 140}
         ]
         
         start_date = datetime.now() - timedelta(days=7)
@@ -449,8 +1333,10 @@ class TestReportQueries:
         # Verify ORDER BY and LIMIT in query
         call_args = mock_cursor.execute.call_args
         query = call_args[0][0]
-        assert 'ORDER BY' in query
+        assert 'ORDER BY total_engagement DESC' in query
         assert 'LIMIT' in query
+        # Reads the stored column rather than summing per row
+        assert 'likes + comments_count' not in query
     
     def test_get_execution_logs_no_filters(self, mock_db_connection):
         """Test getting execution logs without filters"""
@@ -466,6 +1352,10 @@ class TestReportQueries:
         result = get_execution_logs(limit=100)
         
         assert len(result) == 2
+        
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'WHERE' not in query
+        assert params == (100,)
     
     def test_get_execution_logs_with_filters(self, mock_db_connection):
         """Test getting execution logs with workflow and status filters"""
@@ -488,6 +1378,38 @@ class TestReportQueries:
         call_args = mock_cursor.execute.call_args
         assert 'daily_scraping' in call_args[0][1]
         assert 'failed' in call_args[0][1]
+        assert call_args[0][1] == ('daily_scraping', 'failed', 50)
+        assert 'workflow_name = %s AND status = %s' in call_args[0][0]
+    
+    def test_get_execution_logs_streaming(self, mock_db_connection):
+        """Test fetch_all=False streams logs through a server-side cursor"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.__iter__.return_value = iter([
+            {'id': 2, 'status': 'failed'},
+            {'id': 1, 'status': 'failed'}
+        ])
+        
+        result = get_execution_logs(status='failed', limit=5000, fetch_all=False)
+        
+        mock_db.get_cursor.assert_not_called()
+        assert [row['id'] for row in result] == [2, 1]
+        mock_db.get_cursor.assert_called_once_with(
+            dict_rows=True, name='execution_logs_stream'
+        )
+        mock_cursor.fetchall.assert_not_called()
+        assert mock_cursor.execute.call_args[0][1] == ('failed', 5000)
+    
+    def test_get_execution_logs_status_only(self, mock_db_connection):
+        """Test a single filter binds only its own parameter"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_execution_logs(status='failed', limit=10)
+        
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'WHERE status = %s' in query
+        assert 'workflow_name = %s' not in query
+        assert params == ('failed', 10)
     
     def test_get_daily_post_counts(self, mock_db_connection):
         """Test getting daily post counts"""
@@ -509,15 +1431,450 @@ class TestReportQueries:
         assert result[0][1] == 50  # Count for yesterday
         assert result[1][1] == 75  # Count for today
         
-        # Verify GROUP BY in query
+        # Verify GROUP BY on the day over a half-open range
         call_args = mock_cursor.execute.call_args
         query = call_args[0][0]
         assert 'GROUP BY' in query
+        assert "timestamp::date" in query
+        assert 'timestamp < %s' in query
+    
+    def test_get_daily_post_counts_from_summary(self, mock_db_connection):
+        """Test the summary variant sums the hourly rows of each day"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_daily_post_counts(
+            datetime(2024, 1, 1), datetime(2024, 1, 8), from_summary=True
+        )
+        
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'FROM mv_hourly_posts' in query
+        assert 'SUM(post_count)' in query
+        assert params == (datetime(2024, 1, 1), datetime(2024, 1, 8))
+    
+    def test_refresh_daily_sentiment_summary(self, mock_db_connection):
+        """Test every existing summary view is refreshed concurrently"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [('mv_daily_sentiment',), ('mv_hourly_posts',)]
+        
+        assert refresh_daily_sentiment_summary() is True
+        
+        mock_db.get_cursor.assert_called_once_with(commit=True)
+        lookup, refreshes = (
+            mock_cursor.execute.call_args_list[0], mock_cursor.execute.call_args_list[1:]
+        )
+        assert lookup[0][1] == (['mv_daily_sentiment', 'mv_hourly_posts', 'mv_daily_hashtags'],)
+        assert [call[0][0] for call in refreshes] == [
+            'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_sentiment;',
+            'REFRESH MATERIALIZED VIEW CONCURRENTLY mv_hourly_posts;',
+        ]
+    
+    def test_refresh_daily_sentiment_summary_without_view(self, mock_db_connection):
+        """Test databases without the summary migrations are skipped"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        assert refresh_daily_sentiment_summary() is False
+        assert mock_cursor.execute.call_count == 1
+
+    
+    def test_get_posting_time_heatmap(self, mock_db_connection):
+        """Test the heatmap groups posts by weekday and hour"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [(1, 14, 25)]
+        
+        result = get_posting_time_heatmap(platform='instagram')
+        
+        assert result == [{'day_of_week': 1, 'hour': 14, 'count': 25}]
+        prepare = mock_cursor.execute.call_args_list[0][0][0]
+        assert prepare.startswith('PREPARE posting_time_heatmap_v1')
+        assert 'EXTRACT(DOW FROM timestamp)' in prepare
+        assert 'FROM posts' in prepare
+        query, params = mock_cursor.execute.call_args[0]
+        assert query.startswith('EXECUTE posting_time_heatmap_v1')
+        assert params == (None, None, 'instagram')
+    
+    def test_get_posting_time_heatmap_reuses_one_statement(self, mock_db_connection):
+        """Test every filter combination runs the same prepared statement"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_posting_time_heatmap(platform='instagram')
+        get_posting_time_heatmap(datetime(2024, 1, 1), datetime(2024, 2, 1))
+        
+        queries = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        assert sum(q.startswith('PREPARE') for q in queries) == 1
+        assert sum(q.startswith('EXECUTE posting_time_heatmap_v1') for q in queries) == 2
+    
+    def test_get_posting_time_heatmap_from_summary(self, mock_db_connection):
+        """Test the summary variant sums the hourly rows of whole days"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        start_date = datetime(2024, 1, 1, 9)
+        end_date = datetime(2024, 1, 7, 18)
+        
+        get_posting_time_heatmap(start_date, end_date, from_summary=True)
+        
+        prepare = mock_cursor.execute.call_args_list[0][0][0]
+        assert prepare.startswith('PREPARE posting_time_heatmap_summary_v1')
+        assert 'FROM mv_hourly_posts' in prepare
+        assert 'SUM(post_count)' in prepare
+        assert "day >= COALESCE($1::date, '-infinity')" in prepare
+        query, params = mock_cursor.execute.call_args[0]
+        assert params == (start_date, end_date, None)
+
+    
+    def test_aggregates_are_cached_per_arguments(self, mock_db_connection):
+        """Test repeated aggregate calls reuse the result until it expires"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [('travel', 12)]
+        start_date = datetime(2024, 1, 1)
+        end_date = datetime(2024, 2, 1)
+        
+        with patch('database.db_operations.monotonic', return_value=1000.0) as clock:
+            first = get_hashtag_frequency(start_date, end_date, limit=5)
+            first[0]['count'] = 0
+            assert get_hashtag_frequency(start_date, end_date, limit=5) == [{'hashtag': 'travel', 'count': 12}]
+            assert mock_cursor.execute.call_count == 1
+            
+            # Keyword and positional arguments are the same entry
+            get_hashtag_frequency(start_date=start_date, end_date=end_date, limit=5)
+            assert mock_cursor.execute.call_count == 1
+            
+            # Other arguments are a different entry
+            get_hashtag_frequency(start_date, end_date, limit=6)
+            assert mock_cursor.execute.call_count == 2
+            
+            clock.return_value = 1301.0
+            get_hashtag_frequency(start_date, end_date, limit=5)
+            assert mock_cursor.execute.call_count == 3
+    
+    def test_aggregates_ending_now_are_not_cached(self, mock_db_connection):
+        """Test open ranges and ranges ending now are queried every time"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_hashtag_frequency(limit=5)
+        get_hashtag_frequency(limit=5)
+        get_hashtag_frequency(datetime(2024, 1, 1), datetime.now(), limit=5)
+        get_hashtag_frequency(datetime(2024, 1, 1), datetime.now(), limit=5)
+        
+        assert mock_cursor.execute.call_count == 4
+    
+    def test_summary_aggregates_are_cached_per_day(self, mock_db_connection):
+        """Test summary results are shared by all times of the same days"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_hashtag_frequency(datetime(2024, 1, 1, 9), datetime.now(), from_summary=True)
+        get_hashtag_frequency(datetime(2024, 1, 1, 17), datetime.now(), from_summary=True)
+        assert mock_cursor.execute.call_count == 1
+        
+        get_hashtag_frequency(datetime(2024, 1, 2), datetime.now(), from_summary=True)
+        assert mock_cursor.execute.call_count == 2
+    
+    def test_summary_refresh_drops_cached_aggregates(self, mock_db_connection):
+        """Test aggregates are queried again after the summaries are refreshed"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        get_posting_time_heatmap(platform='instagram', from_summary=True)
+        get_posting_time_heatmap(platform='instagram', from_summary=True)
+        refresh_daily_sentiment_summary()
+        get_posting_time_heatmap(platform='instagram', from_summary=True)
+        
+        heatmap_queries = [
+            call for call in mock_cursor.execute.call_args_list
+            if call[0][0].startswith('EXECUTE posting_time_heatmap')
+        ]
+        assert len(heatmap_queries) == 2
+
+
+@pytest.mark.skipif(
+    not os.getenv('TEST_DATABASE_URL'),
+    reason="needs a PostgreSQL database in TEST_DATABASE_URL"
+)
+class TestSummaryViewsOnPostgres:
+    """Run the summary view migrations against a real database"""
+    
+    MIGRATIONS = os.path.join(
+        os.path.dirname(__file__), '..', 'database', 'migrations'
+    )
+    
+    @pytest.fixture
+    def summary_db(self):
+        """Posts and sentiments in a scratch schema with migrations 006 and 015"""
+        import psycopg2
+        from contextlib import contextmanager
+        
+        conn = psycopg2.connect(os.environ['TEST_DATABASE_URL'])
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute("CREATE SCHEMA summary_views_test; SET search_path TO summary_views_test;")
+        try:
+            cursor.execute("""
+                CREATE TABLE posts (
+                    id SERIAL PRIMARY KEY, platform TEXT, timestamp TIMESTAMP
+                );
+                CREATE TABLE sentiments (
+                    id SERIAL PRIMARY KEY, post_id INTEGER REFERENCES posts(id), label TEXT
+                );
+            """)
+            for migration in ('006_mv_daily_sentiment.sql', '015_mv_hourly_posts.sql'):
+                with open(os.path.join(self.MIGRATIONS, migration)) as f:
+                    cursor.execute(f.read())
+            
+            db = MagicMock()
+            
+            @contextmanager
+            def get_cursor(*args, **kwargs):
+                yield conn.cursor()
+            
+            db.get_cursor.side_effect = get_cursor
+            with patch('database.db_operations.get_db_connection', return_value=db):
+                yield cursor
+        finally:
+            cursor.execute("DROP SCHEMA summary_views_test CASCADE;")
+            conn.close()
+    
+    def test_daily_post_counts_count_reanalyzed_post_once(self, summary_db):
+        """Test a post with two sentiments counts once in the daily summary"""
+        summary_db.execute("""
+            INSERT INTO posts (platform, timestamp) VALUES
+                ('instagram', '2024-01-01 09:00'), ('instagram', '2024-01-01 17:00');
+            INSERT INTO sentiments (post_id, label) VALUES
+                (1, 'neutral'), (1, 'positive'), (2, 'negative');
+            REFRESH MATERIALIZED VIEW mv_daily_sentiment;
+            REFRESH MATERIALIZED VIEW mv_hourly_posts;
+        """)
+        start_date, end_date = datetime(2024, 1, 1), datetime(2024, 1, 2)
+        
+        scanned = get_daily_post_counts(start_date, end_date)
+        summarized = get_daily_post_counts(start_date, end_date, from_summary=True)
+        
+        assert [count for _, count in scanned] == [2]
+        assert [count for _, count in summarized] == [2]
+
+
+class TestSearchPosts:
+    """Test offset and keyset pagination of search_posts"""
+    
+    def test_search_posts_offset_page_returns_next_cursor(self, mock_db_connection):
+        """Test numbered pages read the total with the rows and hand out a cursor"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [
+            {'id': 9, 'timestamp': datetime(2024, 1, 2), 'total_count': 30},
+            {'id': 8, 'timestamp': datetime(2024, 1, 1), 'total_count': 30},
+        ]
+        
+        result = search_posts(page=2, per_page=2)
+        
+        assert result['total'] == 30
+        assert result['total_pages'] == 15
+        assert result['posts'] == [
+            {'id': 9, 'timestamp': datetime(2024, 1, 2)},
+            {'id': 8, 'timestamp': datetime(2024, 1, 1)},
+        ]
+        # One query returns both the page and the total
+        mock_cursor.execute.assert_called_once()
+        data_query, params = mock_cursor.execute.call_args[0]
+        assert 'COUNT(*) OVER ()' in data_query
+        assert 'ORDER BY p.timestamp DESC, p.id DESC' in data_query
+        assert params == (2, 2)
+        # Rows come back as dicts from the cursor, no zip over description
+        mock_db.get_cursor.assert_called_once_with(dict_rows=True)
+        
+        # The cursor continues after the last row of the page
+        mock_cursor.reset_mock()
+        mock_cursor.fetchall.return_value = []
+        search_posts(per_page=2, page_cursor=result['next_cursor'])
+        query, params = mock_cursor.execute.call_args[0]
+        assert params == ('2024-01-01 00:00:00', 8, 3)
+    
+    def test_search_posts_page_past_the_end_counts(self, mock_db_connection):
+        """Test an empty page beyond the last one still reports the total"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = {'count': 4}
+        
+        result = search_posts(page=5, per_page=2)
+        
+        assert result['posts'] == []
+        assert result['total'] == 4
+        assert result['total_pages'] == 2
+        count_query, params = mock_cursor.execute.call_args[0]
+        assert 'SELECT COUNT(*)' in count_query
+        assert params == ()
+        # The count depends on the empty page, so both run in turn on
+        # one pooled connection
+        assert mock_cursor.execute.call_count == 2
+        mock_db.get_cursor.assert_called_once()
+    
+    def test_search_posts_joins_newest_sentiment(self, mock_db_connection):
+        """Test each post is listed once, with its newest sentiment"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = {'count': 0}
+        
+        search_posts(page=2)
+        
+        data_query = mock_cursor.execute.call_args_list[0][0][0]
+        count_query = mock_cursor.execute.call_args_list[1][0][0]
+        assert 'LEFT JOIN LATERAL' in data_query
+        assert 'ORDER BY id DESC' in data_query
+        assert 'LEFT JOIN sentiments' not in data_query
+        # Without a sentiment filter the count reads posts alone
+        assert 'sentiments' not in count_query
+        
+        mock_cursor.reset_mock()
+        search_posts(filters={'sentiment_label': 'negative'}, page=2)
+        count_query = mock_cursor.execute.call_args_list[1][0][0]
+        assert 'LEFT JOIN LATERAL' in count_query
+    
+    def test_search_posts_empty_first_page_skips_count(self, mock_db_connection):
+        """Test an empty first page means no matches without counting"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        result = search_posts()
+        
+        assert result['total'] == 0
+        mock_cursor.execute.assert_called_once()
+    
+    def test_search_posts_keyset_skips_count(self, mock_db_connection):
+        """Test cursor pages seek past the cursor and fetch one extra row"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [
+            {'id': 5, 'author': 'b'}, {'id': 6, 'author': 'c'}, {'id': 7, 'author': 'd'}
+        ]
+        page_cursor = _encode_page_cursor('a', 4)
+        
+        result = search_posts(
+            filters={'sort_by': 'author', 'sort_order': 'asc', 'platform': 'tiktok'},
+            per_page=2,
+            page_cursor=page_cursor
+        )
+        
+        mock_cursor.execute.assert_called_once()
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'COUNT' not in query
+        assert 'OFFSET' not in query
+        assert '(p.author, p.id) > (%s, %s)' in query
+        assert params == ('tiktok', 'a', 4, 3)
+        assert [post['id'] for post in result['posts']] == [5, 6]
+        assert result['total'] is None
+        assert result['next_cursor'] == _encode_page_cursor('c', 6)
+    
+    def test_search_posts_keyset_last_page(self, mock_db_connection):
+        """Test the last cursor page has no next cursor"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = [{'id': 1, 'timestamp': datetime(2024, 1, 1)}]
+        page_cursor = _encode_page_cursor('2024-01-02', 2)
+        
+        result = search_posts(filters={'sort_by': 'likes'}, page_cursor=page_cursor)
+        
+        # likes can be NULL, so cursors fall back to the timestamp order
+        query = mock_cursor.execute.call_args[0][0]
+        assert '(p.timestamp, p.id) < (%s, %s)' in query
+        assert result['next_cursor'] is None
+    
+    def test_search_posts_pattern_uses_ilike(self, mock_db_connection):
+        """Test a term with % is matched with ILIKE, which trigram indexes serve"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (0,)
+        mock_cursor.fetchall.return_value = []
+        
+        search_posts('Ko%pi')
+        
+        query, params = mock_cursor.execute.call_args[0]
+        assert '(p.content ILIKE %s OR p.author ILIKE %s)' in query
+        assert 'LOWER(' not in query
+        assert 'search_tsv' not in query
+        assert params[:2] == ('%Ko%pi%', '%Ko%pi%')
+    
+    def test_search_posts_words_use_full_text(self, mock_db_connection):
+        """Test plain words are looked up in search_tsv and can be ranked"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = {'count': 0}
+        mock_cursor.fetchall.return_value = []
+        
+        search_posts('kopi susu', {'sort_by': 'relevance', 'platform': 'x'}, page=3, per_page=10)
+        
+        query, params = mock_cursor.execute.call_args_list[0][0]
+        assert "p.search_tsv @@ plainto_tsquery('simple', %s)" in query
+        assert 'ILIKE' not in query
+        assert 'LOWER(' not in query
+        assert "ORDER BY ts_rank(p.search_tsv, plainto_tsquery('simple', %s)) DESC" in query
+        assert params == ('kopi susu', 'x', 'kopi susu', 10, 20)
+        
+        count_query, count_params = mock_cursor.execute.call_args[0]
+        assert count_params == ('kopi susu', 'x')
+    
+    def test_search_posts_relevance_needs_full_text(self, mock_db_connection):
+        """Test relevance sorting without a full-text term sorts by timestamp"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (0,)
+        mock_cursor.fetchall.return_value = []
+        
+        search_posts(filters={'sort_by': 'relevance'})
+        
+        query = mock_cursor.execute.call_args[0][0]
+        assert 'ORDER BY p.timestamp DESC' in query
+    
+    def test_search_posts_sort_columns(self, mock_db_connection):
+        """Test sentiment sort keys use the join and unknown keys fall back"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        
+        search_posts(filters={'sort_by': 'score', 'sort_order': 'asc'})
+        assert 'ORDER BY s.score ASC, p.id ASC' in mock_cursor.execute.call_args[0][0]
+        
+        search_posts(filters={'sort_by': 'id; DROP TABLE posts', 'sort_order': 'up'})
+        assert 'ORDER BY p.timestamp DESC, p.id DESC' in mock_cursor.execute.call_args[0][0]
+    
+    def test_search_posts_clamps_per_page(self, mock_db_connection):
+        """Test oversized pages are limited to MAX_PER_PAGE rows"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchall.return_value = []
+        mock_cursor.fetchone.return_value = {'count': 0}
+        
+        result = search_posts(page=2, per_page=10_000)
+        
+        assert result['per_page'] == 200
+        query, params = mock_cursor.execute.call_args_list[0][0]
+        assert params == (200, 200)
+    
+    def test_search_posts_invalid_cursor(self, mock_db_connection):
+        """Test a malformed cursor is rejected before querying"""
+        mock_db, mock_cursor = mock_db_connection
+        
+        with pytest.raises(ValueError):
+            search_posts(page_cursor='not-a-cursor')
+        mock_cursor.execute.assert_not_called()
 
 
 class TestDataRetention:
     """Test data retention and cleanup operations"""
     
+    def test_clear_all_data_two_statements(self, mock_db_connection):
+        """Test the counts and the truncation take one statement each"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (3, 2, 5, 7)
+        mock_cursor.fetchall.return_value = []
+        
+        result = clear_all_data()
+        
+        assert result == {
+            'comments': 3, 'sentiments': 2, 'posts': 5, 'execution_logs': 7
+        }
+        statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        assert 'SELECT COUNT(*) FROM execution_logs' in statements[0]
+        assert statements[1] == (
+            "TRUNCATE TABLE comments, sentiments, posts, execution_logs "
+            "RESTART IDENTITY CASCADE"
+        )
+        assert not any('ALTER SEQUENCE' in statement for statement in statements)
+    
     def test_delete_old_posts(self, mock_db_connection):
         """Test deleting old posts"""
         mock_db, mock_cursor = mock_db_connection
@@ -531,7 +1888,30 @@ class TestDataRetention:
         call_args = mock_cursor.execute.call_args
         query = call_args[0][0]
         assert 'DELETE FROM posts' in query
-        assert 'timestamp <' in query
+        assert 'timestamp < LOCALTIMESTAMP - make_interval(days => %s)' in query
+        assert 'RETURNING' not in query
+        assert call_args[0][1] == (90,)
+    
+    def test_delete_old_posts_in_batches(self, mock_db_connection):
+        """Test batched deletion repeats until a batch comes back short"""
+        mock_db, mock_cursor = mock_db_connection
+        rowcounts = iter([10, 10, 3])
+        
+        def execute(query, params=None):
+            if query.lstrip().startswith('DELETE'):
+                mock_cursor.rowcount = next(rowcounts)
+        
+        mock_cursor.execute.side_effect = execute
+        
+        result = delete_old_posts(days=90, batch_size=10)
+        
+        assert result == 23
+        # Three DELETE batches, each in its own transaction
+        assert mock_cursor.execute.call_count == 3
+        assert mock_db.get_cursor.call_count == 3
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'LIMIT %s' in query
+        assert params == (90, 10)
     
     def test_delete_old_posts_custom_retention(self, mock_db_connection):
         """Test deleting old posts with custom retention period"""
@@ -542,6 +1922,17 @@ class TestDataRetention:
         
         assert result == 10
     
+    def test_delete_old_posts_skips_partition_lookup(self, mock_db_connection):
+        """Test posts, which is not partitioned, only runs the DELETE"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.rowcount = 2
+        
+        result = delete_old_posts(days=90)
+        
+        assert result == 2
+        assert mock_cursor.execute.call_count == 1
+        assert 'pg_inherits' not in mock_cursor.execute.call_args[0][0]
+    
     def test_delete_old_execution_logs(self, mock_db_connection):
         """Test deleting old execution logs"""
         mock_db, mock_cursor = mock_db_connection
@@ -555,6 +1946,33 @@ class TestDataRetention:
         query = call_args[0][0]
         assert 'DELETE FROM execution_logs' in query
         assert 'executed_at <' in query
+        assert 'RETURNING' not in query
+    
+    def test_delete_old_execution_logs_partitioned(self, mock_db_connection):
+        """Test expired log partitions are dropped and upcoming ones created"""
+        mock_db, mock_cursor = mock_db_connection
+        cutoff = datetime(2024, 3, 15)
+        mock_cursor.fetchall.return_value = [
+            ('execution_logs_2024_01', 40, cutoff), ('execution_logs_default', 0, cutoff)
+        ]
+        # Default partition exists, partitions created
+        mock_cursor.fetchone.side_effect = [(True,), (2,)]
+        mock_cursor.rowcount = 5
+        
+        result = delete_old_execution_logs(days=30)
+        
+        # Estimated rows of the dropped partition plus the deleted rows
+        assert result == 45
+        statements = [repr(c[0][0]) for c in mock_cursor.execute.call_args_list]
+        assert not any('COUNT(*)' in q for q in statements)
+        dropped = [q for q in statements if 'DROP TABLE' in q]
+        assert len(dropped) == 1
+        assert "Identifier('execution_logs_2024_01')" in dropped[0]
+        mock_cursor.execute.assert_any_call(
+            "SELECT create_monthly_partitions(%s, %s, %s);",
+            ('execution_logs', 'executed_at', 3)
+        )
+        assert 'DELETE FROM execution_logs' in statements[-1]
     
     def test_delete_old_posts_database_error(self, mock_db_connection):
         """Test handling database error during deletion"""
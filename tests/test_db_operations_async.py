@@ -0,0 +1,87 @@
+"""
+Unit tests for the async database operations module.
+
+Tests cover:
+- Coroutines delegate to the synchronous operations
+- Errors propagate unchanged
+- Worker pool is sized to the connection pool
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch, MagicMock
+from datetime import datetime
+from psycopg2 import DatabaseError
+
+from database import db_operations_async
+from database.db_operations import DatabaseOperationError
+
+
+@pytest.fixture
+def mock_db_connection():
+    """Fixture for mocked database connection"""
+    mock_db = MagicMock()
+    mock_db.max_conn = 4
+    mock_cursor = MagicMock()
+    
+    mock_db.get_cursor.return_value.__enter__.return_value = mock_cursor
+    mock_db.get_cursor.return_value.__exit__.return_value = False
+    
+    with patch('database.db_operations.get_db_connection', return_value=mock_db), \
+         patch('database.db_operations_async.get_db_connection', return_value=mock_db), \
+         patch('database.db_operations_async._executor', None):
+        yield mock_db, mock_cursor
+
+
+class TestAsyncOperations:
+    """Test coroutine wrappers around the synchronous operations"""
+    
+    def test_insert_post(self, mock_db_connection):
+        """Test insert_post coroutine returns the database ID"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (1,)
+        
+        result = asyncio.run(db_operations_async.insert_post(
+            post_id="post123",
+            platform="instagram",
+            author="testuser",
+            content="Test post content",
+            timestamp=datetime.now()
+        ))
+        
+        assert result == 1
+        assert mock_cursor.execute.call_args[0][1][0] == "post123"
+    
+    def test_concurrent_inserts(self, mock_db_connection):
+        """Test several inserts can be awaited together"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.fetchone.return_value = (1,)
+        
+        async def insert_many():
+            return await asyncio.gather(*(
+                db_operations_async.insert_post(
+                    post_id=f"post{i}",
+                    platform="instagram",
+                    author="user",
+                    content="content",
+                    timestamp=datetime.now()
+                )
+                for i in range(10)
+            ))
+        
+        assert asyncio.run(insert_many()) == [1] * 10
+        assert db_operations_async._executor._max_workers == 4
+    
+    def test_error_propagates(self, mock_db_connection):
+        """Test database errors surface as DatabaseOperationError"""
+        mock_db, mock_cursor = mock_db_connection
+        mock_cursor.execute.side_effect = DatabaseError("Connection lost")
+        
+        with pytest.raises(DatabaseOperationError):
+            asyncio.run(db_operations_async.insert_post(
+                post_id="post123",
+                platform="instagram",
+                author="testuser",
+                content="content",
+                timestamp=datetime.now()
+            ))
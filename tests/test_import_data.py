@@ -0,0 +1,92 @@
+"""
+Unit tests for the import_data CLI script.
+
+Tests the bulk import of a file and its per-row fallbacks when a batch
+of posts or sentiments is rejected.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from scripts.import_data import import_json_file, import_post_batch
+from database.db_operations import DatabaseOperationError
+
+
+RECORDS = [{'post_id': 'p1'}, {'post_id': 'p2'}, {'post_id': 'p3'}]
+SENTIMENTS = [
+    {'score': 0.6, 'label': 'positive', 'confidence': 0.9},
+    None,
+    {'score': -0.4, 'label': 'negative', 'confidence': 95.0},
+]
+
+
+def rejected(*args, **kwargs):
+    raise DatabaseOperationError("batch rejected")
+
+
+@pytest.fixture
+def db():
+    """Mock the database functions used by the import script"""
+    names = ['insert_posts_bulk', 'insert_sentiments_bulk', 'insert_post', 'insert_sentiment']
+    patchers = {name: patch(f'scripts.import_data.{name}') for name in names}
+    mocks = {name: patcher.start() for name, patcher in patchers.items()}
+    mocks['insert_posts_bulk'].return_value = [11, 12, 13]
+    yield mocks
+    for patcher in patchers.values():
+        patcher.stop()
+
+
+class TestImportPostBatch:
+    """Test the bulk import and its per-row fallbacks"""
+
+    def test_bulk_import(self, db):
+        """Test posts and sentiments each go in as one batch"""
+        assert import_post_batch(RECORDS, SENTIMENTS) == 3
+
+        sentiments = db['insert_sentiments_bulk'].call_args[0][0]
+        assert [s['post_id'] for s in sentiments] == [11, 13]
+        db['insert_post'].assert_not_called()
+        db['insert_sentiment'].assert_not_called()
+
+    def test_rejected_post_batch_retries_each_post(self, db):
+        """Test a rejected post batch goes through _insert_post_record per post"""
+        db['insert_posts_bulk'].side_effect = rejected
+        db['insert_post'].side_effect = [11, DatabaseOperationError("bad row"), 13]
+
+        assert import_post_batch(RECORDS, SENTIMENTS) == 2
+
+        assert [c.kwargs['post_id'] for c in db['insert_post'].call_args_list] == ['p1', 'p2', 'p3']
+        assert [c.kwargs['post_id'] for c in db['insert_sentiment'].call_args_list] == [11, 13]
+        db['insert_sentiments_bulk'].assert_not_called()
+
+    def test_rejected_sentiment_batch_retries_each_sentiment(self, db):
+        """Test a rejected sentiment batch only loses the bad sentiment"""
+        db['insert_sentiments_bulk'].side_effect = rejected
+        db['insert_sentiment'].side_effect = [None, DatabaseOperationError("numeric field overflow")]
+
+        assert import_post_batch(RECORDS, SENTIMENTS) == 3
+
+        # p2 has no sentiment and is not retried
+        assert [c.kwargs['post_id'] for c in db['insert_sentiment'].call_args_list] == [11, 13]
+        db['insert_post'].assert_not_called()
+
+
+class TestImportJsonFile:
+    """Test importing a JSON file"""
+
+    def test_non_numeric_sentiment_skips_post(self, db, tmp_path):
+        """Test a post whose sentiment score is not a number is not imported"""
+        db['insert_posts_bulk'].return_value = [11]
+        file_path = tmp_path / 'posts.json'
+        file_path.write_text(json.dumps({'posts': [
+            {'post_id': 'p1', 'author': 'alice', 'timestamp': '2024-01-01T09:00:00Z',
+             'sentiment': {'score': 0.6, 'label': 'positive'}},
+            {'post_id': 'p2', 'author': 'alice', 'timestamp': '2024-01-02T09:00:00Z',
+             'sentiment': {'score': 'high', 'label': 'positive'}},
+        ]}), encoding='utf-8')
+
+        assert import_json_file(str(file_path)) == (1, 0, 1)
+
+        records = db['insert_posts_bulk'].call_args[0][0]
+        assert [r['post_id'] for r in records] == ['p1']
@@ -0,0 +1,139 @@
+"""
+Unit tests for the upload import service.
+
+Tests the bulk import of uploaded posts and its per-row fallbacks when a
+batch of posts, sentiments or comments is rejected.
+"""
+
+import io
+import json
+import pytest
+from unittest.mock import patch
+
+from app.services.import_service import process_import_file
+from database.db_operations import DatabaseOperationError
+
+
+POSTS = [
+    {
+        'post_id': 'p1', 'author': 'alice', 'timestamp': '2024-01-01T09:00:00Z',
+        'sentiment': {'score': 0.6, 'label': 'positive', 'confidence': 0.9},
+        'comments': [{'author': 'bob', 'text': 'Mantap!'}],
+    },
+    {
+        'post_id': 'p2', 'author': 'alice', 'timestamp': '2024-01-02T09:00:00Z',
+        'sentiment': {'score': -0.4, 'label': 'negative', 'confidence': 0.8},
+    },
+    {
+        'post_id': 'p3', 'author': 'alice', 'timestamp': '2024-01-03T09:00:00Z',
+        'comments': [{'author': 'carol', 'text': 'Keren'}],
+    },
+    # Missing author, skipped before it reaches the database
+    {'post_id': 'p4', 'timestamp': '2024-01-04T09:00:00Z'},
+]
+
+
+def upload(posts):
+    """Uploaded JSON file with the given posts"""
+    return io.BytesIO(json.dumps({'posts': posts}).encode('utf-8'))
+
+
+def rejected(*args, **kwargs):
+    raise DatabaseOperationError("batch rejected")
+
+
+@pytest.fixture
+def db():
+    """Mock the database functions used by the import service"""
+    names = [
+        'insert_posts_bulk', 'insert_sentiments_bulk', 'insert_comments_bulk',
+        'insert_post', 'insert_sentiment', 'insert_comments',
+        'clear_all_data', 'refresh_daily_sentiment_summary',
+    ]
+    patchers = {name: patch(f'app.services.import_service.{name}') for name in names}
+    mocks = {name: patcher.start() for name, patcher in patchers.items()}
+    mocks['insert_posts_bulk'].return_value = [11, 12, 13]
+    yield mocks
+    for patcher in patchers.values():
+        patcher.stop()
+
+
+class TestImportParsedPosts:
+    """Test the bulk import and its per-row fallbacks"""
+
+    def test_bulk_import(self, db):
+        """Test posts, sentiments and comments each go in as one batch"""
+        result = process_import_file(upload(POSTS), 'json', clear_existing=False)
+
+        assert result == {'total': 4, 'inserted': 3, 'skipped': 1}
+        sentiments = db['insert_sentiments_bulk'].call_args[0][0]
+        assert [s['post_id'] for s in sentiments] == [11, 12]
+        comments = db['insert_comments_bulk'].call_args[0][0]
+        assert [(c['post_id'], c['content']) for c in comments] == [(11, 'Mantap!'), (13, 'Keren')]
+        db['insert_post'].assert_not_called()
+        db['insert_sentiment'].assert_not_called()
+        db['insert_comments'].assert_not_called()
+        db['refresh_daily_sentiment_summary'].assert_called_once()
+
+    def test_rejected_post_batch_retries_each_post(self, db):
+        """Test a rejected post batch imports post by post, skipping the bad one"""
+        db['insert_posts_bulk'].side_effect = rejected
+        ids = {'p1': 11, 'p3': 13}
+
+        def insert_post(**post):
+            if post['post_id'] not in ids:
+                raise DatabaseOperationError("bad row")
+            return ids[post['post_id']]
+
+        db['insert_post'].side_effect = insert_post
+
+        result = process_import_file(upload(POSTS), 'json', clear_existing=False)
+
+        assert result == {'total': 4, 'inserted': 2, 'skipped': 2}
+        assert [c.kwargs['post_id'] for c in db['insert_post'].call_args_list] == ['p1', 'p2', 'p3']
+        assert [c.kwargs['post_id'] for c in db['insert_sentiment'].call_args_list] == [11]
+        assert [c.args[0] for c in db['insert_comments'].call_args_list] == [11, 13]
+        db['insert_sentiments_bulk'].assert_not_called()
+        db['insert_comments_bulk'].assert_not_called()
+
+    def test_rejected_sentiment_batch_retries_each_sentiment(self, db):
+        """Test a rejected sentiment batch only loses the bad sentiment"""
+        db['insert_sentiments_bulk'].side_effect = rejected
+
+        def insert_sentiment(**sentiment):
+            if sentiment['post_id'] == 12:
+                raise DatabaseOperationError("numeric field overflow")
+
+        db['insert_sentiment'].side_effect = insert_sentiment
+
+        result = process_import_file(upload(POSTS), 'json', clear_existing=False)
+
+        assert result == {'total': 4, 'inserted': 3, 'skipped': 1}
+        assert [c.kwargs['post_id'] for c in db['insert_sentiment'].call_args_list] == [11, 12]
+        db['insert_comments_bulk'].assert_called_once()
+        db['insert_post'].assert_not_called()
+
+    def test_rejected_comment_batch_retries_per_post(self, db):
+        """Test a rejected comment batch only loses the comments of the bad post"""
+        db['insert_comments_bulk'].side_effect = rejected
+        db['insert_comments'].side_effect = [DatabaseOperationError("bad comment"), [2]]
+
+        result = process_import_file(upload(POSTS), 'json', clear_existing=False)
+
+        assert result == {'total': 4, 'inserted': 3, 'skipped': 1}
+        # p2 has no comments and is not retried
+        assert [c.args[0] for c in db['insert_comments'].call_args_list] == [11, 13]
+        db['insert_sentiment'].assert_not_called()
+
+    def test_clear_existing_without_valid_posts_skips_refresh(self, db):
+        """Test an import with nothing to insert leaves the refresh to clear_all_data"""
+        db['clear_all_data'].return_value = {'posts': 5, 'sentiments': 5, 'comments': 2}
+        db['insert_posts_bulk'].return_value = []
+
+        result = process_import_file(upload(POSTS[3:]), 'json', clear_existing=True)
+
+        assert result['inserted'] == 0
+        assert result['skipped'] == 1
+        assert result['cleared'] == {'posts': 5, 'sentiments': 5, 'comments': 2}
+        db['clear_all_data'].assert_called_once()
+        db['refresh_daily_sentiment_summary'].assert_not_called()
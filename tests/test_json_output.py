@@ -0,0 +1,94 @@
+"""
+Unit tests for the JSON output module.
+
+Tests that scrape results are written as UTF-8 JSON with and without
+orjson installed.
+"""
+
+import json
+import pytest
+from unittest.mock import patch
+
+from scraper.utils import json_output
+from scraper.utils.json_output import JsonLinesWriter, dumps_json, read_json, write_json
+
+
+RESULT = {
+    'platform': 'instagram',
+    'posts': [{'post_id': '1', 'content': 'Kopi pagi ☕ #senin', 'likes': 12}],
+}
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def encoder(request):
+    """Run a test with orjson when installed and with the json fallback."""
+    if request.param == 'json':
+        with patch.object(json_output, 'orjson', None):
+            yield request.param
+    else:
+        if json_output.orjson is None:
+            pytest.skip("orjson is not installed")
+        yield request.param
+
+
+class TestWriteJson:
+    """Test writing result files."""
+
+    def test_round_trip_keeps_text_unescaped(self, encoder, tmp_path):
+        """Test the file decodes to the same data with non-ASCII text as is."""
+        path = tmp_path / 'result.json'
+
+        write_json(path, RESULT)
+
+        raw = path.read_bytes()
+        assert json.loads(raw) == RESULT
+        assert 'Kopi pagi ☕'.encode('utf-8') in raw
+        assert b'\n  "posts"' in raw
+
+    def test_compact_output(self, encoder):
+        """Test indent=False writes the document on one line."""
+        assert b'\n' not in dumps_json(RESULT, indent=False)
+
+    def test_values_orjson_cannot_encode_fall_back(self, tmp_path):
+        """Test integers beyond 64 bits are still written."""
+        path = tmp_path / 'result.json'
+
+        write_json(path, {'id': 2 ** 70})
+
+        assert json.loads(path.read_bytes()) == {'id': 2 ** 70}
+
+    def test_compressed_round_trip(self, tmp_path):
+        """Test a .zst path is written compressed and read back."""
+        if json_output.zstandard is None:
+            pytest.skip("zstandard is not installed")
+        path = tmp_path / 'result.json.zst'
+        large = {'posts': RESULT['posts'] * 200}
+
+        write_json(path, large, indent=False)
+
+        raw = path.read_bytes()
+        assert raw.startswith(b'\x28\xb5\x2f\xfd')  # zstd frame magic
+        assert len(raw) < len(dumps_json(large, indent=False)) / 10
+        assert read_json(path) == large
+
+    def test_compressed_without_zstandard(self, tmp_path):
+        """Test .zst paths fail clearly when zstandard is missing."""
+        with patch.object(json_output, 'zstandard', None):
+            with pytest.raises(ImportError, match="zstandard"):
+                write_json(tmp_path / 'result.json.zst', RESULT)
+
+
+class TestJsonLinesWriter:
+    """Test writing posts one line at a time."""
+
+    def test_one_record_per_line(self, encoder, tmp_path):
+        """Test each record is a compact line of its own."""
+        path = tmp_path / 'posts.jsonl'
+
+        with JsonLinesWriter(path) as writer:
+            for post in RESULT['posts'] * 2:
+                writer.write(post)
+
+        lines = path.read_bytes().splitlines()
+        assert [json.loads(line) for line in lines] == RESULT['posts'] * 2
+        assert writer.records_written == 2
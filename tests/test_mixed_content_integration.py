@@ -419,6 +419,48 @@ class TestMixedContentScraping:
         
         print("✓ Comments array structure test passed")
 
+    def test_concurrent_scraping_keeps_post_order(self):
+        """
+        Test that posts scraped with several sessions come back in order,
+        that no session scrapes two posts at once and that failed posts
+        are left out.
+        """
+        import asyncio
+        import threading
+        import time
+        import scrape_instagram_simple
+
+        busy = set()
+        lock = threading.Lock()
+        overlaps = []
+
+        def fake_scrape_post(driver, post_id, post_url, post_type, *args):
+            with lock:
+                if driver in busy:
+                    overlaps.append(driver)
+                busy.add(driver)
+            time.sleep(0.01)
+            with lock:
+                busy.discard(driver)
+            return None if post_id == 'FAILED' else {'post_id': post_id, 'post_type': post_type}
+
+        post_urls = [
+            ('POST1', 'https://www.instagram.com/p/POST1/', 'post'),
+            ('REEL2', 'https://www.instagram.com/reel/REEL2/', 'reel'),
+            ('FAILED', 'https://www.instagram.com/p/FAILED/', 'post'),
+            ('POST4', 'https://www.instagram.com/p/POST4/', 'post'),
+            ('REEL5', 'https://www.instagram.com/reel/REEL5/', 'reel'),
+        ]
+
+        with patch.object(scrape_instagram_simple, 'scrape_post', side_effect=fake_scrape_post):
+            results = asyncio.run(scrape_instagram_simple.scrape_posts_concurrently(
+                ['driver1', 'driver2'], post_urls,
+                'https://www.instagram.com/testuser/', 'testuser'
+            ))
+
+        assert [r and r['post_id'] for r in results] == ['POST1', 'REEL2', None, 'POST4', 'REEL5']
+        assert overlaps == [], "A driver was used by two posts at once"
+
 
 if __name__ == '__main__':
     print("Running mixed content integration tests...\n")
@@ -432,5 +474,6 @@ if __name__ == '__main__':
     test_suite.test_edge_case_only_posts()
     test_suite.test_edge_case_only_reels()
     test_suite.test_comments_array_structure()
+    test_suite.test_concurrent_scraping_keeps_post_order()
     
     print("\n✅ All mixed content integration tests passed!")
@@ -8,6 +8,7 @@ enforces rate limits and handles various edge cases.
 import time
 import pytest
 import threading
+from unittest.mock import patch
 from scraper.utils.rate_limiter import RateLimiter
 
 
@@ -118,6 +119,18 @@ class TestRateLimiterBlocking:
         assert result is False
         assert elapsed < 0.1  # Should return almost immediately
     
+    def test_non_blocking_acquire_keeps_partial_tokens(self):
+        """Test non-blocking acquire consumes one whole token at a time."""
+        with patch('scraper.utils.rate_limiter.time.monotonic', return_value=100.0) as clock:
+            limiter = RateLimiter(requests_per_minute=60)
+            for _ in range(60):
+                assert limiter.acquire(blocking=False) is True
+            
+            clock.return_value = 101.5
+            assert limiter.acquire(blocking=False) is True
+            assert limiter.acquire(blocking=False) is False
+            assert limiter.get_available_tokens() == 0.5
+    
     def test_acquire_with_timeout_succeeds(self):
         """Test acquire with timeout succeeds when token becomes available."""
         limiter = RateLimiter(requests_per_minute=60)  # 1 token per second
@@ -206,6 +219,31 @@ class TestRateLimiterTokenRefill:
         assert tokens >= 0.8
         assert tokens <= 1.5
 
+    
+    def test_refill_ignores_wall_clock_changes(self):
+        """Test that tokens follow the monotonic clock, not the wall clock."""
+        with patch('scraper.utils.rate_limiter.time.monotonic', return_value=100.0) as clock:
+            limiter = RateLimiter(requests_per_minute=60)
+            for _ in range(60):
+                limiter.acquire()
+            
+            # Wall clock set back an hour: no effect on the bucket
+            with patch('scraper.utils.rate_limiter.time.time', return_value=0.0):
+                assert limiter.get_available_tokens() == 0.0
+            
+            clock.return_value = 102.5
+            assert limiter.get_available_tokens() == 2.5
+    
+    def test_acquire_with_tokens_never_sleeps(self):
+        """Test that acquiring available tokens returns without sleeping."""
+        limiter = RateLimiter(requests_per_minute=60)
+        
+        with patch('scraper.utils.rate_limiter.time.sleep') as mock_sleep:
+            for _ in range(60):
+                assert limiter.acquire() is True
+        
+        mock_sleep.assert_not_called()
+
 
 class TestRateLimiterReset:
     """Test rate limiter reset functionality."""
@@ -0,0 +1,88 @@
+"""
+Unit tests for the result cache module.
+
+Tests storing, expiring and keying cached scrape results.
+"""
+
+import os
+import shutil
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from scraper.utils.result_cache import ResultCache
+
+
+RESULT = {
+    'metadata': {'platform': 'instagram', 'target_url': 'https://example.com/a', 'total_posts': 1},
+    'posts': [{'post_id': '1', 'content': 'Kopi pagi ☕'}],
+}
+
+
+class TestResultCache:
+    """Test the on-disk result cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test a stored result is returned as it was stored."""
+        cache = ResultCache(tmp_path)
+        key = cache.key('instagram', 'https://example.com/a', 10)
+
+        assert cache.get(key) is None
+        cache.set(key, RESULT)
+
+        assert key in cache
+        assert cache.get(key) == RESULT
+        assert [p.name for p in tmp_path.iterdir()] == [f'{key}.json']
+
+    def test_expired_result_is_ignored(self, tmp_path):
+        """Test results older than the TTL count as missing."""
+        cache = ResultCache(tmp_path, ttl=60)
+        key = cache.key('instagram', 'https://example.com/a', 10)
+        cache.set(key, RESULT)
+
+        old = time.time() - 61
+        os.utime(tmp_path / f'{key}.json', (old, old))
+
+        assert key not in cache
+        assert cache.get(key) is None
+
+    def test_key_depends_on_every_part(self, tmp_path):
+        """Test platform, target and limit each change the key."""
+        cache = ResultCache(tmp_path)
+        keys = {
+            cache.key('instagram', 'https://example.com/a', 10),
+            cache.key('twitter', 'https://example.com/a', 10),
+            cache.key('instagram', 'https://example.com/b', 10),
+            cache.key('instagram', 'https://example.com/a', 20),
+        }
+        assert len(keys) == 4
+
+    def test_directory_created_once(self, tmp_path):
+        """Test the directory is created by the first store only."""
+        directory = tmp_path / 'cache'
+        cache = ResultCache(directory)
+
+        with patch.object(Path, 'mkdir', autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            cache.set(cache.key('instagram', 'https://example.com/a', 10), RESULT)
+            cache.set(cache.key('instagram', 'https://example.com/b', 10), RESULT)
+
+        assert mock_mkdir.call_count == 1
+        assert len(list(directory.iterdir())) == 2
+
+    def test_removed_directory_is_recreated(self, tmp_path):
+        """Test storing still works after the directory was deleted."""
+        directory = tmp_path / 'cache'
+        cache = ResultCache(directory)
+        cache.set(cache.key('instagram', 'https://example.com/a', 10), RESULT)
+
+        shutil.rmtree(directory)
+        key = cache.key('instagram', 'https://example.com/b', 10)
+        cache.set(key, RESULT)
+
+        assert cache.get(key) == RESULT
+
+    def test_invalid_ttl(self, tmp_path):
+        """Test a non-positive TTL is rejected."""
+        with pytest.raises(ValueError):
+            ResultCache(tmp_path, ttl=0)